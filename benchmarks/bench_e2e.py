@@ -0,0 +1,316 @@
+"""
+엔진별 종단 간(end-to-end) 지연 시간 벤치마크
+로컬 목 서버(benchmarks.mock_server)를 띄우고 requests / Playwright / Selenium 엔진으로
+콜드 스타트, 로그인, 새로고침, 파싱, 전체 조회 시간을 반복 측정해 p50/p95/p99 출력
+
+사용 예:
+    python -m benchmarks.bench_e2e --backends requests,playwright --iterations 30 --latency-ms 80
+    python -m benchmarks.bench_e2e --json results/e2e.json
+
+측정 단계:
+    cold_start  클라이언트(브라우저) 생성부터 로그인 완료까지
+    login       이미 띄운 클라이언트에서 세션을 지우고 다시 로그인
+    refresh     홈 페이지 요청/새로고침 (준비 대기 포함)
+    parse       받은 HTML을 attendance_html로 파싱
+    extract     페이지 안에서 오늘 시간만 추출 (Playwright)
+    e2e         파서의 get_attendance_status() 1회 (서비스가 요청마다 하는 일)
+"""
+import argparse
+import json
+import math
+import time
+import logging
+from typing import Callable, Dict, List
+
+import requests
+
+from benchmarks.mock_server import MockConfig, MockServer, build_arg_parser as build_mock_arg_parser
+from src.attendance_html import build_attendance_status, parse_attendance_html
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('requests', 'playwright', 'selenium')
+STAGES = ('cold_start', 'login', 'refresh', 'parse', 'extract', 'e2e')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class StageTimer:
+    """엔진/단계별 소요 시간(ms) 기록"""
+
+    def __init__(self, backend: str):
+        self.backend = backend
+        self.samples: Dict[str, List[float]] = {}
+        self.mismatches = 0
+        self.errors: List[str] = []
+
+    def measure(self, stage: str, fn: Callable, *args, **kwargs):
+        """fn 실행 시간을 stage에 기록하고 결과 반환"""
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.samples.setdefault(stage, []).append((time.perf_counter() - started) * 1000)
+        return result
+
+    def check(self, status: Dict[str, any], expected: Dict[str, any]):
+        """조회 결과가 목 서버 설정과 같은지 확인"""
+        keys = ('check_in_time', 'check_out_time', 'status')
+        if any(status.get(key) != expected[key] for key in keys):
+            self.mismatches += 1
+            if len(self.errors) < 5:
+                self.errors.append(f"예상 {[expected[k] for k in keys]}, 결과 {[status.get(k) for k in keys]}")
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for stage in STAGES:
+            values = self.samples.get(stage)
+            if not values:
+                continue
+            result[stage] = {
+                'n': len(values),
+                'mean_ms': round(sum(values) / len(values), 2),
+                'p50_ms': round(percentile(values, 50), 2),
+                'p95_ms': round(percentile(values, 95), 2),
+                'p99_ms': round(percentile(values, 99), 2),
+                'max_ms': round(max(values), 2)
+            }
+        return result
+
+
+def bench_requests(base_url: str, args, expected: Dict[str, any], timer: StageTimer):
+    """requests 엔진 (PamtekAuth + PamtekParser)"""
+    from src.auth import PamtekAuth
+    from src.parser import PamtekParser
+
+    def cold_start():
+        auth = PamtekAuth(args.user_id, args.password, base_url=base_url)
+        if not auth.login():
+            raise RuntimeError('로그인 실패')
+        return auth
+
+    for _ in range(args.cold_starts):
+        auth = timer.measure('cold_start', cold_start)
+
+    parser = PamtekParser(auth.session, base_url=base_url)
+    home_url = f"{base_url}/module/HR/home.do"
+    for i in range(args.warmup + args.iterations):
+        record = i >= args.warmup
+        measure = timer.measure if record else (lambda stage, fn, *a, **kw: fn(*a, **kw))
+
+        response = measure('refresh', auth.session.get, home_url, timeout=10)
+        measure('parse', parse_attendance_html, response.text)
+        status = measure('e2e', parser.get_attendance_status)
+        if record:
+            timer.check(status, expected)
+
+    for _ in range(args.logins):
+        auth.session.cookies.clear()
+        if not timer.measure('login', auth.login):
+            raise RuntimeError('재로그인 실패')
+
+
+def bench_playwright(base_url: str, args, expected: Dict[str, any], timer: StageTimer):
+    """Playwright 엔진 (PamtekAuthPlaywright + PamtekParserPlaywright)"""
+    from src.auth_playwright import PamtekAuthPlaywright
+    from src.parser_playwright import PamtekParserPlaywright
+    from src.resource_blocker import ResourceBlocker
+
+    def cold_start():
+        auth = PamtekAuthPlaywright(
+            args.user_id, args.password, headless=True, base_url=base_url,
+            resource_blocker=ResourceBlocker(base_url) if args.block_resources else None,
+            ready_strategy=args.ready_strategy,
+            ready_response_url=args.ready_response_url
+        )
+        if not auth.login():
+            auth.close()
+            raise RuntimeError('로그인 실패')
+        return auth
+
+    for i in range(args.cold_starts):
+        auth = timer.measure('cold_start', cold_start)
+        if i < args.cold_starts - 1:
+            auth.close()
+
+    try:
+        parser = PamtekParserPlaywright(auth)
+        for i in range(args.warmup + args.iterations):
+            record = i >= args.warmup
+            measure = timer.measure if record else (lambda stage, fn, *a, **kw: fn(*a, **kw))
+
+            if not measure('refresh', auth.navigate_to_home):
+                raise RuntimeError('홈 페이지 새로고침 실패')
+            measure('extract', auth.extract_active_day_times)
+            measure('parse', lambda: parse_attendance_html(auth.get_page_source()))
+            status = measure('e2e', parser.get_attendance_status)
+            if record:
+                timer.check(status, expected)
+
+        for _ in range(args.logins):
+            if not timer.measure('login', auth.relogin):
+                raise RuntimeError('재로그인 실패')
+    finally:
+        auth.close()
+
+
+def bench_selenium(base_url: str, args, expected: Dict[str, any], timer: StageTimer):
+    """Selenium 엔진 (PamtekAuthSelenium + PamtekParserSelenium)"""
+    from src.auth_selenium import PamtekAuthSelenium
+    from src.parser_selenium import PamtekParserSelenium
+
+    def cold_start():
+        auth = PamtekAuthSelenium(args.user_id, args.password, headless=True, base_url=base_url)
+        if not auth.login():
+            auth.close()
+            raise RuntimeError('로그인 실패')
+        return auth
+
+    for i in range(args.cold_starts):
+        auth = timer.measure('cold_start', cold_start)
+        if i < args.cold_starts - 1:
+            auth.close()
+
+    try:
+        parser = PamtekParserSelenium(auth)
+        for i in range(args.warmup + args.iterations):
+            record = i >= args.warmup
+            measure = timer.measure if record else (lambda stage, fn, *a, **kw: fn(*a, **kw))
+
+            if not measure('refresh', auth.navigate_to_home):
+                raise RuntimeError('홈 페이지 새로고침 실패')
+            measure('parse', lambda: parse_attendance_html(auth.get_page_source()))
+            status = measure('e2e', parser.get_attendance_status)
+            if record:
+                timer.check(status, expected)
+
+        def relogin():
+            auth.driver.delete_all_cookies()
+            return auth.login()
+
+        for _ in range(args.logins):
+            if not timer.measure('login', relogin):
+                raise RuntimeError('재로그인 실패')
+    finally:
+        auth.close()
+
+
+BENCHES = {
+    'requests': bench_requests,
+    'playwright': bench_playwright,
+    'selenium': bench_selenium
+}
+
+
+def print_report(results: Dict[str, Dict[str, any]]):
+    """엔진/단계별 결과 표 출력"""
+    header = f"{'engine':<11} {'stage':<11} {'n':>4} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    print(header)
+    print('-' * len(header))
+    for backend, result in results.items():
+        if result.get('skipped'):
+            print(f"{backend:<11} 건너뜀: {result['skipped']}")
+            continue
+        for stage, stats in result['stages'].items():
+            print(
+                f"{backend:<11} {stage:<11} {stats['n']:>4} {stats['mean_ms']:>9.1f} "
+                f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}"
+            )
+        if result['mismatches']:
+            print(f"{backend:<11} 결과 불일치 {result['mismatches']}건: {result['errors']}")
+    print('(단위: ms)')
+
+
+def run(args) -> Dict[str, any]:
+    """벤치마크 실행 (base_url이 없으면 목 서버를 직접 띄움)"""
+    server = None
+    if args.base_url:
+        base_url = args.base_url.rstrip('/')
+        mock_state = requests.get(f"{base_url}/__mock/state", timeout=10).json()
+    else:
+        config = MockConfig(
+            user_id=args.user_id,
+            password=args.password,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            session_ttl=args.session_ttl,
+            error_rate=args.error_rate,
+            check_in=args.check_in,
+            check_out=args.check_out,
+            asset_latency_ms=args.asset_latency_ms,
+            padding_kb=args.padding_kb
+        )
+        server = MockServer(config)
+        server.start()
+        base_url = server.base_url
+        mock_state = config.to_dict()
+
+    expected = build_attendance_status(mock_state['check_in'], mock_state['check_out'])
+    results: Dict[str, any] = {}
+    try:
+        for backend in args.backends:
+            timer = StageTimer(backend)
+            try:
+                BENCHES[backend](base_url, args, expected, timer)
+            except ImportError as e:
+                results[backend] = {'skipped': f'모듈 없음 ({e.name})'}
+                continue
+            except Exception as e:
+                logger.error(f"{backend} 벤치마크 실패: {e}")
+                results[backend] = {'skipped': str(e)}
+                continue
+            results[backend] = {
+                'stages': timer.summary(),
+                'mismatches': timer.mismatches,
+                'errors': timer.errors
+            }
+    finally:
+        if server:
+            server.stop()
+
+    return {
+        'mock': mock_state,
+        'iterations': args.iterations,
+        'results': results
+    }
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    # 목 서버 옵션(--latency-ms 등)을 그대로 받음
+    parser = build_mock_arg_parser()
+    parser.description = 'Pamtek 엔진별 종단 간 지연 시간 벤치마크'
+    parser.add_argument('--base-url', help='이미 실행 중인 목 서버 주소 (지정하면 직접 띄우지 않음)')
+    parser.add_argument('--backends', default='requests,playwright,selenium',
+                        type=lambda value: [b.strip() for b in value.split(',') if b.strip() in BACKENDS],
+                        help=f"측정할 엔진 (쉼표 구분, {', '.join(BACKENDS)})")
+    parser.add_argument('--iterations', type=int, default=20, help='새로고침/파싱/조회 반복 횟수')
+    parser.add_argument('--warmup', type=int, default=2, help='기록하지 않는 예열 반복 횟수')
+    parser.add_argument('--cold-starts', type=int, default=3, help='콜드 스타트 측정 횟수')
+    parser.add_argument('--logins', type=int, default=5, help='재로그인 측정 횟수')
+    parser.add_argument('--block-resources', action='store_true', help='Playwright 리소스 차단 적용')
+    parser.add_argument('--ready-strategy', default='networkidle',
+                        choices=('networkidle', 'selector', 'response'), help='Playwright 준비 판단 방식')
+    parser.add_argument('--ready-response-url', default='*/module/HR/weekAttendance.do',
+                        help='response 방식에서 기다릴 응답 URL 패턴 (기본값: 목 서버의 주간 근태 API)')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--verbose', action='store_true', help='엔진 로그 출력')
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_arg_parser().parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.ERROR,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    report = run(args)
+    print_report(report['results'])
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json_path}")
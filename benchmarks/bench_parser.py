@@ -0,0 +1,185 @@
+"""
+출근 현황 HTML 파서 마이크로벤치마크
+benchmarks/fixtures/의 대시보드 스냅샷을 백엔드(lxml / selectolax / html.parser)와
+파싱 방식(prescan: 오늘 날짜 조각만, full: 전체 HTML)별로 파싱해
+소요 시간, 최대 메모리 할당, 파싱 트리 크기를 측정
+
+사용 예:
+    python -m benchmarks.bench_parser --repeat 200 --json parser.json
+    python -m benchmarks.bench_parser --baseline parser.json   # 이전 결과와 비교
+
+측정 항목:
+    p50_us / p95_us  parse_attendance_html() 1회 소요 시간 (마이크로초)
+    peak_kb          tracemalloc 기준 최대 할당 (Python 힙만, lxml/selectolax의 C 할당은 제외)
+    nodes            파싱한 HTML(조각 또는 전체)의 요소 수
+"""
+import argparse
+import json
+import os
+import platform
+import time
+import tracemalloc
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.bench_e2e import percentile
+from benchmarks.make_fixtures import EXPECTED_FILE, FIXTURES_DIR
+from src import attendance_html
+from src.attendance_html import available_backends, extract_actual_times, parse_attendance_html, slice_active_day
+
+logger = logging.getLogger(__name__)
+
+MODES = ('prescan', 'full')
+
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> Dict[str, Dict[str, any]]:
+    """픽스처 HTML과 기대 결과 로드"""
+    with open(os.path.join(directory, EXPECTED_FILE), encoding='utf-8') as f:
+        expected = json.load(f)
+
+    fixtures = {}
+    for name, result in expected.items():
+        with open(os.path.join(directory, f'{name}.html'), encoding='utf-8') as f:
+            fixtures[name] = {'html': f.read(), 'expected': result}
+    return fixtures
+
+
+def count_nodes(html: str, backend: str) -> int:
+    """백엔드로 파싱한 트리의 요소 수"""
+    if backend == attendance_html.BACKEND_LXML:
+        root = attendance_html.etree.fromstring(html, parser=attendance_html._LXML_PARSER)
+        return 0 if root is None else sum(1 for _ in root.iter())
+    if backend == attendance_html.BACKEND_SELECTOLAX:
+        return len(attendance_html.SelectolaxParser(html).css('*'))
+    return len(attendance_html.BeautifulSoup(html, 'html.parser').find_all(True))
+
+
+def parse_once(html: str, backend: str, mode: str) -> Dict[str, any]:
+    if mode == 'prescan':
+        return parse_attendance_html(html, backend)
+    check_in_time, check_out_time = extract_actual_times(html, backend, prescan=False)
+    return attendance_html.build_attendance_status(check_in_time, check_out_time)
+
+
+def bench_case(html: str, backend: str, mode: str, repeat: int) -> Dict[str, any]:
+    """백엔드/방식 하나로 픽스처 하나 측정"""
+    # 예열 (XPath/정규식 캐시 등)
+    status = parse_once(html, backend, mode)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse_once(html, backend, mode)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+
+    tracemalloc.start()
+    try:
+        parse_once(html, backend, mode)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    parsed = html
+    if mode == 'prescan':
+        parsed = slice_active_day(html) or html
+
+    return {
+        'status': status,
+        'mean_us': round(sum(samples) / len(samples), 1),
+        'p50_us': round(percentile(samples, 50), 1),
+        'p95_us': round(percentile(samples, 95), 1),
+        'peak_kb': round(peak / 1024, 1),
+        'nodes': count_nodes(parsed, backend),
+        'input_kb': round(len(parsed.encode('utf-8')) / 1024, 1)
+    }
+
+
+def run(backends: List[str], modes: List[str], repeat: int,
+        directory: str = FIXTURES_DIR) -> Dict[str, any]:
+    """모든 픽스처 × 백엔드 × 방식 측정"""
+    fixtures = load_fixtures(directory)
+    results = []
+    for name, fixture in fixtures.items():
+        expected = fixture['expected']
+        for backend in backends:
+            for mode in modes:
+                case = bench_case(fixture['html'], backend, mode, repeat)
+                status = case.pop('status')
+                case.update({
+                    'fixture': name,
+                    'backend': backend,
+                    'mode': mode,
+                    'correct': all(status[key] == expected[key]
+                                   for key in ('check_in_time', 'check_out_time', 'status'))
+                })
+                results.append(case)
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def _case_key(case: Dict[str, any]) -> tuple:
+    return case['fixture'], case['backend'], case['mode']
+
+
+def print_report(report: Dict[str, any], baseline: Optional[Dict[str, any]] = None):
+    """결과 표 출력 (baseline이 있으면 p50 변화율 표시)"""
+    previous = {_case_key(case): case for case in (baseline or {}).get('results', [])}
+
+    header = (f"{'fixture':<15} {'backend':<12} {'mode':<8} {'p50_us':>9} {'p95_us':>9} "
+              f"{'peak_kb':>8} {'nodes':>6} {'input_kb':>8}  ok")
+    if previous:
+        header += '  vs baseline'
+    print(header)
+    print('-' * len(header))
+    for case in report['results']:
+        line = (
+            f"{case['fixture']:<15} {case['backend']:<12} {case['mode']:<8} {case['p50_us']:>9.1f} "
+            f"{case['p95_us']:>9.1f} {case['peak_kb']:>8.1f} {case['nodes']:>6} {case['input_kb']:>8.1f}  "
+            f"{'ok' if case['correct'] else 'FAIL'}"
+        )
+        old = previous.get(_case_key(case))
+        if old and old['p50_us']:
+            line += f"  {(case['p50_us'] / old['p50_us'] - 1) * 100:+.0f}%"
+        print(line)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='출근 현황 HTML 파서 마이크로벤치마크')
+    parser.add_argument('--backends', default=','.join(available_backends()),
+                        help=f"측정할 백엔드 (쉼표 구분, 기본값: 설치된 전체 {', '.join(available_backends())})")
+    parser.add_argument('--modes', default=','.join(MODES), help='파싱 방식 (prescan, full)')
+    parser.add_argument('--repeat', type=int, default=200, help='케이스당 반복 횟수')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='픽스처 디렉터리')
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    return parser
+
+
+if __name__ == '__main__':
+    args = build_arg_parser().parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    backends = [b for b in args.backends.split(',') if b in available_backends()]
+    modes = [m for m in args.modes.split(',') if m in MODES]
+    report = run(backends, modes, args.repeat, args.fixtures)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json_path}")
+
+    if not all(case['correct'] for case in report['results']):
+        raise SystemExit('기대 결과와 다른 케이스가 있음')
@@ -0,0 +1,90 @@
+"""
+대시보드 HTML 픽스처 생성
+목 서버의 render_dashboard로 날짜를 고정한 스냅샷을 benchmarks/fixtures/에 저장하고
+각 픽스처의 기대 결과를 expected.json에 기록
+
+사용 예:
+    python -m benchmarks.make_fixtures
+"""
+import json
+import os
+from datetime import date
+
+from benchmarks.mock_server import LOGIN_PAGE, render_dashboard
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+EXPECTED_FILE = 'expected.json'
+
+# 스냅샷 날짜 고정 (수요일 - 앞뒤로 지난 날짜와 이후 날짜가 모두 있음)
+FIXTURE_DATE = date(2025, 11, 19)
+
+# 이름: (설명, HTML 생성 함수, 기대 결과)
+FIXTURES = {
+    'checked_in': (
+        '출근만 찍힘 (퇴근 00:00)',
+        lambda: render_dashboard('08:45', '00:00', FIXTURE_DATE),
+        {'check_in_time': '08:45', 'check_out_time': None, 'status': 'not_checked_out'}
+    ),
+    'checked_out': (
+        '출근/퇴근 모두 찍힘',
+        lambda: render_dashboard('08:45', '18:10', FIXTURE_DATE),
+        {'check_in_time': '08:45', 'check_out_time': '18:10', 'status': 'completed'}
+    ),
+    'not_checked_in': (
+        '미출근 (00:00~00:00)',
+        lambda: render_dashboard('00:00', '00:00', FIXTURE_DATE),
+        {'check_in_time': None, 'check_out_time': None, 'status': 'not_checked_in'}
+    ),
+    'dash': (
+        "시간 대신 '-' 표시",
+        lambda: render_dashboard('-', '-', FIXTURE_DATE),
+        {'check_in_time': None, 'check_out_time': None, 'status': 'not_checked_in'}
+    ),
+    'no_active_day': (
+        '오늘(active) 날짜 없음',
+        lambda: render_dashboard('08:45', '18:10', FIXTURE_DATE, active=False),
+        {'check_in_time': None, 'check_out_time': None, 'status': 'not_checked_in'}
+    ),
+    'comment_in_day': (
+        "오늘 날짜 div 안 주석에 '</div>' (출근/퇴근 모두 찍힘)",
+        lambda: render_dashboard('08:40', '18:00', FIXTURE_DATE, active_extra='<!-- </div> -->'),
+        {'check_in_time': '08:40', 'check_out_time': '18:00', 'status': 'completed'}
+    ),
+    'script_in_day': (
+        "오늘 날짜 div 안 스크립트 문자열에 '</div>' (출근/퇴근 모두 찍힘)",
+        lambda: render_dashboard(
+            '08:40', '18:00', FIXTURE_DATE,
+            active_extra='<script>var closeTag = "</div>";</script>'
+        ),
+        {'check_in_time': '08:40', 'check_out_time': '18:00', 'status': 'completed'}
+    ),
+    'login_page': (
+        '세션 만료로 받은 로그인 페이지',
+        lambda: LOGIN_PAGE,
+        {'check_in_time': None, 'check_out_time': None, 'status': 'not_checked_in'}
+    ),
+    'large_page': (
+        '위젯이 많은 큰 페이지 (약 300KB, 출근/퇴근 모두 찍힘)',
+        lambda: render_dashboard('08:45', '18:10', FIXTURE_DATE, padding_kb=300),
+        {'check_in_time': '08:45', 'check_out_time': '18:10', 'status': 'completed'}
+    ),
+}
+
+
+def generate_fixtures(directory: str = FIXTURES_DIR):
+    """픽스처 HTML과 expected.json 생성 (기존 파일 덮어씀)"""
+    os.makedirs(directory, exist_ok=True)
+    expected = {}
+    for name, (description, render, result) in FIXTURES.items():
+        with open(os.path.join(directory, f'{name}.html'), 'w', encoding='utf-8') as f:
+            f.write(render())
+        expected[name] = dict(result, description=description)
+
+    with open(os.path.join(directory, EXPECTED_FILE), 'w', encoding='utf-8') as f:
+        json.dump(expected, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    generate_fixtures()
+    print(f"픽스처 {len(FIXTURES)}개 생성: {FIXTURES_DIR}")
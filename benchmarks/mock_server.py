@@ -0,0 +1,380 @@
+"""
+로컬 Pamtek HR 목 서버
+실제 hr.pamtek.com 대신 로그인 페이지, JSON 로그인(/login.do), 홈 대시보드(/module/HR/home.do)를 제공해
+requests / Playwright / Selenium 엔진의 지연 시간을 측정
+
+지연(latency), 세션 유휴 만료, 오류 주입을 설정할 수 있음
+
+사용 예:
+    python -m benchmarks.mock_server --port 8080 --latency-ms 80 --session-ttl 600
+
+    PAMTEK_BASE_URL=http://127.0.0.1:8080 PAMTEK_USER_ID=tester PAMTEK_PASSWORD=secret \\
+        python main_playwright.py
+"""
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+import logging
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+from flask import Flask, Response, jsonify, redirect, request
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = 'JSESSIONID'
+
+# 목 서버 제어용 경로 (지연/오류 주입 대상에서 제외)
+CONTROL_PREFIX = '/__mock'
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>Pamtek HR</title>
+<link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+<img src="/static/logo.png" alt="logo">
+<form id="loginForm" onsubmit="return false;">
+  <input type="text" id="userID" name="userID">
+  <input type="password" id="password" name="password">
+  <button type="button" id="btnLogin">로그인</button>
+  <p id="loginMessage"></p>
+</form>
+<script>
+document.getElementById('btnLogin').addEventListener('click', async () => {
+  const response = await fetch('/login.do', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json; charset=UTF-8', 'X-Requested-With': 'XMLHttpRequest'},
+    body: JSON.stringify({
+      userId: document.getElementById('userID').value,
+      password: document.getElementById('password').value
+    })
+  });
+  const result = await response.json();
+  if (!result.isError && result.data && result.data.step) {
+    location.href = '/module/HR/home.do';
+  } else {
+    document.getElementById('loginMessage').textContent = (result.data && result.data.errorMessage) || 'error';
+  }
+});
+</script>
+</body>
+</html>
+"""
+
+DAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+
+class MockConfig:
+    """목 서버 설정 (실행 중 /__mock/state로 변경 가능)"""
+
+    def __init__(self, user_id: str = 'tester', password: str = 'secret',
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 session_ttl: float = 1800.0, error_rate: float = 0.0,
+                 check_in: str = '08:45', check_out: str = '00:00',
+                 asset_latency_ms: float = 0.0, padding_kb: int = 0):
+        self.user_id = user_id
+        self.password = password
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.session_ttl = session_ttl
+        self.error_rate = error_rate
+        self.check_in = check_in
+        self.check_out = check_out
+        self.asset_latency_ms = asset_latency_ms
+        self.padding_kb = padding_kb
+
+    def to_dict(self) -> Dict[str, any]:
+        return {key: value for key, value in vars(self).items() if key != 'password'}
+
+
+def week_records(today: date, check_in: str, check_out: str) -> list:
+    """
+    이번 주(월~일) 날짜별 실적 시간
+
+    Returns:
+        list: [{'date': date, 'check_in': 'HH:MM', 'check_out': 'HH:MM'}, ...]
+              (오늘은 check_in/check_out, 지난 평일은 예시 시간, 이후/주말은 00:00)
+    """
+    monday = today - timedelta(days=today.weekday())
+    records = []
+    for offset in range(7):
+        day = monday + timedelta(days=offset)
+        if day == today:
+            times = (check_in, check_out)
+        elif day < today and day.weekday() < 5:
+            times = ('08:5%d' % offset, '18:0%d' % offset)
+        else:
+            times = ('00:00', '00:00')
+        records.append({'date': day, 'check_in': times[0], 'check_out': times[1]})
+    return records
+
+
+def render_dashboard(check_in: str, check_out: str, today: Optional[date] = None,
+                     padding_kb: int = 0, active: bool = True, active_extra: str = '') -> str:
+    """
+    홈 대시보드 HTML 생성 (item-day / time-wrap 구조)
+
+    Args:
+        check_in: 오늘 실적 출근 시간 ('00:00', '-' 포함)
+        check_out: 오늘 실적 퇴근 시간
+        today: 기준 날짜 (기본값: 오늘)
+        padding_kb: 출근 정보와 무관한 위젯을 대략 이 크기(KB)만큼 추가 (큰 페이지 재현)
+        active: False면 오늘 날짜에 active 클래스를 붙이지 않음
+        active_extra: 오늘 날짜 div 맨 앞에 넣을 HTML (주석/스크립트 등 사전 스캔 검증용)
+
+    Returns:
+        str: HTML
+    """
+    today = today or date.today()
+    days = []
+    for record in week_records(today, check_in, check_out):
+        day = record['date']
+        css = 'item-day active' if active and day == today else 'item-day'
+        extra = active_extra if day == today else ''
+        days.append(
+            f'<div class="{css}">{extra}'
+            f'<div class="date"><span class="day">{DAY_NAMES[day.weekday()]}</span>'
+            f'<span class="num">{day.day}</span></div>'
+            f'<div class="time-wrap">'
+            f'<div class="time"><span class="tit">계획</span><span class="txt">09:00~18:00</span></div>'
+            f'<div class="time"><span class="tit">실적</span>'
+            f'<span class="txt">{record["check_in"]}~{record["check_out"]}</span></div>'
+            f'</div></div>'
+        )
+
+    widgets = []
+    size = 0
+    index = 0
+    while size < padding_kb * 1024:
+        widget = (
+            f'<div class="item-dash widget-{index}"><h3 class="title">공지사항 {index}</h3>'
+            f'<ul class="list">' +
+            ''.join(f'<li class="row"><a href="/notice/{index}/{n}">게시글 {index}-{n}</a>'
+                    f'<span class="date">2025-01-{n + 1:02d}</span></li>' for n in range(10)) +
+            '</ul></div>'
+        )
+        widgets.append(widget)
+        size += len(widget.encode('utf-8'))
+        index += 1
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>Pamtek HR - 홈</title>
+<link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+<div class="dash-layout">
+<img src="/static/logo.png" alt="logo">
+<div class="item-dash week">
+<div class="week-wrap">{''.join(days)}</div>
+</div>
+{''.join(widgets)}
+</div>
+<script>
+fetch('/module/HR/weekAttendance.do', {{headers: {{'X-Requested-With': 'XMLHttpRequest'}}}})
+  .then(response => response.json())
+  .then(result => {{ window.weekAttendance = result; }});
+</script>
+</body>
+</html>
+"""
+
+
+def create_app(config: MockConfig) -> Flask:
+    """목 서버 Flask 앱 생성"""
+    app = Flask(__name__)
+    sessions: Dict[str, float] = {}
+    lock = threading.Lock()
+    counters: Dict[str, int] = {}
+
+    def count(name: str):
+        with lock:
+            counters[name] = counters.get(name, 0) + 1
+
+    def session_valid() -> bool:
+        """세션 쿠키 확인 (유휴 만료 적용, 유효하면 마지막 사용 시각 갱신)"""
+        token = request.cookies.get(SESSION_COOKIE)
+        now = time.monotonic()
+        with lock:
+            last_seen = sessions.get(token)
+            if last_seen is None:
+                return False
+            if now - last_seen > config.session_ttl:
+                del sessions[token]
+                counters['expired'] = counters.get('expired', 0) + 1
+                return False
+            sessions[token] = now
+            return True
+
+    @app.before_request
+    def inject():
+        if request.path.startswith(CONTROL_PREFIX):
+            return None
+
+        count(request.path)
+        if request.path.startswith('/static/'):
+            delay_ms = config.asset_latency_ms
+        else:
+            delay_ms = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if (request.path.endswith('.do') and config.error_rate > 0
+                and random.random() < config.error_rate):
+            count('injected_errors')
+            return Response('Internal Server Error', status=500)
+        return None
+
+    @app.route('/')
+    def login_page():
+        return Response(LOGIN_PAGE, mimetype='text/html')
+
+    @app.route('/login.do', methods=['POST'])
+    def login():
+        try:
+            data = json.loads(request.get_data(as_text=True) or '{}')
+        except ValueError:
+            data = {}
+
+        if data.get('userId') != config.user_id or data.get('password') != config.password:
+            count('login_failures')
+            return jsonify({'isError': False, 'data': {'errorMessage': '아이디 또는 비밀번호가 일치하지 않습니다.'}})
+
+        token = secrets.token_hex(16)
+        with lock:
+            sessions[token] = time.monotonic()
+        response = jsonify({'isError': False, 'data': {'step': 'complete'}})
+        response.set_cookie(SESSION_COOKIE, token, httponly=True, path='/')
+        return response
+
+    @app.route('/module/HR/home.do')
+    def home():
+        if not session_valid():
+            return redirect('/')
+        html = render_dashboard(config.check_in, config.check_out, padding_kb=config.padding_kb)
+        return Response(html, mimetype='text/html')
+
+    @app.route('/module/HR/weekAttendance.do')
+    def week_attendance():
+        if not session_valid():
+            return redirect('/')
+        records = week_records(date.today(), config.check_in, config.check_out)
+        return jsonify({'isError': False, 'data': {'list': [
+            {'workDate': r['date'].isoformat(), 'inTime': r['check_in'], 'outTime': r['check_out']}
+            for r in records
+        ]}})
+
+    @app.route('/static/<path:name>')
+    def static_asset(name):
+        # 리소스 차단 효과를 볼 수 있도록 적당한 크기의 더미 응답
+        mimetypes = {'css': 'text/css', 'png': 'image/png', 'woff2': 'font/woff2'}
+        mimetype = mimetypes.get(name.rsplit('.', 1)[-1], 'application/octet-stream')
+        return Response(b'\0' * 64 * 1024, mimetype=mimetype)
+
+    @app.route(f'{CONTROL_PREFIX}/state', methods=['GET', 'POST'])
+    def state():
+        """설정 조회/변경 (expire_sessions: true면 모든 세션 만료)"""
+        if request.method == 'POST':
+            changes = request.get_json(force=True) or {}
+            for key, value in changes.items():
+                if key != 'expire_sessions' and hasattr(config, key):
+                    setattr(config, key, value)
+            if changes.get('expire_sessions'):
+                with lock:
+                    sessions.clear()
+        return jsonify(config.to_dict())
+
+    @app.route(f'{CONTROL_PREFIX}/stats')
+    def stats():
+        with lock:
+            return jsonify({'sessions': len(sessions), 'requests': dict(counters)})
+
+    return app
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    """요청마다 출력되는 접근 로그 생략 (벤치마크 출력 정리)"""
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class MockServer:
+    """
+    백그라운드 스레드에서 실행하는 목 서버 (벤치마크용)
+
+    사용 예:
+        with MockServer(MockConfig(latency_ms=50)) as server:
+            auth = PamtekAuth('tester', 'secret', base_url=server.base_url)
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or MockConfig()
+        self._server = make_server(host, port, create_app(self.config), threaded=True,
+                                   request_handler=_QuietRequestHandler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name='MockPamtek', daemon=True)
+        self.base_url = f'http://{host}:{self._server.server_port}'
+
+    def __enter__(self) -> 'MockServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+        logger.info(f"목 서버 시작: {self.base_url}")
+
+    def stop(self):
+        self._server.shutdown()
+        self._thread.join(timeout=5)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description='로컬 Pamtek HR 목 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--user-id', default='tester')
+    parser.add_argument('--password', default='secret')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='요청당 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='지연 무작위 추가분 최대값 (ms)')
+    parser.add_argument('--asset-latency-ms', type=float, default=0.0, help='정적 리소스 지연 (ms)')
+    parser.add_argument('--session-ttl', type=float, default=1800.0, help='세션 유휴 만료 시간 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='.do 요청의 500 오류 비율 (0~1)')
+    parser.add_argument('--check-in', default='08:45', help="오늘 실적 출근 시간 ('00:00'이면 미출근)")
+    parser.add_argument('--check-out', default='00:00', help="오늘 실적 퇴근 시간 ('00:00'이면 미퇴근)")
+    parser.add_argument('--padding-kb', type=int, default=0, help='대시보드에 추가할 위젯 크기 (KB)')
+    return parser
+
+
+def config_from_args(args) -> MockConfig:
+    return MockConfig(
+        user_id=args.user_id,
+        password=args.password,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        session_ttl=args.session_ttl,
+        error_rate=args.error_rate,
+        check_in=args.check_in,
+        check_out=args.check_out,
+        asset_latency_ms=args.asset_latency_ms,
+        padding_kb=args.padding_kb
+    )
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = build_arg_parser().parse_args()
+    config = config_from_args(args)
+    print(f"목 서버: http://{args.host}:{args.port} (계정 {config.user_id} / {config.password})")
+    create_app(config).run(host=args.host, port=args.port, threaded=True)
@@ -3,13 +3,30 @@ Playwright 기반 Pamtek HR API 서버
 """
 import os
 import sys
+import hmac
 import io
+import time
 import logging
 from datetime import datetime
 from dotenv import load_dotenv
-from flask import Flask, jsonify
+from flask import Flask, Response, g, jsonify, request
 from src.auth_playwright import PamtekAuthPlaywright
 from src.parser_playwright import PamtekParserPlaywright
+from src.parser_hybrid import PamtekParserHybrid
+from src.session_probe import SessionLiveness
+from src.resource_blocker import ResourceBlocker
+from src.dashboard_json import DashboardJsonCapture
+from src.status_cache import StatusCache, StatusTimeoutError
+from src.poller import AttendancePoller
+from src.schedule import PollingPlanner, is_weekend, load_settings
+from src.keepalive import SessionKeepAlive
+from src.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src import metrics
+from src.metrics import CACHE_REQUESTS, LOGINS, RELOGINS, REQUEST_SECONDS, UPSTREAM_ERRORS, Timings, span
+from src.profiler import HotPathProfiler
+from src.browser_worker import (
+    BrowserWorker, WorkerBusyError, JOB_REFRESH, JOB_RELOGIN, JOB_KEEPALIVE
+)
 
 # 인코딩 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -28,6 +45,7 @@ app = Flask(__name__)
 # 전역 변수
 auth = None
 parser = None
+liveness = None
 
 # 환경 변수 로드
 load_dotenv()
@@ -35,30 +53,232 @@ load_dotenv()
 USER_ID = os.getenv('PAMTEK_USER_ID')
 PASSWORD = os.getenv('PAMTEK_PASSWORD')
 
+# HR 서버 주소 (로컬 목 서버로 벤치마크할 때 변경)
+BASE_URL = os.getenv('PAMTEK_BASE_URL', 'https://hr.pamtek.com')
+
+# 로그인 세션 저장 파일 (빈 값이면 저장하지 않음)
+STORAGE_STATE_PATH = os.getenv('PAMTEK_STORAGE_STATE', 'data/storage_state.json') or None
+
+# 조회 엔진 (browser: 브라우저 새로고침, hybrid: 로그인만 브라우저 + HTTP 조회)
+ENGINE = os.getenv('PAMTEK_ENGINE', 'browser').lower()
+
+# 출근 시간 추출 방식 (script: 페이지 안에서 오늘 날짜만 추출, soup: HTML 전체 파싱)
+EXTRACT_MODE = os.getenv('PAMTEK_EXTRACT_MODE', 'script').lower()
+
+# 리소스 차단 (새로고침 시 이미지/폰트/스타일시트 요청 생략, 설정하면 외부 스크립트도)
+BLOCK_RESOURCES = os.getenv('PAMTEK_BLOCK_RESOURCES', 'true').lower() == 'true'
+BLOCK_TYPES = os.getenv('PAMTEK_BLOCK_TYPES')
+# 외부 스크립트 차단은 로그인 페이지(클라이언트 암호화)가 CDN 스크립트를 쓰면 로그인이 깨지므로 기본 꺼짐
+BLOCK_THIRD_PARTY = os.getenv('PAMTEK_BLOCK_THIRD_PARTY', 'false').lower() == 'true'
+BLOCK_ALLOW = os.getenv('PAMTEK_BLOCK_ALLOW')
+BLOCK_DENY = os.getenv('PAMTEK_BLOCK_DENY')
+
+# 대시보드 JSON API 조회 (URL 패턴과 키 이름을 모두 설정해야 사용)
+DASHBOARD_API = os.getenv('PAMTEK_DASHBOARD_API')
+DASHBOARD_DATE_KEY = os.getenv('PAMTEK_DASHBOARD_DATE_KEY')
+DASHBOARD_IN_KEY = os.getenv('PAMTEK_DASHBOARD_IN_KEY')
+DASHBOARD_OUT_KEY = os.getenv('PAMTEK_DASHBOARD_OUT_KEY')
+
+# 외부 Chromium CDP 주소 (예: http://127.0.0.1:9222, 비우면 직접 실행)
+CDP_URL = os.getenv('PAMTEK_CDP_URL') or None
+
+# 새로고침/로그인 후 출근 시간 요소 대기 한도 (초)
+READY_TIMEOUT = float(os.getenv('PAMTEK_READY_TIMEOUT', '5'))
+
+# 페이지 로딩 완료 판단 방식 (networkidle / selector / response)
+READY_STRATEGY = os.getenv('PAMTEK_READY_STRATEGY', 'networkidle').lower()
+READY_RESPONSE_URL = os.getenv('PAMTEK_READY_RESPONSE_URL')
+
+# 최근 성공 후 이 시간(초) 이내면 세션 확인 요청 생략
+SESSION_TRUST_SECONDS = float(os.getenv('SESSION_TRUST_SECONDS', '60'))
+
+# 출근 상태 캐시 (TTL 초, 0이면 동시 요청 병합만 수행)
+STATUS_CACHE_TTL = float(os.getenv('STATUS_CACHE_TTL', '30'))
+
+# 기한 초과 시 stale로 반환할 수 있는 스냅샷의 최대 나이 (초, 오늘 조회한 것만)
+STATUS_MAX_STALE = float(os.getenv('STATUS_MAX_STALE', '300'))
+
+# 백그라운드 폴러 설정
+POLL_ENABLED = os.getenv('POLL_ENABLED', 'false').lower() == 'true'
+POLL_INTERVAL = float(os.getenv('POLL_INTERVAL', '60'))
+POLL_JITTER = float(os.getenv('POLL_JITTER', '5'))
+
+# 근무 일정 기반 폴링 (출퇴근 확인 시각 전후 촘촘히, 근무 중 드물게, 야간/주말 중지)
+POLL_SCHEDULE_ENABLED = os.getenv('POLL_SCHEDULE_ENABLED', 'true').lower() == 'true'
+POLL_SPARSE_INTERVAL = float(os.getenv('POLL_SPARSE_INTERVAL', '900'))
+POLL_WINDOW_MINUTES = float(os.getenv('POLL_WINDOW_MINUTES', '30'))
+SETTINGS_PATH = os.getenv('SETTINGS_PATH')
+
+# 요청당 새로고침 대기 기한 (초, 0이면 무제한, 설정하지 않으면 폴러 사용 시에만 2초)
+# 기한을 넘기면 마지막 스냅샷을 stale로 응답하고 새로고침은 백그라운드에서 계속 진행
+# 폴러 없이는 스냅샷이 금방 오래되어 stale로 응답할 수 없으므로 기한을 두면 느린 새로고침이 504가 됨
+STATUS_DEADLINE = float(os.getenv('STATUS_DEADLINE', '2' if POLL_ENABLED else '0')) or None
+
+# 세션 유지 (만료 전 가벼운 요청으로 갱신, 만료 시 요청 경로 밖에서 재로그인)
+KEEPALIVE_ENABLED = os.getenv('KEEPALIVE_ENABLED', 'true').lower() == 'true'
+KEEPALIVE_INITIAL_INTERVAL = float(os.getenv('KEEPALIVE_INITIAL_INTERVAL', '300'))
+KEEPALIVE_MAX_INTERVAL = float(os.getenv('KEEPALIVE_MAX_INTERVAL', '3600'))
+
+# 세션 쿠키 만료가 이 시간(초) 이내면 갱신 대신 미리 재로그인
+KEEPALIVE_RENEW_MARGIN = 60
+
+# 로그인 서킷 브레이커 (연속 실패 횟수, 백오프 초기/최대 대기 시간 초)
+LOGIN_FAILURE_THRESHOLD = int(os.getenv('LOGIN_FAILURE_THRESHOLD', '3'))
+LOGIN_BACKOFF_BASE = float(os.getenv('LOGIN_BACKOFF_BASE', '30'))
+LOGIN_BACKOFF_MAX = float(os.getenv('LOGIN_BACKOFF_MAX', '1800'))
+
+# 브라우저 작업 대기열 크기 (가득 차면 503)
+BROWSER_QUEUE_SIZE = int(os.getenv('BROWSER_QUEUE_SIZE', '16'))
+
+# 관리자 토큰 (설정하면 /admin/profile 사용 가능) 및 프로파일 저장 디렉터리
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN') or None
+PROFILE_DIR = os.getenv('PROFILE_DIR', 'profiles')
+
+status_cache = StatusCache(ttl=STATUS_CACHE_TTL, max_stale=STATUS_MAX_STALE)
+profiler = HotPathProfiler(PROFILE_DIR)
+poller = None
+keepalive = None
+
+# 로그인 실패가 이어지면 브라우저 재실행/로그인 시도를 잠시 중단
+login_breaker = CircuitBreaker(
+    failure_threshold=LOGIN_FAILURE_THRESHOLD,
+    base_delay=LOGIN_BACKOFF_BASE,
+    max_delay=LOGIN_BACKOFF_MAX
+)
+
+# 재로그인해도 차단 통계가 이어지도록 하나만 생성
+resource_blocker = ResourceBlocker.from_env(
+    BASE_URL,
+    block_types=BLOCK_TYPES,
+    block_third_party=BLOCK_THIRD_PARTY,
+    allow=BLOCK_ALLOW,
+    deny=BLOCK_DENY
+) if BLOCK_RESOURCES else None
+
+dashboard_capture = None
+if DASHBOARD_API:
+    if DASHBOARD_DATE_KEY and DASHBOARD_IN_KEY and DASHBOARD_OUT_KEY:
+        dashboard_capture = DashboardJsonCapture(
+            DASHBOARD_API, DASHBOARD_DATE_KEY, DASHBOARD_IN_KEY, DASHBOARD_OUT_KEY
+        )
+    else:
+        logger.warning("PAMTEK_DASHBOARD_*_KEY 설정 없음 - 대시보드 API 조회 사용 안 함")
+
 
 def init_playwright():
     """Playwright 초기화 및 로그인"""
-    global auth, parser
+    global auth, parser, liveness
 
     if not USER_ID or not PASSWORD:
         raise Exception("PAMTEK_USER_ID 또는 PAMTEK_PASSWORD 환경 변수가 설정되지 않음")
 
     logger.info("Playwright 인증 초기화 중...")
-    auth = PamtekAuthPlaywright(USER_ID, PASSWORD, headless=True)
-
-    if not auth.login():
+    # 로그인 성공 전에는 전역 auth에 넣지 않음 (실패한 인스턴스를 재로그인이 재사용하지 않도록)
+    new_auth = PamtekAuthPlaywright(USER_ID, PASSWORD, headless=True,
+                                    storage_state_path=STORAGE_STATE_PATH,
+                                    resource_blocker=resource_blocker,
+                                    dashboard_capture=dashboard_capture,
+                                    ready_timeout=READY_TIMEOUT,
+                                    ready_strategy=READY_STRATEGY,
+                                    ready_response_url=READY_RESPONSE_URL,
+                                    cdp_url=CDP_URL,
+                                    base_url=BASE_URL)
+
+    if not new_auth.login():
+        LOGINS.inc('failure')
+        new_auth.close()
         raise Exception("로그인 실패")
 
+    LOGINS.inc('success')
     logger.info("Playwright 로그인 성공")
 
+    auth = new_auth
+
+    liveness = SessionLiveness(auth, trust_seconds=SESSION_TRUST_SECONDS)
+    liveness.mark_success()
+
     # 파서 생성
-    parser = PamtekParserPlaywright(auth)
+    if ENGINE == 'hybrid':
+        parser = PamtekParserHybrid(auth, in_page_extract=EXTRACT_MODE == 'script')
+        logger.info("하이브리드 엔진 사용 (HTTP 조회)")
+    else:
+        parser = PamtekParserPlaywright(auth, in_page_extract=EXTRACT_MODE == 'script')
+
 
+def relogin():
+    """
+    재로그인 (브라우저 작업 스레드에서 실행)
+
+    실행 중인 브라우저가 있으면 컨텍스트만 새로 만들어 로그인하고,
+    브라우저가 없거나 쓸 수 없게 되었으면 종료 후 재초기화.
+    로그인 서킷 브레이커를 거치므로 연속 실패 후에는 CircuitOpenError로 즉시 거절
 
-def is_weekend():
-    """오늘이 주말인지 확인"""
-    today = datetime.now().weekday()
-    return today in [5, 6]  # 5=토요일, 6=일요일
+    Raises:
+        CircuitOpenError: 로그인 서킷이 열려 있음
+    """
+    with span('relogin'):
+        login_breaker.call(_relogin)
+
+
+def _relogin():
+    """
+    브라우저 재사용 재로그인 (서킷 브레이커 없이 실행)
+
+    브라우저가 멀쩡한데 폼 로그인만 실패했으면 재시작하지 않고 실패로 끝내고(시도 1번 = 로그인 1번),
+    브라우저/컨텍스트를 쓸 수 없게 된 경우에만 브라우저 재시작
+    """
+    if auth:
+        logger.info("브라우저 재사용 재로그인 시도")
+        if auth.relogin():
+            RELOGINS.inc('success')
+            if liveness:
+                liveness.mark_success()
+            if isinstance(parser, PamtekParserHybrid):
+                parser.sync_cookies()
+            logger.info("재로그인 성공 (브라우저 재사용)")
+            return
+
+        RELOGINS.inc('failure')
+        if auth.is_usable():
+            raise Exception("재로그인 실패")
+        logger.warning("브라우저 재사용 재로그인 실패 (브라우저 사용 불가) - 브라우저 재시작")
+
+    close_browser()
+    init_playwright()
+
+
+def close_browser():
+    """브라우저 종료 (브라우저 작업 스레드에서 실행)"""
+    global auth, parser, liveness
+
+    if isinstance(parser, PamtekParserHybrid):
+        parser.close()
+
+    if auth:
+        logger.info("브라우저 종료 중...")
+        auth.close()
+    auth = None
+    parser = None
+    liveness = None
+
+
+def create_polling_planner():
+    """설정 파일의 work_schedule로 폴링 계획 생성 (비활성 또는 설정 없음이면 None)"""
+    if not POLL_SCHEDULE_ENABLED:
+        return None
+
+    try:
+        settings = load_settings(SETTINGS_PATH)
+    except Exception as e:
+        logger.warning(f"설정 파일 로드 실패 - 고정 주기로 폴링: {e}")
+        return None
+
+    return PollingPlanner.from_settings(
+        settings,
+        dense_interval=POLL_INTERVAL,
+        sparse_interval=POLL_SPARSE_INTERVAL,
+        window_minutes=POLL_WINDOW_MINUTES
+    )
 
 
 def ensure_logged_in():
@@ -67,29 +287,40 @@ def ensure_logged_in():
 
     Returns:
         bool: 로그인 성공 여부
+
+    Raises:
+        CircuitOpenError: 재로그인이 필요하지만 로그인 서킷이 열려 있음
     """
     global auth, parser
 
     if not auth:
         logger.warning("인증 객체 없음 - 재초기화 시도")
         try:
-            init_playwright()
+            relogin()
             return True
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"재초기화 실패: {e}")
             return False
 
-    # 로그인 상태 확인
-    if not auth.is_logged_in():
+    # 로그인 상태 확인 - 쿠키/최근 성공/가벼운 요청으로 확인
+    # 확인 요청이 실패하면 그대로 재로그인 (새로고침하지 않은 페이지 HTML은 이전 상태라 믿을 수 없음)
+    # hybrid 엔진은 조회 자체가 home.do HTTP 요청이고 로그인 페이지를 직접 감지하므로 확인 요청 생략
+    # 대시보드 API 재요청도 리다이렉트 없이 보내 세션 만료 시 실패하고 새로고침으로 넘어가 로그인 페이지를 감지하므로 생략
+    if liveness:
+        replay_ready = dashboard_capture is not None and dashboard_capture.ready
+        logged_in = liveness.check(probe=ENGINE != 'hybrid' and not replay_ready)
+    else:
+        logged_in = auth.is_logged_in()
+
+    if not logged_in:
         logger.warning("세션 만료 감지 - 재로그인 시도")
         try:
-            # 기존 브라우저 종료
-            auth.close()
-
-            # 재초기화
-            init_playwright()
-            logger.info("재로그인 성공")
+            relogin()
             return True
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"재로그인 실패: {e}")
             return False
@@ -97,6 +328,212 @@ def ensure_logged_in():
     return True
 
 
+def fetch_attendance_status():
+    """
+    브라우저에서 출근 상태 새로 조회 (브라우저 작업 스레드에서 실행)
+
+    세션 만료 오류가 나면 재로그인 후 한 번 더 시도.
+    관리자가 프로파일링을 켜 두었으면 이 작업을 프로파일링
+
+    Returns:
+        dict: 출근 상태 정보
+    """
+    with profiler.profile('refresh'):
+        return _fetch_attendance_status()
+
+
+def _fetch_attendance_status():
+    """출근 상태 조회 (로그인 확인 → 파서 조회 → 세션 만료 시 재로그인 후 재시도)"""
+    # 로그인 상태 확인 및 재로그인
+    with span('login_check'):
+        logged_in = ensure_logged_in()
+    if not logged_in:
+        UPSTREAM_ERRORS.inc('login')
+        return {"status": "error", "error": "로그인 실패 - 서버 재시작 필요"}
+
+    if not parser:
+        return {"status": "error", "error": "서버 초기화 안됨"}
+
+    status = parser.get_attendance_status()
+
+    # 세션 만료로 인한 에러 체크 - 조회가 로그인 페이지를 만났으므로 확인 없이 바로 재로그인
+    if status.get('error') and '세션' in str(status.get('error')):
+        logger.warning("세션 만료 감지 - 재로그인 후 재시도")
+        if liveness:
+            liveness.mark_failure()
+        try:
+            relogin()
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logger.error(f"재로그인 실패: {e}")
+        else:
+            # 재로그인 성공 - 다시 시도
+            status = parser.get_attendance_status()
+
+    if status.get('error'):
+        UPSTREAM_ERRORS.inc('status')
+    elif liveness:
+        liveness.mark_success()
+
+    return status
+
+
+def keep_session_alive():
+    """
+    세션 유지 (브라우저 작업 스레드에서 실행)
+
+    가벼운 요청으로 서버 세션을 갱신하고, 만료가 확인되었거나 세션 쿠키가 곧 만료되면 재로그인.
+    네트워크 오류나 5xx로 확인하지 못했으면 재로그인하지 않음 (다음 주기에 다시 확인)
+
+    Returns:
+        dict: {'alive': 세션이 살아 있었는지 (쿠키 만료로 미리 재로그인했거나 확인하지 못했으면 None),
+               'relogged_in': 재로그인 여부}
+    """
+    if not auth or not liveness:
+        relogin()
+        return {'alive': None, 'relogged_in': True}
+
+    expiry = liveness.cookie_expiry()
+    liveness.cookie_expires_at = expiry
+    expiring = expiry is not None and expiry - time.time() <= KEEPALIVE_RENEW_MARGIN
+
+    alive = None
+    if not expiring:
+        alive = liveness.probe_session()
+        if alive:
+            return {'alive': True, 'relogged_in': False}
+        if alive is None:
+            raise Exception("세션 확인 요청 실패 (네트워크 오류 또는 서버 오류)")
+
+    relogin()
+    if liveness:
+        liveness.cookie_expires_at = liveness.cookie_expiry()
+    return {'alive': alive, 'relogged_in': True}
+
+
+# 브라우저는 이 스레드에서만 생성/사용/종료
+browser_worker = BrowserWorker({
+    JOB_REFRESH: fetch_attendance_status,
+    JOB_RELOGIN: relogin,
+    JOB_KEEPALIVE: keep_session_alive,
+}, max_queue=BROWSER_QUEUE_SIZE, on_stop=close_browser)
+
+
+def load_attendance_status():
+    """출근 상태 새로고침을 브라우저 작업 스레드에 요청하고 결과 대기 (캐시 loader)"""
+    # 로그인이 필요한데 서킷이 열려 있으면 작업 큐에 넣지 않고 바로 거절
+    if liveness is None or liveness.last_success_at is None:
+        login_breaker.raise_if_open()
+
+    future = browser_worker.submit(JOB_REFRESH)
+    try:
+        return future.result()
+    except Exception:
+        UPSTREAM_ERRORS.inc('exception')
+        raise
+    finally:
+        # 브라우저 작업 스레드에서 측정한 단계별 시간을 이 스레드의 요청 Timings에 합침
+        metrics.merge(future.timings)
+
+
+def get_snapshot():
+    """요청 기한 내 출근 상태 스냅샷 (캐시 / 병합된 새로고침 / stale)"""
+    return status_cache.get(load_attendance_status, deadline=STATUS_DEADLINE)
+
+
+def not_modified_response(snapshot):
+    """304 응답 (본문 없음, ETag만)"""
+    response = Response(status=304)
+    response.set_etag(snapshot.etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def cached_not_modified():
+    """
+    If-None-Match가 신선한 캐시 스냅샷의 ETag와 같으면 304 응답
+
+    캐시 로더/브라우저를 거치지 않고 응답 본문도 만들지 않음
+
+    Returns:
+        Response: 304 응답, 조건이 맞지 않으면 None
+    """
+    if not request.if_none_match:
+        return None
+
+    snapshot = status_cache.snapshot
+    if not status_cache.is_fresh(snapshot) or not has_etag(snapshot):
+        return None
+    if not request.if_none_match.contains_weak(snapshot.etag):
+        return None
+
+    CACHE_REQUESTS.inc('not_modified')
+    return not_modified_response(snapshot)
+
+
+def has_etag(snapshot):
+    """
+    스냅샷에 ETag를 붙여 304로 응답할 수 있는지
+
+    stale 스냅샷은 클라이언트가 stale: true를 봐야 하고, 오류 결과는 다음 요청에서 다시 조회해야 하므로 제외
+    """
+    return bool(snapshot and snapshot.etag and not snapshot.stale and not snapshot.error)
+
+
+def etag_response(snapshot, response):
+    """
+    스냅샷 ETag 붙이기 (새로고침 후에도 내용이 같으면 304, stale/오류 스냅샷은 ETag 없이 그대로 응답)
+
+    응답 본문의 age_seconds, timestamp는 매번 달라지지만 출근 상태가 같으면 같은 응답으로 보므로 weak ETag 사용
+    """
+    if not has_etag(snapshot):
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    if request.if_none_match.contains_weak(snapshot.etag):
+        return not_modified_response(snapshot)
+
+    response.set_etag(snapshot.etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def unavailable_response(e, **fields):
+    """기한 초과(504), 브라우저 작업 대기열 포화 또는 로그인 서킷 open(503) 응답"""
+    logger.warning(str(e))
+    code = 504 if isinstance(e, StatusTimeoutError) else 503
+    response = jsonify({"error": str(e), **fields})
+    if isinstance(e, CircuitOpenError):
+        response.headers['Retry-After'] = str(max(1, int(e.retry_in)))
+    return response, code
+
+
+@app.before_request
+def start_timings():
+    """요청마다 단계별 시간 측정 시작"""
+    g.timings = Timings()
+    g.started = time.perf_counter()
+    metrics.set_current(g.timings)
+
+
+@app.after_request
+def add_server_timing(response):
+    """단계별 시간을 Server-Timing 헤더로 반환하고 요청 시간 히스토그램에 기록"""
+    timings = g.pop('timings', None)
+    if timings is not None:
+        elapsed = time.perf_counter() - g.started
+        timings.add('total', elapsed)
+        response.headers['Server-Timing'] = timings.server_timing()
+        REQUEST_SECONDS.observe(elapsed, request.endpoint or 'unknown', str(response.status_code))
+    return response
+
+
+@app.teardown_request
+def stop_timings(exc):
+    metrics.set_current(None)
+
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """
@@ -110,17 +547,13 @@ def get_status():
             "check_out_time": str,
             "status": str,
             "need_action": bool,
-            "is_weekend": bool
+            "is_weekend": bool,
+            "fetched_at": str,
+            "age_seconds": float,
+            "stale": bool
         }
     """
     try:
-        # 로그인 상태 확인 및 재로그인
-        if not ensure_logged_in():
-            return jsonify({"error": "로그인 실패 - 서버 재시작 필요"}), 500
-
-        if not parser:
-            return jsonify({"error": "서버 초기화 안됨"}), 500
-
         # 주말 체크
         weekend = is_weekend()
 
@@ -137,24 +570,27 @@ def get_status():
                 "error": None
             })
 
-        # 평일이면 실제 출근 상태 확인
-        status = parser.get_attendance_status()
+        # 출근 상태가 바뀌지 않았으면 304 (브라우저 접근 없음)
+        not_modified = cached_not_modified()
+        if not_modified:
+            return not_modified
 
-        # 세션 만료로 인한 에러 체크
-        if status.get('error') and '세션' in str(status.get('error')):
-            logger.warning("세션 만료 감지 - 재로그인 후 재시도")
-            if ensure_logged_in():
-                # 재로그인 성공 - 다시 시도
-                status = parser.get_attendance_status()
+        # 평일이면 실제 출근 상태 확인 (캐시 또는 병합된 새로고침)
+        snapshot = get_snapshot()
 
-        if status.get('error'):
-            return jsonify({"error": status['error']}), 500
+        if snapshot.error:
+            return jsonify({"error": snapshot.error}), 500
+
+        status = snapshot.to_dict()
 
         # iOS Shortcuts에서 사용할 필드 추가
         status['need_action'] = not status['is_checked_in'] or not status['is_checked_out']
         status['is_weekend'] = False
 
-        return jsonify(status)
+        return etag_response(snapshot, jsonify(status))
+
+    except (StatusTimeoutError, WorkerBusyError, CircuitOpenError) as e:
+        return unavailable_response(e)
 
     except Exception as e:
         logger.error(f"상태 조회 중 오류: {e}")
@@ -168,36 +604,225 @@ def get_summary():
 
     Returns:
         {
-            "summary": str
+            "summary": str,
+            "fetched_at": str,
+            "age_seconds": float,
+            "stale": bool
         }
     """
     try:
-        # 로그인 상태 확인 및 재로그인
-        if not ensure_logged_in():
-            return jsonify({"error": "로그인 실패 - 서버 재시작 필요"}), 500
+        not_modified = cached_not_modified()
+        if not_modified:
+            return not_modified
 
-        if not parser:
-            return jsonify({"error": "서버 초기화 안됨"}), 500
+        snapshot = get_snapshot()
+        summary = PamtekParserPlaywright.summarize(snapshot.status)
+        data = snapshot.to_dict()
 
-        summary = parser.get_today_attendance_summary()
+        return etag_response(snapshot, jsonify({
+            "summary": summary,
+            "fetched_at": data['fetched_at'],
+            "age_seconds": data['age_seconds'],
+            "stale": data['stale']
+        }))
 
-        # 에러 체크 및 재시도
-        if "오류" in summary or "세션" in summary:
-            logger.warning("세션 만료 가능성 - 재로그인 후 재시도")
-            if ensure_logged_in():
-                summary = parser.get_today_attendance_summary()
-
-        return jsonify({"summary": summary})
+    except (StatusTimeoutError, WorkerBusyError, CircuitOpenError) as e:
+        return unavailable_response(e)
 
     except Exception as e:
         logger.error(f"요약 조회 중 오류: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/check-in', methods=['GET'])
+def check_in_status():
+    """
+    출근 여부만 확인 (iOS Shortcuts에서 간단히 사용)
+
+    Returns:
+        {
+            "checked_in": bool,
+            "time": str,
+            "need_action": bool,
+            "message": str,
+            "age_seconds": float,
+            "stale": bool
+        }
+    """
+    try:
+        if is_weekend():
+            return jsonify({
+                "checked_in": False,
+                "time": None,
+                "need_action": False,
+                "message": "주말입니다",
+                "timestamp": datetime.now().isoformat()
+            })
+
+        not_modified = cached_not_modified()
+        if not_modified:
+            return not_modified
+
+        snapshot = get_snapshot()
+
+        if snapshot.error:
+            return jsonify({"error": snapshot.error, "need_action": True}), 500
+
+        status = snapshot.status
+        return etag_response(snapshot, jsonify({
+            "checked_in": status['is_checked_in'],
+            "time": status['check_in_time'],
+            "need_action": not status['is_checked_in'],
+            "message": '출근 필요' if not status['is_checked_in'] else '출근 완료',
+            "timestamp": datetime.now().isoformat(),
+            "age_seconds": round(snapshot.age(), 1),
+            "stale": snapshot.stale
+        }))
+
+    except (StatusTimeoutError, WorkerBusyError, CircuitOpenError) as e:
+        return unavailable_response(e, need_action=True)
+
+    except Exception as e:
+        logger.error(f"출근 확인 중 오류: {e}")
+        return jsonify({"error": str(e), "need_action": True}), 500
+
+
+@app.route('/api/check-out', methods=['GET'])
+def check_out_status():
+    """
+    퇴근 여부만 확인 (iOS Shortcuts에서 간단히 사용)
+
+    Returns:
+        {
+            "checked_out": bool,
+            "time": str,
+            "need_action": bool,
+            "message": str,
+            "age_seconds": float,
+            "stale": bool
+        }
+    """
+    try:
+        if is_weekend():
+            return jsonify({
+                "checked_out": False,
+                "time": None,
+                "need_action": False,
+                "message": "주말입니다",
+                "timestamp": datetime.now().isoformat()
+            })
+
+        not_modified = cached_not_modified()
+        if not_modified:
+            return not_modified
+
+        snapshot = get_snapshot()
+
+        if snapshot.error:
+            return jsonify({"error": snapshot.error, "need_action": True}), 500
+
+        status = snapshot.status
+
+        # 출근하지 않았으면 퇴근 체크 의미 없음
+        if not status['is_checked_in']:
+            return etag_response(snapshot, jsonify({
+                "checked_out": False,
+                "time": None,
+                "need_action": False,
+                "message": "출근 전입니다",
+                "timestamp": datetime.now().isoformat(),
+                "age_seconds": round(snapshot.age(), 1),
+                "stale": snapshot.stale
+            }))
+
+        return etag_response(snapshot, jsonify({
+            "checked_out": status['is_checked_out'],
+            "time": status['check_out_time'],
+            "need_action": not status['is_checked_out'],
+            "message": '퇴근 필요' if not status['is_checked_out'] else '퇴근 완료',
+            "timestamp": datetime.now().isoformat(),
+            "age_seconds": round(snapshot.age(), 1),
+            "stale": snapshot.stale
+        }))
+
+    except (StatusTimeoutError, WorkerBusyError, CircuitOpenError) as e:
+        return unavailable_response(e, need_action=True)
+
+    except Exception as e:
+        logger.error(f"퇴근 확인 중 오류: {e}")
+        return jsonify({"error": str(e), "need_action": True}), 500
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """헬스 체크"""
-    return jsonify({"status": "ok"})
+    return jsonify({
+        "status": "ok",
+        "engine": ENGINE,
+        "browser": auth.browser_mode if auth else None,
+        "hybrid": parser.get_stats() if isinstance(parser, PamtekParserHybrid) else None,
+        "session": liveness.get_stats() if liveness else None,
+        "waits": auth.get_wait_stats() if auth else None,
+        "resource_blocking": resource_blocker.get_stats() if resource_blocker else None,
+        "dashboard_json": dashboard_capture.get_stats() if dashboard_capture else None,
+        "login_circuit": login_breaker.get_stats(),
+        "browser_worker": browser_worker.get_stats(),
+        "poller": poller.get_stats() if poller else None,
+        "keepalive": keepalive.get_stats() if keepalive else None
+    })
+
+
+def admin_denied():
+    """관리자 토큰 확인 (Authorization: Bearer <토큰> 또는 X-Admin-Token), 통과하면 None"""
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "ADMIN_TOKEN 설정 없음 - 관리자 기능 사용 안 함"}), 404
+
+    token = request.headers.get('X-Admin-Token', '')
+    authorization = request.headers.get('Authorization', '')
+    if authorization.startswith('Bearer '):
+        token = authorization[len('Bearer '):]
+
+    if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        logger.warning(f"관리자 인증 실패: {request.remote_addr}")
+        return jsonify({"error": "인증 실패"}), 401
+    return None
+
+
+@app.route('/admin/profile', methods=['GET', 'POST', 'DELETE'])
+def admin_profile():
+    """
+    새로고침 프로파일링 (관리자 전용)
+
+    POST: 다음 requests건 또는 seconds초 동안의 새로고침을 프로파일링
+          (쿼리 또는 JSON: requests, seconds, mode=sampling|cprofile)
+    GET: 상태와 최근 저장한 프로파일
+    DELETE: 중지
+    """
+    denied = admin_denied()
+    if denied:
+        return denied
+
+    if request.method == 'POST':
+        options = {**request.args.to_dict(), **(request.get_json(silent=True) or {})}
+        try:
+            return jsonify(profiler.arm(
+                requests=int(options['requests']) if options.get('requests') else None,
+                seconds=float(options['seconds']) if options.get('seconds') else None,
+                mode=options.get('mode', 'sampling')
+            ))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+    if request.method == 'DELETE':
+        profiler.disarm()
+
+    return jsonify(profiler.get_status())
+
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus 지표 (단계별/요청별 시간 히스토그램, 로그인/캐시/오류 카운터)"""
+    return Response(metrics.REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
 
 
 if __name__ == '__main__':
@@ -206,11 +831,29 @@ if __name__ == '__main__':
         print("Pamtek HR Helper - Playwright 기반 서버")
         print("=" * 60)
 
-        # Playwright 초기화
+        # Playwright 초기화 (브라우저 작업 스레드에서 실행)
         print("\n[1/2] Playwright 초기화 및 로그인 중...")
-        init_playwright()
+        browser_worker.start()
+        browser_worker.call(JOB_RELOGIN)
         print("✅ Playwright 로그인 성공")
 
+        # 백그라운드 폴러 시작
+        if POLL_ENABLED:
+            poller = AttendancePoller(status_cache, load_attendance_status,
+                                      interval=POLL_INTERVAL, jitter=POLL_JITTER,
+                                      planner=create_polling_planner())
+            poller.start()
+            print(f"✅ 출근 상태 폴러 시작 (주기 {POLL_INTERVAL:.0f}초)")
+
+        # 세션 유지 스레드 시작
+        if KEEPALIVE_ENABLED:
+            keepalive = SessionKeepAlive(lambda: browser_worker.submit(JOB_KEEPALIVE),
+                                         lambda: liveness,
+                                         initial_interval=KEEPALIVE_INITIAL_INTERVAL,
+                                         max_interval=KEEPALIVE_MAX_INTERVAL)
+            keepalive.start()
+            print(f"✅ 세션 유지 시작 (초기 주기 {KEEPALIVE_INITIAL_INTERVAL:.0f}초)")
+
         # Flask 서버 시작
         print("\n[2/2] Flask 서버 시작 중...")
         print("=" * 60)
@@ -218,7 +861,10 @@ if __name__ == '__main__':
         print("API 엔드포인트:")
         print("  - GET /api/status   : 출근 상태 확인")
         print("  - GET /api/summary  : 출근 현황 요약")
+        print("  - GET /api/check-in : 출근 여부 확인")
+        print("  - GET /api/check-out: 퇴근 여부 확인")
         print("  - GET /health       : 헬스 체크")
+        print("  - GET /metrics      : Prometheus 지표")
         print("=" * 60)
 
         app.run(host='0.0.0.0', port=5000, debug=False)
@@ -230,8 +876,12 @@ if __name__ == '__main__':
         import traceback
         traceback.print_exc()
     finally:
-        # 브라우저 종료
-        if auth:
-            print("브라우저 종료 중...")
-            auth.close()
+        if keepalive:
+            keepalive.stop()
+
+        if poller:
+            poller.stop()
+
+        # 브라우저 종료 (작업 스레드 종료 시 close_browser 실행)
+        browser_worker.stop()
         print("완료!")
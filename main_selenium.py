@@ -5,11 +5,11 @@ import os
 import sys
 import io
 import logging
-from datetime import datetime
 from dotenv import load_dotenv
 from flask import Flask, jsonify
 from src.auth_selenium import PamtekAuthSelenium
 from src.parser_selenium import PamtekParserSelenium
+from src.schedule import is_weekend
 
 # 인코딩 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -44,7 +44,8 @@ def init_selenium():
         raise ValueError("환경 변수 PAMTEK_USER_ID, PAMTEK_PASSWORD가 설정되지 않음")
 
     # Selenium 인증 객체 생성 (headless 모드)
-    auth = PamtekAuthSelenium(user_id, password, headless=True)
+    auth = PamtekAuthSelenium(user_id, password, headless=True,
+                              base_url=os.getenv('PAMTEK_BASE_URL', 'https://hr.pamtek.com'))
 
     # 로그인
     if not auth.login():
@@ -56,12 +57,6 @@ def init_selenium():
     parser = PamtekParserSelenium(auth)
 
 
-def is_weekend():
-    """오늘이 주말인지 확인"""
-    today = datetime.now().weekday()
-    return today in [5, 6]  # 5=토요일, 6=일요일
-
-
 def ensure_logged_in():
     """
     로그인 상태 확인 및 필요 시 재로그인
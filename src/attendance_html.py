@@ -0,0 +1,293 @@
+"""
+출근 현황 HTML 파싱 공용 모듈
+requests / Playwright / Selenium 파서가 함께 쓰는 오늘(active) 날짜 실적 시간 추출
+
+백엔드:
+- lxml: 미리 컴파일한 XPath (기본값, requirements.txt에 포함)
+- selectolax: 설치되어 있으면 사용 가능 (pip install selectolax)
+- html.parser: BeautifulSoup 순수 Python 파서 (기존 방식)
+
+모든 백엔드는 같은 HTML에 대해 같은 결과를 반환해야 함
+"""
+import os
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup
+
+from .metrics import span
+
+logger = logging.getLogger(__name__)
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml은 requirements.txt에 포함
+    etree = None
+
+try:
+    # selectolax 1.0부터 Modest 엔진(selectolax.parser)이 빠지고 Lexbor만 남음
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+BACKEND_LXML = 'lxml'
+BACKEND_SELECTOLAX = 'selectolax'
+BACKEND_SOUP = 'html.parser'
+
+ACTIVE_DAY_CLASS = 'item-day active'
+
+# 오늘 날짜 div 시작 태그와 div 여닫는 태그 (사전 스캔용)
+_ACTIVE_DAY_TAG_RE = re.compile(
+    r'<div\b[^>]*?\bclass\s*=\s*(["\'])\s*item-day\s+active\s*\1[^>]*>',
+    re.IGNORECASE
+)
+# div 여닫는 태그 (주석과 script/style 본문 안의 '</div>' 등은 통째로 건너뜀 - div 그룹이 None)
+_DIV_TAG_RE = re.compile(
+    r'<!--.*?-->|<(script|style)\b[^>]*>.*?</\1\s*>|<(/?)div\b[^>]*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+if etree is not None:
+    def _has_class_xpath(name: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+    # BeautifulSoup class_='item-day active'와 같은 기준: 공백 정리한 class 속성 전체가 일치
+    _XPATH_ACTIVE_DAY = etree.XPath(f"(//div[normalize-space(@class)='{ACTIVE_DAY_CLASS}'])[1]")
+    _XPATH_TIME_WRAP = etree.XPath(f"(.//div[{_has_class_xpath('time-wrap')}])[1]")
+    _XPATH_TIMES = etree.XPath(f".//div[{_has_class_xpath('time')}]")
+    _XPATH_TIT = etree.XPath(f"(.//span[{_has_class_xpath('tit')}])[1]")
+    _XPATH_TXT = etree.XPath(f"(.//span[{_has_class_xpath('txt')}])[1]")
+    _XPATH_TEXT = etree.XPath("string()")
+    _LXML_PARSER = etree.HTMLParser(recover=True)
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 파싱 백엔드 목록 (빠른 순)"""
+    backends = []
+    if etree is not None:
+        backends.append(BACKEND_LXML)
+    if SelectolaxParser is not None:
+        backends.append(BACKEND_SELECTOLAX)
+    backends.append(BACKEND_SOUP)
+    return backends
+
+
+DEFAULT_BACKEND = os.getenv('PAMTEK_HTML_BACKEND') or available_backends()[0]
+
+
+def slice_active_day(html: str) -> Optional[str]:
+    """
+    HTML 전체에서 오늘 날짜(item-day active) div 부분만 잘라냄
+
+    Args:
+        html: 홈 페이지 HTML
+
+    Returns:
+        str: 오늘 날짜 div HTML 조각, 찾지 못하면 None
+    """
+    match = _ACTIVE_DAY_TAG_RE.search(html)
+    if not match:
+        return None
+
+    depth = 0
+    for tag in _DIV_TAG_RE.finditer(html, match.start()):
+        if tag.group(2) is None:
+            # 주석 또는 script/style
+            continue
+        depth += -1 if tag.group(2) else 1
+        if depth == 0:
+            return html[match.start():tag.end()]
+
+    # 닫는 태그가 없으면 끝까지
+    return html[match.start():]
+
+
+def _split_actual(tit_text: str, txt_text: str) -> Optional[Tuple[str, str]]:
+    """'실적' 항목의 'HH:MM~HH:MM'을 (출근, 퇴근)으로 분리"""
+    if '실적' not in tit_text:
+        return None
+
+    time_text = txt_text.strip()
+    if '~' not in time_text:
+        return None
+
+    times_split = time_text.split('~')
+    if len(times_split) != 2:
+        return None
+
+    return times_split[0].strip(), times_split[1].strip()
+
+
+def _extract_lxml(html: str) -> Optional[Tuple[str, str]]:
+    root = etree.fromstring(html, parser=_LXML_PARSER)
+    if root is None:
+        return None
+
+    active_day = _XPATH_ACTIVE_DAY(root)
+    if not active_day:
+        return None
+
+    time_wrap = _XPATH_TIME_WRAP(active_day[0])
+    if not time_wrap:
+        return ()
+
+    for time_div in _XPATH_TIMES(time_wrap[0]):
+        tit = _XPATH_TIT(time_div)
+        txt = _XPATH_TXT(time_div)
+        if tit and txt:
+            result = _split_actual(_XPATH_TEXT(tit[0]), _XPATH_TEXT(txt[0]))
+            if result:
+                return result
+    return ()
+
+
+def _extract_selectolax(html: str) -> Optional[Tuple[str, str]]:
+    tree = SelectolaxParser(html)
+    active_day = next(
+        (
+            node for node in tree.css('div.item-day.active')
+            if ' '.join((node.attributes.get('class') or '').split()) == ACTIVE_DAY_CLASS
+        ),
+        None
+    )
+    if active_day is None:
+        return None
+
+    time_wrap = active_day.css_first('div.time-wrap')
+    if time_wrap is None:
+        return ()
+
+    for time_div in time_wrap.css('div.time'):
+        tit = time_div.css_first('span.tit')
+        txt = time_div.css_first('span.txt')
+        if tit is not None and txt is not None:
+            result = _split_actual(tit.text(deep=True), txt.text(deep=True))
+            if result:
+                return result
+    return ()
+
+
+def _extract_soup(html: str) -> Optional[Tuple[str, str]]:
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # active 클래스를 가진 오늘 날짜 찾기
+    active_day = soup.find('div', class_=ACTIVE_DAY_CLASS)
+    if not active_day:
+        return None
+
+    # time-wrap 안의 실적 시간 찾기
+    time_wrap = active_day.find('div', class_='time-wrap')
+    if not time_wrap:
+        return ()
+
+    for time_div in time_wrap.find_all('div', class_='time'):
+        tit = time_div.find('span', class_='tit')
+        txt = time_div.find('span', class_='txt')
+        if tit and txt:
+            result = _split_actual(tit.text, txt.text)
+            if result:
+                return result
+    return ()
+
+
+# 추출 함수 반환값: None = 오늘 날짜 div 없음, () = 있지만 실적 시간 없음, (출근, 퇴근)
+_EXTRACTORS = {
+    BACKEND_LXML: _extract_lxml,
+    BACKEND_SELECTOLAX: _extract_selectolax,
+    BACKEND_SOUP: _extract_soup,
+}
+
+
+def extract_actual_times(html: str, backend: Optional[str] = None,
+                         prescan: bool = True) -> Tuple[Optional[str], Optional[str]]:
+    """
+    오늘 날짜의 실적 출근/퇴근 시간 추출
+
+    Args:
+        html: 홈 페이지 HTML
+        backend: 파싱 백엔드 (기본값: DEFAULT_BACKEND)
+        prescan: True면 오늘 날짜 div 조각만 잘라서 파싱 (못 찾으면 전체 파싱)
+
+    Returns:
+        tuple: (출근 시간, 퇴근 시간), 없으면 (None, None)
+    """
+    if not html:
+        return None, None
+
+    backend = backend or DEFAULT_BACKEND
+    extractor = _EXTRACTORS.get(backend)
+    if extractor is None or (backend == BACKEND_LXML and etree is None) or \
+            (backend == BACKEND_SELECTOLAX and SelectolaxParser is None):
+        raise ValueError(f"사용할 수 없는 HTML 파싱 백엔드: {backend}")
+
+    result = None
+    if prescan:
+        fragment = slice_active_day(html)
+        if fragment is not None:
+            result = extractor(fragment)
+
+    # 사전 스캔 실패 (조각에서 오늘 날짜나 실적을 못 찾음) - 전체 파싱
+    if not result:
+        result = extractor(html)
+
+    return result if result else (None, None)
+
+
+def build_attendance_status(check_in_time: Optional[str], check_out_time: Optional[str]) -> Dict[str, any]:
+    """
+    실적 출근/퇴근 시간으로 출근 상태 생성
+
+    Args:
+        check_in_time: 출근 시간 ('00:00', '-'이면 미출근)
+        check_out_time: 퇴근 시간 ('00:00', '-'이면 미퇴근)
+
+    Returns:
+        dict: 출근 상태 정보
+    """
+    # 출근/퇴근 여부 판단
+    is_checked_in = False
+    is_checked_out = False
+
+    if check_in_time and check_in_time != '00:00' and check_in_time != '-':
+        is_checked_in = True
+
+    if check_out_time and check_out_time != '00:00' and check_out_time != '-':
+        is_checked_out = True
+
+    # 상태 결정
+    if not is_checked_in:
+        status = 'not_checked_in'
+    elif not is_checked_out:
+        status = 'not_checked_out'
+    else:
+        status = 'completed'
+
+    logger.info(f"출근 상태 파싱 완료 - 출근: {check_in_time}, 퇴근: {check_out_time}")
+
+    return {
+        'is_checked_in': is_checked_in,
+        'is_checked_out': is_checked_out,
+        'check_in_time': check_in_time if is_checked_in else None,
+        'check_out_time': check_out_time if is_checked_out else None,
+        'status': status,
+        'error': None
+    }
+
+
+def parse_attendance_html(html: str, backend: Optional[str] = None) -> Dict[str, any]:
+    """
+    홈 페이지 HTML에서 오늘의 출근/퇴근 상태 추출
+
+    Args:
+        html: 홈 페이지 HTML
+        backend: 파싱 백엔드 (기본값: DEFAULT_BACKEND)
+
+    Returns:
+        dict: 출근 상태 정보
+    """
+    with span('parse'):
+        check_in_time, check_out_time = extract_actual_times(html, backend)
+    return build_attendance_status(check_in_time, check_out_time)
@@ -13,13 +13,14 @@ logger = logging.getLogger(__name__)
 class PamtekAuth:
     """Pamtek HR 인증 관리 클래스"""
 
-    def __init__(self, user_id: str, password: str, company_code: str = "KO883"):
+    def __init__(self, user_id: str, password: str, company_code: str = "KO883",
+                 base_url: str = "https://hr.pamtek.com"):
         self.user_id = user_id
         self.password = password
         self.company_code = company_code
         self.consumer_code = f"T{company_code}"
         self.session = requests.Session()
-        self.base_url = "https://hr.pamtek.com"
+        self.base_url = base_url.rstrip('/')
 
     def login(self) -> bool:
         """
@@ -2,26 +2,107 @@
 Playwright 기반 Pamtek HR 로그인 모듈
 Selenium보다 빠르고 안정적인 브라우저 자동화
 """
+import os
+import json
+import fnmatch
 import logging
-from typing import Optional
+from typing import Dict, Optional
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 import time
 
+from .metrics import record, span
+
 logger = logging.getLogger(__name__)
 
+# page.content() 문자열 검사('loginForm', 'dash-layout', 'item-dash')와 같은 기준의 선택자
+LOGIN_FORM_SELECTOR = '[id*="loginForm"], [name*="loginForm"], [class*="loginForm"]'
+DASHBOARD_SELECTOR = '[class*="dash-layout"], [class*="item-dash"]'
+
+# 오늘 날짜의 출근 시간이 표시되었는지 (새로고침 후 대기 기준)
+ACTIVE_DAY_READY_SELECTOR = 'div.item-day.active .time-wrap'
+
+# 새로고침 후 출근 시간 요소 대기 상한 (초, 기존 고정 대기와 같음, networkidle 방식에서만 적용)
+# networkidle은 XHR까지 끝난 뒤라 time-wrap이 없는 구조(HTML 파싱으로 대체하는 경우)에서 매번
+# ready_timeout만큼 막히지 않도록 짧게 제한. selector/response 방식은 DOMContentLoaded 후
+# 이 대기가 유일한 데이터 대기이므로 ready_timeout 전체를 기다림
+REFRESH_READY_TIMEOUT = 1.0
+
+# 페이지 로딩 완료 판단 방식
+# networkidle: 500ms 동안 네트워크 요청이 없을 때까지 (기존 방식)
+# selector: DOMContentLoaded 후 출근 시간 요소가 나타날 때까지
+# response: DOMContentLoaded + ready_response_url에 맞는 응답 수신 후 출근 시간 요소 대기
+READY_NETWORKIDLE = 'networkidle'
+READY_SELECTOR = 'selector'
+READY_RESPONSE = 'response'
+READY_STRATEGIES = (READY_NETWORKIDLE, READY_SELECTOR, READY_RESPONSE)
+
+# 오늘(active) 날짜의 time-wrap 안 {제목: 시간} 만 페이지 안에서 추출
+# (예: {"계획": "09:00~18:00", "실적": "08:45~00:00"}), 구조가 다르면 null
+ACTIVE_DAY_TIMES_SCRIPT = """() => {
+    const day = document.querySelector('div.item-day.active');
+    const wrap = day && day.querySelector('div.time-wrap');
+    if (!wrap) return null;
+    const times = {};
+    for (const el of wrap.querySelectorAll('div.time')) {
+        const tit = el.querySelector('span.tit');
+        const txt = el.querySelector('span.txt');
+        if (tit && txt) times[tit.textContent.trim()] = txt.textContent.trim();
+    }
+    return times;
+}"""
 
-class PamtekAuthPlaywright:
-    """Playwright 기반 Pamtek HR 인증 클래스"""
 
-    def __init__(self, user_id: str, password: str, headless: bool = True):
+class PamtekAuthPlaywright:
+    """
+    Playwright 기반 Pamtek HR 인증 클래스
+
+    storage_state_path를 지정하면 로그인 성공 시 쿠키/로컬 스토리지를 저장하고,
+    다음 시작 시 저장된 세션으로 홈 페이지만 열어 확인 (실패할 때만 폼 로그인)
+    resource_blocker(ResourceBlocker)를 지정하면 컨텍스트의 불필요한 리소스 요청 차단
+    dashboard_capture(DashboardJsonCapture)를 지정하면 대시보드 JSON API 요청을 기록
+    ready_strategy로 홈/로그인 페이지 로딩 완료 판단 방식 선택 (READY_STRATEGIES)
+    cdp_url을 지정하면 프로세스 밖에서 실행 중인 Chromium에 connect_over_cdp로 연결해
+    기본 컨텍스트(로그인 세션)를 재사용하고, 연결에 실패하면 직접 실행
+    """
+
+    def __init__(self, user_id: str, password: str, headless: bool = True,
+                 storage_state_path: Optional[str] = None, resource_blocker=None,
+                 dashboard_capture=None, ready_timeout: float = 5.0,
+                 ready_strategy: str = READY_NETWORKIDLE, ready_response_url: Optional[str] = None,
+                 cdp_url: Optional[str] = None, base_url: str = "https://hr.pamtek.com"):
         self.user_id = user_id
         self.password = password
         self.headless = headless
-        self.base_url = "https://hr.pamtek.com"
+        self.base_url = base_url.rstrip('/')
+        self.storage_state_path = storage_state_path
+        self.resource_blocker = resource_blocker
+        self.dashboard_capture = dashboard_capture
+        self.ready_timeout = ready_timeout
+        self.ready_strategy = ready_strategy
+        self.ready_response_url = ready_response_url
+        self.cdp_url = cdp_url
+        self.browser_mode: Optional[str] = None
+        self._external_context = False
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._state_restored = False
+        # 마지막 navigate_to_home()이 로그인 페이지를 만났는지 (세션 만료)
+        self.session_expired = False
+        # 마지막 navigate_to_home() 새로고침에서 출근 시간 요소 대기가 상한에 걸렸는지
+        self.ready_timed_out = False
+        self.ready_waits = 0
+        self.ready_timeouts = 0
+        self.ready_wait_ms_total = 0.0
+        self.fixed_sleep_ms_replaced = 0.0
+        self.replaced_wait_ms_total = 0.0
+        self.load_timings: Dict[str, Dict[str, float]] = {}
+
+        if ready_strategy not in READY_STRATEGIES:
+            raise ValueError(f"알 수 없는 페이지 로딩 판단 방식: {ready_strategy}")
+        if ready_strategy == READY_RESPONSE and not ready_response_url:
+            raise ValueError("response 방식은 ready_response_url 필요")
 
     def _init_browser(self):
         """Playwright 브라우저 초기화"""
@@ -31,6 +112,10 @@ class PamtekAuthPlaywright:
         try:
             self.playwright = sync_playwright().start()
 
+            # 외부 Chromium에 연결되면 그 브라우저의 로그인 세션을 그대로 사용
+            if self.cdp_url and self._connect_over_cdp():
+                return
+
             # Chromium 브라우저 시작 (Chrome과 동일한 엔진)
             self.browser = self.playwright.chromium.launch(
                 headless=self.headless,
@@ -39,15 +124,16 @@ class PamtekAuthPlaywright:
                     '--disable-dev-shm-usage',
                 ]
             )
+            self.browser_mode = 'local'
 
-            # 브라우저 컨텍스트 생성 (쿠키, 세션 관리)
-            self.context = self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
+            # 저장된 세션이 있으면 불러옴
+            storage_state = None
+            if self.storage_state_path and os.path.exists(self.storage_state_path):
+                storage_state = self.storage_state_path
+                logger.info(f"저장된 세션 불러오기: {self.storage_state_path}")
 
-            # 새 페이지 생성
-            self.page = self.context.new_page()
+            self._new_context(storage_state)
+            self._state_restored = storage_state is not None
 
             logger.info("Playwright 브라우저 초기화 성공")
 
@@ -55,18 +141,219 @@ class PamtekAuthPlaywright:
             logger.error(f"Playwright 브라우저 초기화 실패: {e}")
             raise
 
+    def _connect_over_cdp(self) -> bool:
+        """
+        외부 Chromium에 CDP로 연결하고 기본 컨텍스트에 작업용 페이지 생성
+
+        기본 컨텍스트는 외부 브라우저가 소유하므로 서버를 다시 시작해도 쿠키가 남아 있음
+
+        Returns:
+            bool: 연결 성공 여부 (실패하면 직접 실행)
+        """
+        try:
+            self.browser = self.playwright.chromium.connect_over_cdp(self.cdp_url, timeout=5000)
+        except Exception as e:
+            logger.warning(f"외부 브라우저 연결 실패 - 직접 실행: {e}")
+            self.browser = None
+            return False
+
+        if self.browser.contexts:
+            # 외부 브라우저의 기본 컨텍스트 (이전 서버 실행의 로그인 세션 유지)
+            self.context = self.browser.contexts[0]
+            self._external_context = True
+
+            if self.resource_blocker:
+                self.resource_blocker.install(self.context)
+
+            self.page = self.context.new_page()
+            if self.dashboard_capture:
+                self.dashboard_capture.attach(self.page)
+        else:
+            self._new_context()
+
+        # 기존 세션이 살아 있는지 홈 페이지로 먼저 확인
+        self._state_restored = True
+        self.browser_mode = 'cdp'
+        logger.info(f"외부 브라우저 연결: {self.cdp_url}")
+        return True
+
+    def _new_context(self, storage_state: Optional[str] = None):
+        """브라우저 컨텍스트(쿠키, 세션 관리)와 페이지 생성"""
+        self.context = self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            storage_state=storage_state
+        )
+
+        # 이미지/폰트/스타일시트 등 출근 시간과 무관한 요청 차단
+        if self.resource_blocker:
+            self.resource_blocker.install(self.context)
+
+        # 새 페이지 생성
+        self.page = self.context.new_page()
+
+        # 홈 페이지가 출근 시간을 채울 때 호출하는 JSON API 기록
+        if self.dashboard_capture:
+            self.dashboard_capture.attach(self.page)
+
+    def _close_context(self):
+        """페이지와 컨텍스트만 종료 (브라우저 유지, 외부 브라우저의 기본 컨텍스트는 페이지만 종료)"""
+        try:
+            if self.page:
+                self.page.close()
+            if self.context and not self._external_context:
+                self.context.close()
+        except Exception as e:
+            logger.warning(f"컨텍스트 종료 중 오류 (무시): {e}")
+        self.page = None
+        self.context = None
+
+    def is_usable(self) -> bool:
+        """브라우저 연결, 컨텍스트, 페이지가 모두 살아 있는지 (재시작 없이 다시 로그인할 수 있는지)"""
+        try:
+            return bool(
+                self.browser and self.browser.is_connected()
+                and self.context and self.page and not self.page.is_closed()
+            )
+        except Exception:
+            return False
+
+    def relogin(self) -> bool:
+        """
+        세션 만료 시 재로그인 (실행 중인 브라우저 재사용)
+
+        Chromium 프로세스와 Playwright 드라이버는 그대로 두고 컨텍스트만 새로 만들어 폼 로그인.
+        브라우저 연결이 끊겼으면 전체를 다시 시작
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        if not self.browser or not self.browser.is_connected():
+            logger.info("브라우저 연결 없음 - 브라우저 재시작 후 로그인")
+            self.close()
+            return self.login()
+
+        started = time.monotonic()
+        try:
+            if self._external_context:
+                # 외부 브라우저의 기본 컨텍스트는 닫을 수 없으므로 쿠키만 삭제
+                self.context.clear_cookies()
+            else:
+                self._close_context()
+                self._new_context()
+        except Exception as e:
+            logger.error(f"컨텍스트 재생성 실패: {e}")
+            return False
+
+        if not self._login_with_form():
+            return False
+
+        self._save_storage_state()
+        self._record_load('relogin', started)
+        return True
+
     def login(self) -> bool:
         """
         Playwright를 사용한 로그인
 
+        저장된 세션을 불러왔으면 먼저 홈 페이지로 검증하고, 실패할 때만 폼 로그인
+
         Returns:
             bool: 로그인 성공 여부
         """
+        started = time.monotonic()
+        cold_start = self.browser is None
         try:
             self._init_browser()
+        except Exception as e:
+            logger.error(f"로그인 중 오류: {e}")
+            return False
+
+        if self._state_restored:
+            self._state_restored = False
+            if self._restore_session():
+                if cold_start:
+                    self._record_load('cold_start', started)
+                return True
+            logger.info("저장된 세션 만료 - 폼 로그인 진행")
+            self.context.clear_cookies()
+
+        if not self._login_with_form():
+            return False
+
+        self._save_storage_state()
+        if cold_start:
+            self._record_load('cold_start', started)
+        return True
+
+    def _restore_session(self) -> bool:
+        """
+        불러온 세션으로 홈 페이지 접속하여 유효한지 확인
+
+        Returns:
+            bool: 세션 유효 여부
+        """
+        try:
+            logger.info("저장된 세션으로 홈 페이지 접속 중...")
+            self._load_page(
+                f"{self.base_url}/module/HR/home.do",
+                f'{ACTIVE_DAY_READY_SELECTOR}, {LOGIN_FORM_SELECTOR}',
+                'restore',
+                dashboard=True,
+                ready_timeout=self._refresh_ready_timeout()
+            )
+
+            if self.is_logged_in():
+                logger.info("✅ 저장된 세션으로 로그인 확인됨 (폼 로그인 생략)")
+                return True
+
+            return False
+
+        except Exception as e:
+            logger.warning(f"저장된 세션 확인 중 오류: {e}")
+            return False
+
+    def _save_storage_state(self):
+        """로그인 세션(쿠키, 로컬 스토리지)을 파일로 저장"""
+        if not self.storage_state_path:
+            return
+
+        try:
+            directory = os.path.dirname(self.storage_state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            state = self.context.storage_state()
+
+            # 세션 쿠키가 담긴 파일이므로 처음부터 소유자만 읽을 수 있는 임시 파일로 만든 뒤 교체
+            tmp_path = f"{self.storage_state_path}.tmp"
+            if os.path.exists(tmp_path):
+                # 이전에 남은 임시 파일은 권한이 다를 수 있으므로 지우고 새로 생성
+                os.remove(tmp_path)
+            fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.storage_state_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            logger.info(f"로그인 세션 저장: {self.storage_state_path}")
+        except Exception as e:
+            logger.warning(f"로그인 세션 저장 실패 (무시): {e}")
 
+    def _login_with_form(self) -> bool:
+        """
+        로그인 폼 입력으로 로그인
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        started = time.monotonic()
+        try:
             logger.info("로그인 페이지 접속 중...")
-            self.page.goto(self.base_url, wait_until='networkidle')
+            self._load_page(self.base_url, '#userID', 'login_page')
 
             # 사용자 ID 입력 - Playwright는 자동으로 요소를 기다림
             logger.info(f"사용자 ID 입력: {self.user_id}")
@@ -76,12 +363,11 @@ class PamtekAuthPlaywright:
             logger.info("비밀번호 입력 완료")
             self.page.fill('#password', self.password)
 
-            # 입력 완료 후 잠시 대기
-            time.sleep(0.5)
-
-            # 로그인 버튼 클릭
+            # 로그인 버튼 클릭 (fill은 입력 이벤트까지 끝난 뒤 반환, click은 버튼이 클릭 가능해질 때까지 대기)
             logger.info("로그인 버튼 클릭")
+            click_started = time.monotonic()
             self.page.click('#btnLogin')
+            self._count_wait((time.monotonic() - click_started) * 1000, replaced_sleep_ms=500)
 
             # 로그인 처리 완료 대기 - 네트워크 idle 상태까지 대기
             try:
@@ -91,9 +377,11 @@ class PamtekAuthPlaywright:
             except:
                 logger.warning("로그인 폼이 사라지지 않음 - 계속 진행")
 
-            # 추가 대기 - AJAX 요청 완료
-            self.page.wait_for_load_state('networkidle')
-            time.sleep(1)
+            # 추가 대기 - AJAX 요청 완료 후 홈 화면(또는 로그인 폼)이 그려질 때까지
+            if self.ready_strategy == READY_NETWORKIDLE:
+                self.page.wait_for_load_state('networkidle')
+            self._wait_until_ready(f'{DASHBOARD_SELECTOR}, {LOGIN_FORM_SELECTOR}', replaced_sleep_ms=1000)
+            self._record_load('login', started)
 
             # 로그인 성공 확인
             current_url = self.page.url
@@ -134,7 +422,27 @@ class PamtekAuthPlaywright:
             logger.error("페이지가 초기화되지 않음")
             return None
 
-        return self.page.content()
+        with span('content'):
+            return self.page.content()
+
+    def extract_active_day_times(self) -> Optional[Dict[str, str]]:
+        """
+        페이지 안에서 오늘 날짜의 계획/실적 시간만 추출 (HTML 전체 전송 없음)
+
+        Returns:
+            dict: {제목: 시간} (예: {'계획': '09:00~18:00', '실적': '08:45~00:00'}),
+                  페이지 구조가 예상과 다르면 None
+        """
+        if not self.page:
+            logger.error("페이지가 초기화되지 않음")
+            return None
+
+        try:
+            with span('extract'):
+                return self.page.evaluate(ACTIVE_DAY_TIMES_SCRIPT)
+        except Exception as e:
+            logger.warning(f"페이지 내 시간 추출 실패: {e}")
+            return None
 
     def navigate_to_home(self, refresh: bool = True) -> bool:
         """
@@ -146,30 +454,36 @@ class PamtekAuthPlaywright:
         Returns:
             bool: 성공 여부
         """
+        self.session_expired = False
+        self.ready_timed_out = False
         try:
             if not self.page:
                 logger.error("페이지가 초기화되지 않음")
                 return False
 
-            # 현재 페이지 확인
+            # 현재 페이지 확인 (DOM 전체 직렬화 없이 선택자로 확인)
             current_url = self.page.url
-            page_content = self.page.content()
 
             # 로그인 페이지라면 실패
-            if 'login' in current_url.lower() or 'loginForm' in page_content:
+            if 'login' in current_url.lower() or self._has_login_form():
                 logger.error("로그인 페이지에 있음 - 세션 만료")
+                self.session_expired = True
                 return False
 
             # 이미 홈 페이지에 있으면
-            if 'dash-layout' in page_content or 'item-dash' in page_content:
+            if self._has_dashboard():
                 if refresh:
                     logger.info(f"홈 페이지 새로고침 중: {current_url}")
-                    self.page.reload(wait_until='networkidle')
-                    time.sleep(1)
+                    ready = self._load_page(
+                        None, f'{ACTIVE_DAY_READY_SELECTOR}, {LOGIN_FORM_SELECTOR}', 'reload',
+                        replaced_sleep_ms=1000, dashboard=True, ready_timeout=self._refresh_ready_timeout()
+                    )
+                    self.ready_timed_out = not ready
 
                     # 새로고침 후 로그인 페이지로 돌아갔는지 확인
-                    if 'loginForm' in self.page.content():
+                    if self._has_login_form():
                         logger.error("새로고침 후 세션 만료됨")
+                        self.session_expired = True
                         return False
 
                     logger.info("페이지 새로고침 완료")
@@ -184,9 +498,172 @@ class PamtekAuthPlaywright:
             logger.error(f"홈 페이지 확인 중 오류: {e}")
             return False
 
+    def _refresh_ready_timeout(self) -> Optional[float]:
+        """홈 화면 새로고침 후 출근 시간 요소 대기 상한 (networkidle만 짧게 제한, 그 외 ready_timeout)"""
+        return REFRESH_READY_TIMEOUT if self.ready_strategy == READY_NETWORKIDLE else None
+
+    def _load_page(self, url: Optional[str], ready_selector: str, kind: str,
+                   replaced_sleep_ms: float = 0, dashboard: bool = False,
+                   ready_timeout: Optional[float] = None) -> bool:
+        """
+        페이지 이동(url이 None이면 새로고침) 후 ready_strategy에 따라 준비될 때까지 대기
+
+        이동 자체의 시간 초과(goto/reload)는 그대로 호출한 쪽으로 전달
+
+        Args:
+            url: 이동할 URL, None이면 현재 페이지 새로고침
+            ready_selector: 준비 완료로 볼 요소 선택자
+            kind: 시간 집계 구분 ('reload', 'login_page' 등)
+            replaced_sleep_ms: 이 대기로 대체한 기존 고정 대기 시간
+            dashboard: 홈 화면 로딩 여부 (response 방식은 홈 화면일 때만 데이터 응답을 기다림)
+            ready_timeout: 요소 대기 상한 (초, 기본값 self.ready_timeout)
+
+        Returns:
+            bool: ready_timeout 안에 준비되었으면 True
+        """
+        started = time.monotonic()
+        wait_until = 'networkidle' if self.ready_strategy == READY_NETWORKIDLE else 'domcontentloaded'
+
+        watch_response = dashboard and self.ready_strategy == READY_RESPONSE
+        responses = []
+
+        def on_response(response):
+            if fnmatch.fnmatch(response.url, self.ready_response_url):
+                responses.append(response.url)
+
+        if watch_response:
+            self.page.on('response', on_response)
+        try:
+            if url:
+                self.page.goto(url, wait_until=wait_until)
+            else:
+                self.page.reload(wait_until=wait_until)
+            if watch_response:
+                self._wait_for_response(responses)
+        finally:
+            if watch_response:
+                self.page.remove_listener('response', on_response)
+
+        ready = self._wait_until_ready(ready_selector, replaced_sleep_ms=replaced_sleep_ms, timeout=ready_timeout)
+        self._record_load(kind, started)
+        return ready
+
+    def _wait_for_response(self, responses: list) -> bool:
+        """
+        데이터 응답(ready_response_url)이 올 때까지 대기 (로그인 폼이 나타나면 바로 중단)
+
+        Args:
+            responses: 응답 리스너가 채우는 목록
+
+        Returns:
+            bool: ready_timeout 안에 응답을 받았으면 True
+        """
+        deadline = time.monotonic() + self.ready_timeout
+        while not responses:
+            if self._has_login_form():
+                return False
+            if time.monotonic() >= deadline:
+                self.ready_timeouts += 1
+                logger.warning(f"응답 대기 시간 초과 ({self.ready_timeout:.0f}초): {self.ready_response_url}")
+                return False
+            # 대기 중에도 이벤트(응답 리스너)가 처리됨
+            self.page.wait_for_timeout(50)
+        return True
+
+    def _record_load(self, kind: str, started: float):
+        """페이지 로딩 소요 시간 집계"""
+        elapsed_ms = (time.monotonic() - started) * 1000
+        timing = self.load_timings.setdefault(kind, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0})
+        timing['count'] += 1
+        timing['total_ms'] += elapsed_ms
+        timing['max_ms'] = max(timing['max_ms'], elapsed_ms)
+        timing['last_ms'] = elapsed_ms
+        record(kind, elapsed_ms / 1000)
+        logger.info(f"페이지 로딩 ({kind}, {self.ready_strategy}): {elapsed_ms:.0f}ms")
+
+    def _wait_until_ready(self, selector: str, replaced_sleep_ms: float = 0,
+                          timeout: Optional[float] = None) -> bool:
+        """
+        선택자에 맞는 요소가 나타날 때까지 대기 (고정 sleep 대신)
+
+        Args:
+            selector: 대기할 요소 선택자
+            replaced_sleep_ms: 이 대기로 대체한 기존 고정 대기 시간 (절약 시간 집계용)
+            timeout: 대기 상한 (초, 기본값 self.ready_timeout)
+
+        Returns:
+            bool: 상한 안에 나타났으면 True
+        """
+        timeout = self.ready_timeout if timeout is None else min(timeout, self.ready_timeout)
+        started = time.monotonic()
+        try:
+            self.page.wait_for_selector(selector, state='attached', timeout=timeout * 1000)
+            ready = True
+        except Exception:
+            self.ready_timeouts += 1
+            if timeout < self.ready_timeout:
+                # 짧게 제한한 대기 - 요소가 없는 구조면 매번 발생하므로 경고하지 않음
+                logger.debug(f"요소 대기 상한 도달 ({timeout:.1f}초): {selector}")
+            else:
+                logger.warning(f"요소 대기 시간 초과 ({timeout:.0f}초): {selector}")
+            ready = False
+
+        self._count_wait((time.monotonic() - started) * 1000, replaced_sleep_ms)
+        return ready
+
+    def _count_wait(self, elapsed_ms: float, replaced_sleep_ms: float = 0):
+        """
+        대기 시간 집계 (고정 sleep을 대체한 대기만 절약 시간 계산에 포함)
+
+        Args:
+            elapsed_ms: 실제 대기 시간
+            replaced_sleep_ms: 이 대기로 대체한 기존 고정 대기 시간 (없으면 0)
+        """
+        self.ready_waits += 1
+        self.ready_wait_ms_total += elapsed_ms
+        if replaced_sleep_ms:
+            self.fixed_sleep_ms_replaced += replaced_sleep_ms
+            self.replaced_wait_ms_total += elapsed_ms
+        logger.debug(f"요소 대기 {elapsed_ms:.0f}ms (기존 고정 대기 {replaced_sleep_ms:.0f}ms)")
+
+    def get_wait_stats(self) -> Dict[str, any]:
+        """
+        고정 sleep 대신 요소 대기로 바꾼 효과와 로딩 판단 방식별 페이지 로딩 시간 (헬스 체크용)
+
+        saved_ms_total: 기존 고정 대기 합계 - 그 고정 대기를 대체한 실제 대기 합계
+        """
+        return {
+            'ready_waits': self.ready_waits,
+            'ready_timeouts': self.ready_timeouts,
+            'ready_wait_avg_ms': round(self.ready_wait_ms_total / self.ready_waits, 1) if self.ready_waits else None,
+            'fixed_sleep_ms_replaced': round(self.fixed_sleep_ms_replaced),
+            'saved_ms_total': round(self.fixed_sleep_ms_replaced - self.replaced_wait_ms_total),
+            'ready_strategy': self.ready_strategy,
+            'loads': {
+                kind: {
+                    'count': timing['count'],
+                    'avg_ms': round(timing['total_ms'] / timing['count'], 1),
+                    'max_ms': round(timing['max_ms'], 1),
+                    'last_ms': round(timing['last_ms'], 1)
+                }
+                for kind, timing in self.load_timings.items()
+            }
+        }
+
+    def _has_login_form(self) -> bool:
+        """로그인 폼 요소 존재 여부"""
+        return self.page.query_selector(LOGIN_FORM_SELECTOR) is not None
+
+    def _has_dashboard(self) -> bool:
+        """홈 대시보드 요소 존재 여부"""
+        return self.page.query_selector(DASHBOARD_SELECTOR) is not None
+
     def is_logged_in(self) -> bool:
         """
-        현재 로그인 상태 확인
+        현재 로그인 상태 확인 (페이지 HTML 전체 검사)
+
+        매 요청마다 부르기엔 무거우므로 SessionLiveness가 없을 때만 사용
+        (새로고침하지 않은 페이지라면 마지막으로 불러온 시점의 상태)
 
         Returns:
             bool: 로그인 상태
@@ -220,17 +697,13 @@ class PamtekAuthPlaywright:
     def close(self):
         """브라우저 종료"""
         try:
-            if self.page:
-                self.page.close()
-                self.page = None
-
-            if self.context:
-                self.context.close()
-                self.context = None
+            self._close_context()
 
+            # CDP로 연결한 브라우저는 연결만 끊고 프로세스와 기본 컨텍스트는 유지
             if self.browser:
                 self.browser.close()
                 self.browser = None
+            self._external_context = False
 
             if self.playwright:
                 self.playwright.stop()
@@ -0,0 +1,299 @@
+"""
+Playwright async API 기반 Pamtek HR 로그인 모듈
+하나의 이벤트 루프에서 여러 페이지/컨텍스트를 동시에 다루기 위한 asyncio 버전
+"""
+import logging
+from typing import Optional
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+
+from .auth_playwright import (
+    ACTIVE_DAY_READY_SELECTOR, DASHBOARD_SELECTOR, LOGIN_FORM_SELECTOR, REFRESH_READY_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PamtekAuthPlaywrightAsync:
+    """
+    Playwright async API 기반 Pamtek HR 인증 클래스
+
+    PamtekAuthPlaywright와 같은 로그인/이동 동작을 코루틴으로 제공.
+    page 인자를 받는 메서드는 open_page()로 연 추가 페이지에도 사용할 수 있음
+    (같은 컨텍스트라 로그인 세션 공유).
+    browser를 넘기면 그 브라우저에 컨텍스트만 만들고, close() 시 브라우저는 유지.
+
+    사용 예:
+        async with PamtekAuthPlaywrightAsync(user_id, password) as auth:
+            if await auth.login():
+                parser = PamtekParserPlaywrightAsync(auth)
+                status = await parser.get_attendance_status()
+    """
+
+    def __init__(self, user_id: str, password: str, headless: bool = True,
+                 browser: Optional[Browser] = None, ready_timeout: float = 5.0,
+                 base_url: str = "https://hr.pamtek.com"):
+        self.user_id = user_id
+        self.password = password
+        self.headless = headless
+        self.base_url = base_url.rstrip('/')
+        self.playwright = None
+        self.browser: Optional[Browser] = browser
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self._owns_browser = browser is None
+        self.ready_timeout = ready_timeout
+
+    async def __aenter__(self) -> 'PamtekAuthPlaywrightAsync':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _init_browser(self):
+        """Playwright 브라우저 초기화 (공유 브라우저면 컨텍스트만 생성)"""
+        if self.context:
+            return
+
+        try:
+            if not self.browser:
+                self.playwright = await async_playwright().start()
+
+                # Chromium 브라우저 시작 (Chrome과 동일한 엔진)
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage',
+                    ]
+                )
+
+            # 브라우저 컨텍스트 생성 (쿠키, 세션 관리)
+            self.context = await self.browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            )
+
+            # 새 페이지 생성
+            self.page = await self.context.new_page()
+
+            logger.info("Playwright(async) 브라우저 초기화 성공")
+
+        except Exception as e:
+            logger.error(f"Playwright(async) 브라우저 초기화 실패: {e}")
+            raise
+
+    async def open_page(self) -> Page:
+        """
+        같은 컨텍스트(로그인 세션 공유)에 홈 페이지를 연 새 페이지 생성
+
+        Returns:
+            Page: 새 페이지 (사용 후 close() 필요)
+        """
+        await self._init_browser()
+        page = await self.context.new_page()
+        await page.goto(f"{self.base_url}/module/HR/home.do", wait_until='networkidle')
+        return page
+
+    async def login(self) -> bool:
+        """
+        Playwright를 사용한 로그인
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        try:
+            await self._init_browser()
+            page = self.page
+
+            logger.info("로그인 페이지 접속 중...")
+            await page.goto(self.base_url, wait_until='networkidle')
+
+            # 사용자 ID 입력 - Playwright는 자동으로 요소를 기다림
+            logger.info(f"사용자 ID 입력: {self.user_id}")
+            await page.fill('#userID', self.user_id)
+
+            # 비밀번호 입력
+            logger.info("비밀번호 입력 완료")
+            await page.fill('#password', self.password)
+
+            # 로그인 버튼 클릭 (click은 버튼이 클릭 가능해질 때까지 대기)
+            logger.info("로그인 버튼 클릭")
+            await page.click('#btnLogin')
+
+            # 로그인 처리 완료 대기 - 네트워크 idle 상태까지 대기
+            try:
+                # 로그인 폼이 사라질 때까지 대기 (최대 10초)
+                await page.wait_for_selector('#loginForm', state='hidden', timeout=10000)
+                logger.info("로그인 폼 사라짐 확인")
+            except Exception:
+                logger.warning("로그인 폼이 사라지지 않음 - 계속 진행")
+
+            # 추가 대기 - AJAX 요청 완료 후 홈 화면(또는 로그인 폼)이 그려질 때까지
+            await page.wait_for_load_state('networkidle')
+            await self._wait_until_ready(page, f'{DASHBOARD_SELECTOR}, {LOGIN_FORM_SELECTOR}')
+
+            # 로그인 성공 확인
+            current_url = page.url
+            page_content = await page.content()
+
+            logger.info(f"로그인 후 URL: {current_url}")
+
+            # 로그인 페이지로 돌아갔는지 확인
+            if 'loginForm' in page_content or 'login' in current_url.lower():
+                logger.error("로그인 실패 - 세션 없음")
+                return False
+
+            # 홈 페이지 내용 확인
+            if 'dash-layout' in page_content or 'item-dash' in page_content:
+                logger.info("✅ 로그인 성공! 홈 페이지 확인됨")
+                return True
+
+            # URL로 확인
+            if 'home.do' in current_url or '/module/HR/' in current_url:
+                logger.info("✅ 로그인 성공! (URL 확인)")
+                return True
+
+            logger.warning(f"예상치 못한 상태: {current_url}")
+            return False
+
+        except Exception as e:
+            logger.error(f"로그인 중 오류: {e}")
+            return False
+
+    async def get_page_source(self, page: Optional[Page] = None) -> Optional[str]:
+        """
+        페이지의 HTML 소스 반환
+
+        Args:
+            page: 대상 페이지 (기본값: 로그인한 페이지)
+
+        Returns:
+            str: HTML 소스 또는 None
+        """
+        page = page or self.page
+        if not page:
+            logger.error("페이지가 초기화되지 않음")
+            return None
+
+        return await page.content()
+
+    async def navigate_to_home(self, refresh: bool = True, page: Optional[Page] = None) -> bool:
+        """
+        홈 페이지로 이동 또는 새로고침
+
+        Args:
+            refresh: True면 페이지를 새로고침하여 최신 데이터 가져오기 (기본값: True)
+            page: 대상 페이지 (기본값: 로그인한 페이지)
+
+        Returns:
+            bool: 성공 여부
+        """
+        page = page or self.page
+        try:
+            if not page:
+                logger.error("페이지가 초기화되지 않음")
+                return False
+
+            # 현재 페이지 확인
+            current_url = page.url
+            page_content = await page.content()
+
+            # 로그인 페이지라면 실패
+            if 'login' in current_url.lower() or 'loginForm' in page_content:
+                logger.error("로그인 페이지에 있음 - 세션 만료")
+                return False
+
+            # 이미 홈 페이지에 있으면
+            if 'dash-layout' in page_content or 'item-dash' in page_content:
+                if refresh:
+                    logger.info(f"홈 페이지 새로고침 중: {current_url}")
+                    await page.reload(wait_until='networkidle')
+                    await self._wait_until_ready(
+                        page, f'{ACTIVE_DAY_READY_SELECTOR}, {LOGIN_FORM_SELECTOR}', timeout=REFRESH_READY_TIMEOUT
+                    )
+
+                    # 새로고침 후 로그인 페이지로 돌아갔는지 확인
+                    if 'loginForm' in await page.content():
+                        logger.error("새로고침 후 세션 만료됨")
+                        return False
+
+                    logger.info("페이지 새로고침 완료")
+                else:
+                    logger.info(f"이미 홈 페이지에 있음: {current_url}")
+                return True
+
+            logger.warning(f"예상치 못한 페이지: {current_url}")
+            return False
+
+        except Exception as e:
+            logger.error(f"홈 페이지 확인 중 오류: {e}")
+            return False
+
+    async def _wait_until_ready(self, page: Page, selector: str, timeout: Optional[float] = None) -> bool:
+        """선택자에 맞는 요소가 나타날 때까지 대기 (고정 sleep 대신, timeout 상한 초과 시 False)"""
+        timeout = self.ready_timeout if timeout is None else min(timeout, self.ready_timeout)
+        try:
+            await page.wait_for_selector(selector, state='attached', timeout=timeout * 1000)
+            return True
+        except Exception:
+            if timeout < self.ready_timeout:
+                logger.debug(f"요소 대기 상한 도달 ({timeout:.1f}초): {selector}")
+            else:
+                logger.warning(f"요소 대기 시간 초과 ({timeout:.0f}초): {selector}")
+            return False
+
+    async def is_logged_in(self) -> bool:
+        """
+        현재 로그인 상태 확인
+
+        Returns:
+            bool: 로그인 상태
+        """
+        if not self.page:
+            return False
+
+        try:
+            current_url = self.page.url
+            page_content = await self.page.content()
+
+            # URL에 login이 있으면 로그아웃 상태
+            if 'login' in current_url.lower():
+                return False
+
+            # 페이지에 loginForm이 있으면 로그아웃 상태
+            if 'loginForm' in page_content:
+                return False
+
+            # 홈 페이지 요소가 있으면 로그인 상태
+            if 'dash-layout' in page_content or 'item-dash' in page_content:
+                return True
+
+            # 그 외의 경우는 안전하게 False 반환
+            return False
+
+        except Exception as e:
+            logger.error(f"로그인 상태 확인 중 오류: {e}")
+            return False
+
+    async def close(self):
+        """브라우저 종료 (공유 브라우저면 컨텍스트만 종료)"""
+        try:
+            if self.page:
+                await self.page.close()
+                self.page = None
+
+            if self.context:
+                await self.context.close()
+                self.context = None
+
+            if self.browser and self._owns_browser:
+                await self.browser.close()
+                self.browser = None
+
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
+            logger.info("브라우저 종료 완료")
+        except Exception as e:
+            logger.warning(f"브라우저 종료 중 오류 (무시): {e}")
@@ -11,19 +11,27 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 import time
 
 logger = logging.getLogger(__name__)
 
+# 오늘 날짜의 출근 시간 / 로그인 폼 / 홈 대시보드 (고정 sleep 대신 대기 기준)
+ACTIVE_DAY_READY = (By.CSS_SELECTOR, 'div.item-day.active .time-wrap')
+LOGIN_FORM = (By.ID, 'loginForm')
+DASHBOARD = (By.CSS_SELECTOR, '[class*="dash-layout"], [class*="item-dash"]')
+
 
 class PamtekAuthSelenium:
     """Selenium 기반 Pamtek HR 인증 클래스"""
 
-    def __init__(self, user_id: str, password: str, headless: bool = True):
+    def __init__(self, user_id: str, password: str, headless: bool = True, ready_timeout: float = 10.0,
+                 base_url: str = "https://hr.pamtek.com"):
         self.user_id = user_id
         self.password = password
         self.headless = headless
-        self.base_url = "https://hr.pamtek.com"
+        self.ready_timeout = ready_timeout
+        self.base_url = base_url.rstrip('/')
         self.driver = None
 
     def _init_driver(self):
@@ -62,10 +70,7 @@ class PamtekAuthSelenium:
             logger.info("로그인 페이지 접속 중...")
             self.driver.get(self.base_url)
 
-            # 페이지 로딩 대기
-            time.sleep(2)
-
-            # 사용자 ID 입력
+            # 사용자 ID 입력 (입력란이 나타날 때까지 대기)
             user_id_field = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.ID, "userID"))
             )
@@ -87,40 +92,31 @@ class PamtekAuthSelenium:
             )
             logger.info("비밀번호 입력 완료")
 
-            # 입력 완료 후 잠시 대기
-            time.sleep(1)
-
             # 로그인 버튼 클릭
             login_button = self.driver.find_element(By.ID, "btnLogin")
             login_button.click()
             logger.info("로그인 버튼 클릭")
 
             # AJAX 로그인 처리 완료 대기
-            # JavaScript가 실행되고 페이지가 변경될 때까지 대기
-            time.sleep(3)
+            # 로그인 폼이 사라지고 홈 대시보드가 나타날 때까지 (고정 대기 없음)
+            started = time.monotonic()
+            try:
+                WebDriverWait(self.driver, self.ready_timeout).until(
+                    EC.invisibility_of_element_located(LOGIN_FORM)
+                )
+                logger.info("로그인 폼 사라짐 - 로그인 성공")
+                WebDriverWait(self.driver, self.ready_timeout).until(
+                    EC.presence_of_element_located(DASHBOARD)
+                )
+            except TimeoutException:
+                logger.warning("로그인 후 홈 화면 대기 시간 초과 - 계속 진행")
+            logger.info(f"로그인 처리 대기 {(time.monotonic() - started) * 1000:.0f}ms (기존 고정 대기 최소 5000ms)")
 
             # 디버깅: 로그인 직후 페이지 저장
             with open('after_login_click.html', 'w', encoding='utf-8') as f:
                 f.write(self.driver.page_source)
             logger.info("디버깅: after_login_click.html 저장됨")
 
-            # 로그인 후 페이지 변화 확인
-            # 브라우저에서는 JavaScript가 비동기로 처리하므로 충분히 대기
-            max_attempts = 10
-            for i in range(max_attempts):
-                current_url = self.driver.current_url
-                page_source = self.driver.page_source
-
-                logger.info(f"시도 {i+1}/{max_attempts}: URL={current_url}")
-
-                # 로그인 폼이 사라졌는지 확인
-                if 'loginForm' not in page_source:
-                    logger.info("로그인 폼 사라짐 - 로그인 성공")
-                    time.sleep(2)
-                    break
-
-                time.sleep(1)
-
             # 최종 확인 - 별도 네비게이션 없이 현재 페이지 확인
             final_url = self.driver.current_url
             page_source = self.driver.page_source
@@ -199,7 +195,20 @@ class PamtekAuthSelenium:
                 if refresh:
                     logger.info(f"홈 페이지 새로고침 중: {current_url}")
                     self.driver.refresh()
-                    time.sleep(2)  # 페이지 로딩 대기
+
+                    # 출근 시간(또는 세션 만료 시 로그인 폼)이 표시될 때까지 대기
+                    # time-wrap이 없는 구조에서 매번 오래 막히지 않도록 기존 고정 대기(2초)로 상한 제한
+                    started = time.monotonic()
+                    try:
+                        WebDriverWait(self.driver, min(self.ready_timeout, 2.0)).until(
+                            EC.any_of(
+                                EC.presence_of_element_located(ACTIVE_DAY_READY),
+                                EC.presence_of_element_located(LOGIN_FORM)
+                            )
+                        )
+                    except TimeoutException:
+                        logger.info("새로고침 후 출근 시간 표시 대기 상한 도달 - 계속 진행")
+                    logger.info(f"새로고침 대기 {(time.monotonic() - started) * 1000:.0f}ms (기존 고정 대기 2000ms)")
 
                     # 새로고침 후 로그인 페이지로 돌아갔는지 확인
                     if 'loginForm' in self.driver.page_source:
@@ -0,0 +1,166 @@
+"""
+브라우저 전담 작업 스레드
+Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+브라우저 접근을 하나의 스레드로 모으고 다른 스레드는 작업 큐로 요청
+"""
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+from .metrics import Timings, record
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류
+JOB_REFRESH = 'refresh'          # 출근 상태 새로고침
+JOB_RELOGIN = 'relogin'          # 브라우저 재초기화 + 로그인
+JOB_KEEPALIVE = 'keepalive'      # 세션 유지 (가벼운 요청, 만료 시 재로그인)
+
+
+class WorkerBusyError(Exception):
+    """작업 큐가 가득 참 (backpressure)"""
+
+
+class _Job:
+    """작업 큐 항목"""
+
+    def __init__(self, job_type: str, args: tuple, kwargs: dict):
+        self.job_type = job_type
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+        # 작업 스레드에서 측정한 단계별 시간 (요청 스레드가 future.timings로 확인)
+        self.timings = Timings()
+        self.future.timings = self.timings
+
+
+class BrowserWorker(threading.Thread):
+    """
+    브라우저 소유 스레드
+
+    - 작업 종류별 handler를 이 스레드에서만 실행 (브라우저 생성/사용/종료 모두)
+    - submit()은 Future를 반환, 큐가 가득 차면 WorkerBusyError
+    - 큐 대기 시간 통계 제공
+    - handler 안의 metrics.span() 측정값은 Future.timings에 기록 (큐 대기 시간은 'queue')
+    """
+
+    def __init__(self, handlers: Dict[str, Callable], max_queue: int = 16,
+                 on_stop: Optional[Callable[[], None]] = None):
+        super().__init__(name='BrowserWorker', daemon=True)
+        self.handlers = handlers
+        self.max_queue = max_queue
+        self.on_stop = on_stop
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self.current_job: Optional[str] = None
+        self.jobs_processed = 0
+        self.jobs_failed = 0
+        self.jobs_rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.queue_wait_last = 0.0
+
+    def submit(self, job_type: str, *args, **kwargs) -> Future:
+        """
+        작업 요청
+
+        Args:
+            job_type: 작업 종류 (JOB_REFRESH, JOB_RELOGIN, JOB_KEEPALIVE)
+
+        Returns:
+            Future: handler 결과
+
+        Raises:
+            WorkerBusyError: 작업 큐가 가득 참
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+
+        if not self.is_alive():
+            raise RuntimeError("브라우저 작업 스레드가 실행 중이 아님")
+
+        job = _Job(job_type, args, kwargs)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._stats_lock:
+                self.jobs_rejected += 1
+            raise WorkerBusyError(f"브라우저 작업 대기열 가득 참 ({self.max_queue}건)")
+
+        return job.future
+
+    def call(self, job_type: str, *args, timeout: Optional[float] = None, **kwargs):
+        """작업 요청 후 결과까지 대기"""
+        return self.submit(job_type, *args, **kwargs).result(timeout)
+
+    def run(self):
+        logger.info(f"브라우저 작업 스레드 시작 (대기열 최대 {self.max_queue}건)")
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    break
+                self._execute(job)
+        finally:
+            if self.on_stop:
+                try:
+                    self.on_stop()
+                except Exception as e:
+                    logger.warning(f"브라우저 종료 중 오류 (무시): {e}")
+            logger.info("브라우저 작업 스레드 종료")
+
+    def _execute(self, job: _Job):
+        """작업 1건 실행"""
+        if not job.future.set_running_or_notify_cancel():
+            return
+
+        waited = time.monotonic() - job.enqueued_at
+        with self._stats_lock:
+            self.queue_wait_total += waited
+            self.queue_wait_max = max(self.queue_wait_max, waited)
+            self.queue_wait_last = waited
+
+        self.current_job = job.job_type
+        try:
+            with job.timings.activate():
+                record('queue', waited)
+                result = self.handlers[job.job_type](*job.args, **job.kwargs)
+        except BaseException as e:
+            logger.error(f"브라우저 작업 실패 ({job.job_type}): {e}")
+            with self._stats_lock:
+                self.jobs_failed += 1
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+        finally:
+            self.current_job = None
+            with self._stats_lock:
+                self.jobs_processed += 1
+
+    def stop(self, timeout: Optional[float] = 30.0):
+        """남은 작업 처리 후 스레드 종료 (브라우저 종료는 on_stop에서)"""
+        if not self.is_alive():
+            return
+        self._queue.put(None)
+        self.join(timeout)
+
+    def get_stats(self) -> Dict[str, any]:
+        """작업 스레드 상태 (헬스 체크용)"""
+        with self._stats_lock:
+            processed = self.jobs_processed
+            return {
+                'running': self.is_alive(),
+                'current_job': self.current_job,
+                'queue_depth': self._queue.qsize(),
+                'max_queue': self.max_queue,
+                'jobs_processed': processed,
+                'jobs_failed': self.jobs_failed,
+                'jobs_rejected': self.jobs_rejected,
+                'queue_wait_avg_ms': round(self.queue_wait_total / processed * 1000, 1) if processed else 0.0,
+                'queue_wait_max_ms': round(self.queue_wait_max * 1000, 1),
+                'queue_wait_last_ms': round(self.queue_wait_last * 1000, 1)
+            }
@@ -0,0 +1,137 @@
+"""
+로그인 서킷 브레이커
+HR 서버 장애나 비밀번호 변경 시 요청마다 브라우저를 다시 띄워 로그인을 반복하지 않도록
+연속 실패 후에는 지수 백오프(+지터) 동안 로그인 시도를 바로 거절
+"""
+import random
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'        # 정상 - 로그인 시도 허용
+STATE_OPEN = 'open'            # 차단 - retry_at 전까지 즉시 거절
+STATE_HALF_OPEN = 'half_open'  # 시험 - 한 번만 시도해 보고 결과로 closed/open 결정
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 로그인 시도 거절"""
+
+    def __init__(self, retry_in: float):
+        self.retry_in = retry_in
+        super().__init__(f"로그인 연속 실패로 일시 중단 ({retry_in:.0f}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """
+    로그인 서킷 브레이커
+
+    - closed: failure_threshold번 연속 실패하면 open
+    - open: base_delay × 2^(연속 open 횟수 - 1) (최대 max_delay, ± jitter 비율)초 동안 즉시 거절
+    - half_open: 대기 시간이 지나면 한 번만 시도 허용, 성공하면 closed, 실패하면 다시 open (대기 시간 2배)
+    """
+
+    def __init__(self, failure_threshold: int = 3, base_delay: float = 30.0,
+                 max_delay: float = 1800.0, jitter: float = 0.2):
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opens = 0
+        self.retry_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.rejected = 0
+
+    def retry_in(self) -> float:
+        """다음 시도까지 남은 시간 (초, 열려 있지 않으면 0)"""
+        if self.state != STATE_OPEN or self.retry_at is None:
+            return 0.0
+        return max(0.0, self.retry_at - time.monotonic())
+
+    def is_open(self) -> bool:
+        """지금 시도하면 거절되는지"""
+        return self.state == STATE_OPEN and self.retry_in() > 0
+
+    def raise_if_open(self):
+        """
+        열려 있으면 상태 전환 없이 바로 거절 (시도 전 빠른 확인용)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음
+        """
+        with self._lock:
+            retry_in = self.retry_in()
+            if self.state == STATE_OPEN and retry_in > 0:
+                self.rejected += 1
+                raise CircuitOpenError(retry_in)
+
+    def before_call(self):
+        """
+        시도 전 확인 (open이면 거절, 대기 시간이 지났으면 half_open으로 전환)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음
+        """
+        with self._lock:
+            if self.state == STATE_OPEN:
+                retry_in = self.retry_in()
+                if retry_in > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(retry_in)
+                self.state = STATE_HALF_OPEN
+                logger.info("로그인 서킷 half-open - 재시도 1회 허용")
+
+    def record_success(self):
+        """로그인 성공 - closed로 전환하고 실패/백오프 초기화"""
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                logger.info("로그인 서킷 closed - 로그인 정상화")
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.opens = 0
+            self.retry_at = None
+            self.last_error = None
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        """로그인 실패 - 연속 실패가 한도에 닿았거나 half_open 시도였으면 open"""
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error) if error else None
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opens += 1
+                delay = min(self.max_delay, self.base_delay * 2 ** (self.opens - 1))
+                delay *= 1 + random.uniform(-self.jitter, self.jitter)
+                self.state = STATE_OPEN
+                self.retry_at = time.monotonic() + delay
+                logger.error(f"로그인 {self.failures}회 연속 실패 - 서킷 open ({delay:.0f}초 동안 로그인 중단)")
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        서킷 브레이커를 거쳐 fn 실행 (예외 발생 시 실패로 기록 후 다시 발생)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음
+        """
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def get_stats(self) -> Dict[str, any]:
+        """서킷 상태 (헬스 체크용)"""
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'retry_in_seconds': round(self.retry_in(), 1),
+            'rejected': self.rejected,
+            'last_error': self.last_error
+        }
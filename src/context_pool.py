@@ -0,0 +1,266 @@
+"""
+다중 계정 BrowserContext 풀
+Chromium 프로세스 하나를 공유하고 계정마다 격리된 BrowserContext 사용
+"""
+import asyncio
+import hmac
+import time
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from playwright.async_api import async_playwright, Browser
+
+from .auth_playwright_async import PamtekAuthPlaywrightAsync
+from .parser_playwright_async import PamtekParserPlaywrightAsync
+
+logger = logging.getLogger(__name__)
+
+
+class _AccountEntry:
+    """풀에 등록된 계정 1개"""
+
+    def __init__(self, auth: PamtekAuthPlaywrightAsync):
+        self.auth = auth
+        self.parser = PamtekParserPlaywrightAsync(auth)
+        self.lock = asyncio.Lock()
+        self.users = 0
+        self.logged_in = False
+        self.last_used = time.monotonic()
+
+
+class BrowserContextPool:
+    """
+    계정별 BrowserContext 풀
+
+    - 브라우저는 하나만 실행, 계정마다 컨텍스트(쿠키/세션) 분리
+    - max_contexts에 도달하면 가장 오래 쓰지 않은 (사용 중이 아닌) 컨텍스트부터 종료 (LRU),
+      모두 사용 중이면 하나가 반납될 때까지 대기
+    - idle_timeout 동안 쓰지 않은 컨텍스트는 evict_interval초마다 백그라운드 작업(evict_idle())으로 정리
+    - 같은 계정의 작업은 계정별 lock으로 순서대로 실행, 다른 계정끼리는 동시 실행
+    - 이미 로그인된 계정이라도 비밀번호가 저장된 것과 다르면 별도 컨텍스트로 로그인에 성공해야만 사용
+
+    사용 예:
+        async with BrowserContextPool(max_contexts=10) as pool:
+            status = await pool.get_attendance_status(user_id, password)
+    """
+
+    def __init__(self, max_contexts: int = 8, idle_timeout: float = 1800.0, headless: bool = True,
+                 evict_interval: Optional[float] = None):
+        self.max_contexts = max_contexts
+        self.idle_timeout = idle_timeout
+        # 유휴 컨텍스트 정리 주기 (기본값: idle_timeout의 1/4, 최대 60초)
+        self.evict_interval = evict_interval if evict_interval is not None else min(60.0, idle_timeout / 4)
+        self._evict_task: Optional[asyncio.Task] = None
+        self.headless = headless
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._entries: 'OrderedDict[str, _AccountEntry]' = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._released = asyncio.Condition(self._lock)
+        self._start_lock = asyncio.Lock()
+        self.evictions = 0
+
+    async def __aenter__(self) -> 'BrowserContextPool':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """공유 브라우저 시작 (동시에 처음 acquire()해도 한 번만 실행)"""
+        if self.browser:
+            return
+
+        async with self._start_lock:
+            # lock을 기다리는 동안 다른 작업이 이미 시작했을 수 있음
+            if self.browser:
+                return
+
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=[
+                    '--no-sandbox',
+                    '--disable-dev-shm-usage',
+                ]
+            )
+            logger.info(f"공유 브라우저 시작 (최대 컨텍스트 {self.max_contexts}개)")
+
+            self._evict_task = asyncio.create_task(self._evict_loop())
+
+    async def _evict_loop(self):
+        """evict_interval마다 유휴 컨텍스트 정리 (close()에서 취소)"""
+        while True:
+            await asyncio.sleep(self.evict_interval)
+            try:
+                evicted = await self.evict_idle()
+                if evicted:
+                    logger.info(f"유휴 컨텍스트 {evicted}개 정리")
+            except Exception as e:
+                logger.warning(f"유휴 컨텍스트 정리 중 오류 (무시): {e}")
+
+    async def _get_entry(self, user_id: str, password: str) -> _AccountEntry:
+        """계정 항목 조회 또는 생성 (LRU 순서 갱신, 사용자 수 증가)"""
+        async with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                await self._evict_lru()
+                auth = PamtekAuthPlaywrightAsync(user_id, password, headless=self.headless, browser=self.browser)
+                entry = _AccountEntry(auth)
+                self._entries[user_id] = entry
+                logger.info(f"계정 컨텍스트 추가: {user_id} ({len(self._entries)}/{self.max_contexts})")
+            self._entries.move_to_end(user_id)
+            entry.users += 1
+            return entry
+
+    async def _evict_lru(self):
+        """컨텍스트 수가 한도 이상이면 사용 중이 아닌 가장 오래된 항목 종료 (self._lock 보유 상태에서 호출)"""
+        while len(self._entries) >= self.max_contexts:
+            victim = next(
+                (uid for uid, entry in self._entries.items() if entry.users == 0),
+                None
+            )
+            if victim is None:
+                logger.info("모든 컨텍스트 사용 중 - 반납 대기")
+                await self._released.wait()
+                continue
+            await self._remove(victim)
+
+    async def _remove(self, user_id: str, evicted: bool = True):
+        entry = self._entries.pop(user_id)
+        await entry.auth.close()
+        if evicted:
+            self.evictions += 1
+        logger.info(f"계정 컨텍스트 종료: {user_id}")
+
+    @asynccontextmanager
+    async def acquire(self, user_id: str, password: str) -> AsyncIterator[_AccountEntry]:
+        """
+        로그인된 계정 항목을 계정 lock을 잡은 상태로 제공
+
+        Raises:
+            RuntimeError: 로그인 실패
+        """
+        await self.start()
+        entry = await self._get_entry(user_id, password)
+
+        try:
+            async with entry.lock:
+                if not hmac.compare_digest(entry.auth.password.encode('utf-8'), password.encode('utf-8')):
+                    await self._login_with_new_password(entry, user_id, password)
+                elif not entry.logged_in or not await entry.auth.is_logged_in():
+                    entry.logged_in = await entry.auth.login()
+                    if not entry.logged_in:
+                        raise RuntimeError(f"로그인 실패: {user_id}")
+
+                yield entry
+        finally:
+            async with self._lock:
+                entry.users -= 1
+                entry.last_used = time.monotonic()
+                self._released.notify_all()
+
+    async def _login_with_new_password(self, entry: _AccountEntry, user_id: str, password: str):
+        """
+        저장된 것과 다른 비밀번호로 요청한 경우 (entry.lock 보유 상태에서 호출)
+
+        기존 세션을 건드리지 않고 새 컨텍스트로 로그인해 보고, 성공했을 때만 항목의 인증을 교체
+        (잘못된 비밀번호로 다른 사람의 세션을 읽거나 저장된 비밀번호를 덮어쓰지 못하도록)
+
+        Raises:
+            RuntimeError: 로그인 실패
+        """
+        auth = PamtekAuthPlaywrightAsync(user_id, password, headless=self.headless, browser=self.browser)
+        try:
+            logged_in = await auth.login()
+        except Exception:
+            await auth.close()
+            raise
+        if not logged_in:
+            await auth.close()
+            raise RuntimeError(f"로그인 실패: {user_id}")
+
+        logger.info(f"계정 비밀번호 변경 확인 - 컨텍스트 교체: {user_id}")
+        previous = entry.auth
+        entry.auth = auth
+        entry.parser = PamtekParserPlaywrightAsync(auth)
+        entry.logged_in = True
+        await previous.close()
+
+    async def get_attendance_status(self, user_id: str, password: str) -> Dict[str, any]:
+        """계정의 오늘 출근/퇴근 상태"""
+        try:
+            async with self.acquire(user_id, password) as entry:
+                return await entry.parser.get_attendance_status()
+        except RuntimeError as e:
+            return {
+                'is_checked_in': False,
+                'is_checked_out': False,
+                'check_in_time': None,
+                'check_out_time': None,
+                'status': 'error',
+                'error': str(e)
+            }
+
+    async def evict_idle(self) -> int:
+        """
+        idle_timeout 동안 쓰지 않은 컨텍스트 종료
+
+        Returns:
+            int: 종료한 컨텍스트 수
+        """
+        now = time.monotonic()
+        async with self._lock:
+            idle = [
+                uid for uid, entry in self._entries.items()
+                if entry.users == 0 and now - entry.last_used > self.idle_timeout
+            ]
+            for uid in idle:
+                await self._remove(uid)
+        return len(idle)
+
+    def get_stats(self) -> Dict[str, any]:
+        """풀 상태"""
+        now = time.monotonic()
+        return {
+            'contexts': len(self._entries),
+            'max_contexts': self.max_contexts,
+            'evictions': self.evictions,
+            'accounts': {
+                uid: {
+                    'logged_in': entry.logged_in,
+                    'busy': entry.users > 0,
+                    'idle_seconds': round(now - entry.last_used, 1)
+                }
+                for uid, entry in self._entries.items()
+            }
+        }
+
+    async def close(self):
+        """모든 컨텍스트와 공유 브라우저 종료"""
+        if self._evict_task:
+            self._evict_task.cancel()
+            try:
+                await self._evict_task
+            except asyncio.CancelledError:
+                pass
+            self._evict_task = None
+
+        async with self._lock:
+            for uid in list(self._entries):
+                await self._remove(uid, evicted=False)
+
+        try:
+            if self.browser:
+                await self.browser.close()
+                self.browser = None
+
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
+            logger.info("공유 브라우저 종료 완료")
+        except Exception as e:
+            logger.warning(f"공유 브라우저 종료 중 오류 (무시): {e}")
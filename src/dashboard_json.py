@@ -0,0 +1,207 @@
+"""
+대시보드 XHR(JSON) 응답 캡처 및 재요청 모듈
+홈 페이지가 item-day/time-wrap을 채울 때 호출하는 API를 기록해 두고,
+새로고침 대신 같은 요청을 세션 쿠키로 다시 보내 JSON으로 출근 시간 조회
+"""
+import re
+import fnmatch
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+from .attendance_html import build_attendance_status
+
+logger = logging.getLogger(__name__)
+
+_TIME_RE = re.compile(r'(\d{1,2}):?(\d{2})')
+
+# 재요청 시 그대로 보낼 요청 헤더
+_REPLAY_HEADERS = ('content-type', 'x-requested-with', 'accept')
+
+
+def normalize_time(value) -> Optional[str]:
+    """
+    JSON 시간 값을 'HH:MM'으로 변환
+
+    '08:45', '0845', '2025-11-17 08:45:00', '-' 등을 처리 ('-'는 그대로)
+
+    Returns:
+        str: 'HH:MM' 또는 '-', 값이 없으면 None
+    """
+    if value is None:
+        return None
+
+    text = str(value).strip()
+    if not text or text == '-':
+        return text or None
+
+    # 날짜가 붙어 있으면 마지막 공백/T 뒤의 시간 부분만 사용
+    text = re.split(r'[ T]', text)[-1]
+    match = _TIME_RE.match(text)
+    if not match:
+        return None
+    return f"{int(match.group(1)):02d}:{match.group(2)}"
+
+
+def normalize_date(value) -> Optional[str]:
+    """'2025-11-17', '2025.11.17', '20251117' 등을 'YYYYMMDD'로 변환"""
+    if value is None:
+        return None
+    digits = re.sub(r'\D', '', str(value))
+    return digits[:8] if len(digits) >= 8 else None
+
+
+def find_records(payload, date_key: str) -> List[Dict]:
+    """JSON 안에서 date_key를 가진 dict를 모두 찾음 (중첩 구조 탐색)"""
+    records = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if date_key in node:
+                records.append(node)
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return records
+
+
+class DashboardJsonCapture:
+    """
+    대시보드 JSON API 캡처/재요청
+
+    1. attach(page)로 페이지의 XHR/fetch 응답 중 url_pattern(fnmatch)에 맞는 JSON 응답 요청을 기록
+    2. fetch_week(context)로 기록한 요청을 context.request로 다시 보내고(렌더링 없음)
+       date_key/check_in_key/check_out_key로 날짜별 실적 시간 추출
+
+    Pamtek 대시보드 API 응답 형식은 배포마다 확인해야 하므로 URL 패턴과 키 이름은 설정으로 받음
+
+    사용 예:
+        capture = DashboardJsonCapture('*/module/HR/*.do', 'workDate', 'inTime', 'outTime')
+        auth = PamtekAuthPlaywright(user_id, password, dashboard_capture=capture)
+    """
+
+    def __init__(self, url_pattern: str, date_key: str, check_in_key: str, check_out_key: str,
+                 timeout: float = 5.0):
+        self.url_pattern = url_pattern
+        self.date_key = date_key
+        self.check_in_key = check_in_key
+        self.check_out_key = check_out_key
+        self.timeout = timeout
+        self.request: Optional[Dict[str, any]] = None
+        self.captures = 0
+        self.replays = 0
+        self.replay_failures = 0
+
+    @property
+    def ready(self) -> bool:
+        """재요청할 API 요청이 기록되어 있는지"""
+        return self.request is not None
+
+    def attach(self, page):
+        """페이지 응답 감시 시작"""
+        page.on('response', self._on_response)
+
+    def _on_response(self, response):
+        request = response.request
+        if request.resource_type not in ('xhr', 'fetch'):
+            return
+        if not fnmatch.fnmatch(response.url, self.url_pattern):
+            return
+        if 'json' not in response.headers.get('content-type', ''):
+            return
+
+        headers = request.headers
+        self.request = {
+            'url': response.url,
+            'method': request.method,
+            'data': request.post_data,
+            'headers': {k: v for k, v in headers.items() if k.lower() in _REPLAY_HEADERS}
+        }
+        self.captures += 1
+        if self.captures == 1:
+            logger.info(f"대시보드 API 요청 기록: {request.method} {response.url}")
+
+    def replay(self, context) -> Optional[any]:
+        """
+        기록한 API 요청을 세션 쿠키로 다시 보내 JSON 반환
+
+        Returns:
+            JSON 값, 실패(세션 만료로 HTML 응답 등)하면 None
+        """
+        if not self.ready or not context:
+            return None
+
+        self.replays += 1
+        try:
+            response = context.request.fetch(
+                self.request['url'],
+                method=self.request['method'],
+                data=self.request['data'],
+                headers=self.request['headers'],
+                max_redirects=0,
+                timeout=self.timeout * 1000
+            )
+            try:
+                if response.status != 200 or 'json' not in response.headers.get('content-type', ''):
+                    logger.warning(f"대시보드 API 응답 이상: HTTP {response.status}")
+                    self.replay_failures += 1
+                    return None
+                return response.json()
+            finally:
+                response.dispose()
+        except Exception as e:
+            logger.warning(f"대시보드 API 재요청 실패: {e}")
+            self.replay_failures += 1
+            return None
+
+    def parse_week(self, payload) -> List[Dict[str, Optional[str]]]:
+        """
+        JSON에서 날짜별 실적 출근/퇴근 시간 목록 추출
+
+        Returns:
+            list: [{'date': 'YYYYMMDD', 'check_in_time': 'HH:MM', 'check_out_time': 'HH:MM'}, ...]
+        """
+        days = []
+        for record in find_records(payload, self.date_key):
+            day = normalize_date(record.get(self.date_key))
+            if not day:
+                continue
+            days.append({
+                'date': day,
+                'check_in_time': normalize_time(record.get(self.check_in_key)),
+                'check_out_time': normalize_time(record.get(self.check_out_key))
+            })
+        return days
+
+    def fetch_status(self, context, today: Optional[date] = None) -> Optional[Dict[str, any]]:
+        """
+        JSON API로 오늘의 출근 상태 조회
+
+        Returns:
+            dict: 출근 상태 정보 ('week'에 날짜별 시간 포함), 오늘 기록을 찾지 못하면 None
+        """
+        payload = self.replay(context)
+        if payload is None:
+            return None
+
+        days = self.parse_week(payload)
+        today_key = (today or date.today()).strftime('%Y%m%d')
+        record = next((day for day in days if day['date'] == today_key), None)
+        if record is None:
+            logger.warning("대시보드 API 응답에 오늘 기록 없음 (키 설정 확인 필요)")
+            self.replay_failures += 1
+            return None
+
+        status = build_attendance_status(record['check_in_time'], record['check_out_time'])
+        status['week'] = days
+        return status
+
+    def get_stats(self) -> Dict[str, any]:
+        """캡처/재요청 통계 (헬스 체크용)"""
+        return {
+            'url': self.request['url'] if self.request else None,
+            'captures': self.captures,
+            'replays': self.replays,
+            'replay_failures': self.replay_failures
+        }
@@ -0,0 +1,155 @@
+"""
+로그인 세션 유지 스레드
+서버의 세션 유휴 만료 시간을 학습해 만료 전에 가벼운 요청으로 세션을 갱신하고,
+이미 만료되었으면 API 요청이 오기 전에 미리 재로그인
+"""
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SessionKeepAlive(threading.Thread):
+    """
+    세션 유지 스레드
+
+    마지막 서버 접촉(SessionLiveness.last_success_at) 이후 interval초가 지나면 keepalive 작업 실행.
+    keepalive 결과로 유휴 만료 시간을 학습:
+    - 세션이 살아 있었으면 그 유휴 시간은 안전 → 만료를 본 적 없으면 interval을 growth배로 늘림
+    - 세션이 만료되어 있었으면 그 유휴 시간이 만료 시간의 상한 → interval = 상한 × safety
+      (로그인 페이지로 리다이렉트되는 등 만료가 확인된 경우만, 네트워크 오류나 5xx는 학습하지 않음)
+    세션 쿠키에 만료 시각이 있으면 만료 직전에도 실행.
+    폴러나 API 요청으로 세션이 계속 쓰이면 keepalive는 실행되지 않음.
+    """
+
+    def __init__(self, submit: Callable[[], Future], get_liveness: Callable[[], any],
+                 initial_interval: float = 300.0, max_interval: float = 3600.0,
+                 growth: float = 1.5, safety: float = 0.8, check_period: float = 15.0,
+                 job_timeout: float = 120.0):
+        super().__init__(name='SessionKeepAlive', daemon=True)
+        self.submit = submit
+        self.get_liveness = get_liveness
+        self.interval = initial_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.safety = safety
+        self.check_period = check_period
+        self.job_timeout = job_timeout
+        self.survived_idle_max: Optional[float] = None
+        self.expired_idle_min: Optional[float] = None
+        self.keepalives = 0
+        self.relogins = 0
+        self.last_run_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def idle_timeout_estimate(self) -> Optional[float]:
+        """학습한 세션 유휴 만료 시간 상한 (만료를 본 적 없으면 None)"""
+        return self.expired_idle_min
+
+    def is_due(self, liveness, now: Optional[float] = None) -> bool:
+        """
+        keepalive를 실행할 때인지
+
+        Args:
+            liveness: SessionLiveness
+            now: 현재 시각 (epoch 초)
+        """
+        now = now or time.time()
+        if liveness.last_success_at is None:
+            return True
+
+        if now - liveness.last_success_at >= self.interval:
+            return True
+
+        expiry = liveness.cookie_expires_at
+        return expiry is not None and expiry - now <= 2 * self.check_period
+
+    def record(self, idle: float, alive: bool):
+        """
+        keepalive 결과로 유휴 만료 시간 학습
+
+        Args:
+            idle: keepalive 직전 마지막 서버 접촉 이후 경과 시간 (초)
+            alive: 세션이 살아 있었는지 (False는 만료가 확인된 경우만 전달)
+        """
+        if alive:
+            self.survived_idle_max = max(self.survived_idle_max or 0.0, idle)
+            if self.expired_idle_min is None:
+                self.interval = min(self.max_interval, max(self.interval, idle) * self.growth)
+        else:
+            self.expired_idle_min = min(self.expired_idle_min or idle, idle)
+            self.interval = max(self.check_period, self.expired_idle_min * self.safety)
+            logger.info(
+                f"세션 유휴 만료 {self.expired_idle_min:.0f}초 이하로 추정 - "
+                f"{self.interval:.0f}초마다 세션 갱신"
+            )
+
+    def run_once(self) -> bool:
+        """
+        필요하면 keepalive 1회 실행
+
+        Returns:
+            bool: 실행했으면 True
+        """
+        liveness = self.get_liveness()
+        if liveness is None:
+            return False
+
+        now = time.time()
+        if not self.is_due(liveness, now):
+            return False
+
+        idle = now - liveness.last_success_at if liveness.last_success_at is not None else None
+        self.keepalives += 1
+        self.last_run_at = now
+        try:
+            result = self.submit().result(timeout=self.job_timeout)
+        except Exception as e:
+            logger.warning(f"세션 유지 작업 실패: {e}")
+            self.last_error = str(e)
+            return True
+
+        self.last_error = None
+        if result.get('relogged_in'):
+            self.relogins += 1
+            logger.info("세션 만료 - 요청 경로 밖에서 재로그인 완료")
+
+        # alive가 None이면 쿠키 만료로 미리 재로그인한 경우 (유휴 만료 학습에 사용하지 않음)
+        # 확인 요청 자체가 실패한 경우는 위에서 작업 실패로 끝나므로 학습하지 않음
+        if idle is not None and result.get('alive') is not None:
+            self.record(idle, result['alive'])
+        return True
+
+    def run(self):
+        logger.info(f"세션 유지 스레드 시작 (초기 주기 {self.interval:.0f}초)")
+        while not self._stop_event.wait(self.check_period):
+            self.run_once()
+        logger.info("세션 유지 스레드 종료")
+
+    def stop(self):
+        """세션 유지 중지"""
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, any]:
+        """세션 유지 상태 (헬스 체크용)"""
+        return {
+            'running': self.is_alive(),
+            'interval': round(self.interval, 1),
+            'idle_timeout_estimate': (
+                round(self.expired_idle_min, 1) if self.expired_idle_min is not None else None
+            ),
+            'survived_idle_max': (
+                round(self.survived_idle_max, 1) if self.survived_idle_max is not None else None
+            ),
+            'keepalives': self.keepalives,
+            'relogins': self.relogins,
+            'last_run_age_seconds': (
+                round(time.time() - self.last_run_at, 1) if self.last_run_at is not None else None
+            ),
+            'last_error': self.last_error
+        }
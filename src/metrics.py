@@ -0,0 +1,255 @@
+"""
+단계별 소요 시간 측정 및 Prometheus 지표 모듈
+요청(또는 브라우저 작업)마다 Timings에 단계별 시간을 모아 Server-Timing 헤더로 반환하고,
+모든 측정값은 히스토그램/카운터로 누적해 /metrics에서 Prometheus 텍스트 형식으로 제공
+
+사용 예:
+    with span('reload'):
+        page.reload()
+
+스레드 간 전달:
+    span()은 현재 스레드에 활성화된 Timings에 기록. 브라우저 작업 스레드는 작업마다 Timings를
+    활성화하고 Future.timings로 돌려주며, 요청 스레드는 merge()로 합침
+"""
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_local = threading.local()
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터 (레이블별)"""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}')
+        return lines
+
+
+class Histogram:
+    """누적 구간 히스토그램 (레이블별, 단위: 초)"""
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 레이블 값 → [구간별 개수..., 합계, 전체 개수]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, seconds: float, *label_values: str):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[i] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[-1] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for label_values, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    labels = _format_labels(self.labels, label_values, f'le="{bound}"')
+                    lines.append(f'{self.name}_bucket{labels} {count}')
+                labels = _format_labels(self.labels, label_values, 'le="+Inf"')
+                lines.append(f'{self.name}_bucket{labels} {series[-1]}')
+                labels = _format_labels(self.labels, label_values)
+                lines.append(f'{self.name}_sum{labels} {series[-2]!r}')
+                lines.append(f'{self.name}_count{labels} {series[-1]}')
+        return lines
+
+
+class Registry:
+    """지표 모음 (/metrics 출력용)"""
+
+    def __init__(self):
+        self._metrics: List = []
+
+    def counter(self, name: str, help_text: str, labels: Iterable[str] = ()) -> Counter:
+        metric = Counter(name, help_text, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labels: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (text/plain; version=0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'pamtek_stage_seconds', '단계별 소요 시간 (초)', labels=('stage',)
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    'pamtek_request_seconds', 'API 요청 처리 시간 (초)', labels=('endpoint', 'code')
+)
+LOGINS = REGISTRY.counter(
+    'pamtek_logins_total', '브라우저 시작 포함 전체 로그인 횟수', labels=('result',)
+)
+RELOGINS = REGISTRY.counter(
+    'pamtek_relogins_total', '브라우저 재사용 재로그인 횟수', labels=('result',)
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    'pamtek_status_cache_requests_total',
+    '출근 상태 캐시 조회 (hit: 캐시, miss: 새로고침, coalesced: 진행 중 새로고침 공유, stale: 기한 초과, '
+    'not_modified: ETag 일치로 304)',
+    labels=('result',)
+)
+UPSTREAM_ERRORS = REGISTRY.counter(
+    'pamtek_upstream_errors_total', 'HR 서버 조회 실패 횟수 (status: 오류 결과, exception: 예외)',
+    labels=('kind',)
+)
+
+
+class Timings:
+    """요청 1건(또는 브라우저 작업 1건)의 단계별 소요 시간"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: Dict[str, float] = {}
+        # span() 블록만의 시간 (안쪽 span() 블록 시간 제외, 단계끼리 겹치지 않음)
+        self.exclusive: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float, exclusive: Optional[float] = None):
+        """단계 시간 추가 (같은 단계가 여러 번이면 합산, exclusive는 span() 블록만 전달)"""
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + seconds
+            if exclusive is not None:
+                self.exclusive[name] = self.exclusive.get(name, 0.0) + exclusive
+
+    def merge(self, other: Optional['Timings']):
+        """다른 스레드에서 측정한 Timings 합치기"""
+        if other is None or other is self:
+            return
+        with other._lock:
+            spans = list(other.spans.items())
+            exclusive = list(other.exclusive.items())
+        with self._lock:
+            for name, seconds in spans:
+                self.spans[name] = self.spans.get(name, 0.0) + seconds
+            for name, seconds in exclusive:
+                self.exclusive[name] = self.exclusive.get(name, 0.0) + seconds
+
+    @contextmanager
+    def activate(self):
+        """이 스레드의 span()이 이 Timings에 기록되도록 활성화"""
+        previous = set_current(self)
+        try:
+            yield self
+        finally:
+            set_current(previous)
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: 'login_check;dur=1.2, reload;dur=812.4')"""
+        with self._lock:
+            return ', '.join(f'{name};dur={seconds * 1000:.1f}' for name, seconds in self.spans.items())
+
+
+def current() -> Optional[Timings]:
+    """이 스레드에 활성화된 Timings (없으면 None)"""
+    return getattr(_local, 'timings', None)
+
+
+def set_current(timings: Optional[Timings]) -> Optional[Timings]:
+    """이 스레드에 Timings 활성화 (이전 값 반환, with 블록을 쓸 수 없는 요청 훅용)"""
+    previous = getattr(_local, 'timings', None)
+    _local.timings = timings
+    return previous
+
+
+def merge(timings: Optional[Timings]):
+    """다른 스레드의 Timings를 이 스레드의 Timings에 합침"""
+    target = current()
+    if target is not None:
+        target.merge(timings)
+
+
+def record(name: str, seconds: float, exclusive: Optional[float] = None):
+    """
+    이미 잰 시간을 단계 시간으로 기록 (히스토그램 + 활성 Timings)
+
+    페이지 로딩처럼 따로 잰 시간은 서로 겹칠 수 있으므로(relogin ⊃ login ⊃ login_page)
+    exclusive 없이 기록하고, 겹치지 않는 시간은 span()만 기록
+    """
+    STAGE_SECONDS.observe(seconds, name)
+    timings = current()
+    if timings is not None:
+        timings.add(name, seconds, exclusive)
+
+
+def _open_spans() -> List[float]:
+    """이 스레드에서 진행 중인 span()별 안쪽 span() 시간 합계 (바깥쪽부터)"""
+    stack = getattr(_local, 'open_spans', None)
+    if stack is None:
+        stack = _local.open_spans = []
+    return stack
+
+
+@contextmanager
+def span(name: str):
+    """블록 실행 시간을 단계 시간으로 기록 (예외가 나도 기록, 안쪽 span() 시간은 exclusive에서 제외)"""
+    stack = _open_spans()
+    stack.append(0.0)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        record(name, elapsed, exclusive=max(0.0, elapsed - nested))
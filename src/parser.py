@@ -3,21 +3,22 @@ Pamtek HR 웹 페이지 파싱 모듈
 출근/퇴근 상태 확인
 """
 import requests
-from bs4 import BeautifulSoup
 from typing import Optional, Dict
 from datetime import datetime
 import logging
 import re
 
+from .attendance_html import parse_attendance_html
+
 logger = logging.getLogger(__name__)
 
 
 class PamtekParser:
     """Pamtek HR 데이터 파싱 클래스"""
 
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: requests.Session, base_url: str = "https://hr.pamtek.com"):
         self.session = session
-        self.base_url = "https://hr.pamtek.com"
+        self.base_url = base_url.rstrip('/')
 
     def get_attendance_status(self) -> Dict[str, any]:
         """
@@ -53,72 +54,22 @@ class PamtekParser:
                     'error': f'HTTP {response.status_code}'
                 }
 
+            # 세션 만료 시 로그인 페이지가 반환됨
+            if 'loginForm' in response.text or 'login' in response.url.lower():
+                logger.warning("로그인 페이지 응답 - 세션 만료")
+                return {
+                    'is_checked_in': False,
+                    'is_checked_out': False,
+                    'check_in_time': None,
+                    'check_out_time': None,
+                    'status': 'error',
+                    'error': '세션 만료 - 로그인 페이지 응답'
+                }
+
             # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 방법 1: HTML에서 직접 파싱
-            # "실적" 시간 정보 찾기
-            # <span class="tit">실적</span>
-            # <span class="txt">08:45~18:00</span>
-
-            check_in_time = None
-            check_out_time = None
-
-            # active 클래스를 가진 오늘 날짜 찾기
-            active_day = soup.find('div', class_='item-day active')
-
-            if active_day:
-                # time-wrap 안의 실적 시간 찾기
-                time_wrap = active_day.find('div', class_='time-wrap')
-                if time_wrap:
-                    # 모든 time div 찾기
-                    times = time_wrap.find_all('div', class_='time')
-
-                    for time_div in times:
-                        tit = time_div.find('span', class_='tit')
-                        txt = time_div.find('span', class_='txt')
-
-                        if tit and txt and '실적' in tit.text:
-                            # 실적 시간: "08:45~18:00" 형태
-                            time_text = txt.text.strip()
-
-                            # ~ 기준으로 분리
-                            if '~' in time_text:
-                                times_split = time_text.split('~')
-                                if len(times_split) == 2:
-                                    check_in_time = times_split[0].strip()
-                                    check_out_time = times_split[1].strip()
-                                    break
-
-            # 출근/퇴근 여부 판단
+            # "실적" 시간 정보: <span class="tit">실적</span> <span class="txt">08:45~18:00</span>
             # 00:00 이면 미출근/미퇴근 상태
-            is_checked_in = False
-            is_checked_out = False
-
-            if check_in_time and check_in_time != '00:00' and check_in_time != '-':
-                is_checked_in = True
-
-            if check_out_time and check_out_time != '00:00' and check_out_time != '-':
-                is_checked_out = True
-
-            # 상태 결정
-            if not is_checked_in:
-                status = 'not_checked_in'
-            elif not is_checked_out:
-                status = 'not_checked_out'
-            else:
-                status = 'completed'
-
-            logger.info(f"출근 상태 파싱 완료 - 출근: {check_in_time}, 퇴근: {check_out_time}")
-
-            return {
-                'is_checked_in': is_checked_in,
-                'is_checked_out': is_checked_out,
-                'check_in_time': check_in_time if is_checked_in else None,
-                'check_out_time': check_out_time if is_checked_out else None,
-                'status': status,
-                'error': None
-            }
+            return parse_attendance_html(response.text)
 
         except requests.RequestException as e:
             logger.error(f"출근 현황 조회 중 오류: {e}")
@@ -0,0 +1,120 @@
+"""
+하이브리드 Pamtek HR 파싱 모듈
+로그인은 Playwright 브라우저로, 출근 상태 조회는 requests HTTP로 수행
+"""
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+import logging
+
+from .metrics import span
+from .parser import PamtekParser
+from .parser_playwright import PamtekParserPlaywright
+
+logger = logging.getLogger(__name__)
+
+
+class PamtekParserHybrid:
+    """
+    하이브리드 Pamtek HR 데이터 파싱 클래스
+
+    - 로그인은 암호화 때문에 브라우저(PamtekAuthPlaywright)가 담당
+    - 브라우저 세션 쿠키를 requests.Session으로 복사해 home.do를 HTTP로 조회 (렌더링 없음)
+    - HTTP 응답이 로그인 페이지면 브라우저 경로로 한 번 조회하고 쿠키 다시 복사
+    """
+
+    def __init__(self, auth_playwright, in_page_extract: bool = True):
+        self.auth = auth_playwright
+        self.browser_parser = PamtekParserPlaywright(auth_playwright, in_page_extract=in_page_extract)
+        self.session: Optional[requests.Session] = None
+        self.http_parser: Optional[PamtekParser] = None
+        self.http_reads = 0
+        self.browser_fallbacks = 0
+
+    def _create_session(self) -> requests.Session:
+        """연결을 재사용하는 requests 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Referer': f'{self.auth.base_url}/'
+        })
+        return session
+
+    def sync_cookies(self) -> bool:
+        """
+        브라우저 컨텍스트의 쿠키를 requests 세션으로 복사
+
+        Returns:
+            bool: 성공 여부
+        """
+        if not self.auth.context:
+            logger.error("브라우저 컨텍스트가 초기화되지 않음")
+            return False
+
+        if self.session is None:
+            self.session = self._create_session()
+            self.http_parser = PamtekParser(self.session, base_url=self.auth.base_url)
+
+        self.session.cookies.clear()
+        for cookie in self.auth.context.cookies():
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+
+        logger.info(f"브라우저 쿠키 {len(self.session.cookies)}개를 HTTP 세션으로 복사")
+        return True
+
+    def get_attendance_status(self) -> Dict[str, any]:
+        """
+        오늘의 출근/퇴근 상태 확인 (HTTP 우선, 세션 만료 시 브라우저)
+
+        Returns:
+            dict: 출근 상태 정보
+        """
+        if self.http_parser is None and not self.sync_cookies():
+            return self.browser_parser.get_attendance_status()
+
+        with span('http'):
+            status = self.http_parser.get_attendance_status()
+        self.http_reads += 1
+
+        if not (status.get('error') and '세션' in status['error']):
+            return status
+
+        # HTTP 세션 만료 - 브라우저로 조회 (브라우저가 세션을 갱신했을 수 있음)
+        logger.warning("HTTP 조회 세션 만료 - 브라우저로 조회")
+        self.browser_fallbacks += 1
+        status = self.browser_parser.get_attendance_status()
+
+        if status.get('error'):
+            # 브라우저도 실패하면 재로그인 대상으로 표시
+            if '세션' not in status['error']:
+                status['error'] = f"세션 만료 - {status['error']}"
+        else:
+            self.sync_cookies()
+
+        return status
+
+    def get_today_attendance_summary(self) -> str:
+        """오늘의 출근 현황 요약 텍스트"""
+        return PamtekParserPlaywright.summarize(self.get_attendance_status())
+
+    def get_stats(self) -> Dict[str, any]:
+        """HTTP 조회 / 브라우저 대체 조회 횟수"""
+        return {
+            'http_reads': self.http_reads,
+            'browser_fallbacks': self.browser_fallbacks
+        }
+
+    def close(self):
+        """HTTP 세션 종료"""
+        if self.session:
+            self.session.close()
+            self.session = None
+            self.http_parser = None
@@ -1,18 +1,30 @@
 """
 Playwright 기반 Pamtek HR 파싱 모듈
 """
-from typing import Dict
-from bs4 import BeautifulSoup
+from typing import Dict, Optional
 import logging
 
+from .attendance_html import _split_actual, build_attendance_status, extract_actual_times, parse_attendance_html
+from .metrics import span
+
 logger = logging.getLogger(__name__)
 
 
 class PamtekParserPlaywright:
-    """Playwright 기반 Pamtek HR 데이터 파싱 클래스"""
+    """
+    Playwright 기반 Pamtek HR 데이터 파싱 클래스
+
+    auth에 dashboard_capture가 있고 API 요청이 기록되어 있으면 새로고침 없이 JSON API로 조회.
+    그 외에는 새로고침 후 in_page_extract=True면 페이지 안에서 오늘 날짜의 시간만 추출하고,
+    선택자 구조가 맞지 않을 때만 HTML 전체를 받아 attendance_html로 파싱
+    """
 
-    def __init__(self, auth_playwright):
+    def __init__(self, auth_playwright, in_page_extract: bool = True):
         self.auth = auth_playwright
+        self.in_page_extract = in_page_extract
+        self.soup_fallbacks = 0
+        self.json_reads = 0
+        self.json_fallbacks = 0
 
     def get_attendance_status(self) -> Dict[str, any]:
         """
@@ -22,17 +34,40 @@ class PamtekParserPlaywright:
             dict: 출근 상태 정보
         """
         try:
+            # 대시보드 JSON API 재요청 (페이지 렌더링/HTML 파싱 없음)
+            capture = getattr(self.auth, 'dashboard_capture', None)
+            if capture and capture.ready:
+                with span('json'):
+                    status = capture.fetch_status(self.auth.context)
+                if status:
+                    self.json_reads += 1
+                    return status
+                self.json_fallbacks += 1
+                logger.warning("대시보드 API 조회 실패 - 페이지 새로고침으로 조회")
+
             # 홈 페이지로 이동
-            if not self.auth.navigate_to_home():
+            with span('navigation'):
+                navigated = self.auth.navigate_to_home()
+            if not navigated:
+                # 로그인 페이지로 갔으면 '세션' 오류로 알려 재로그인 대상이 되게 함
                 return {
                     'is_checked_in': False,
                     'is_checked_out': False,
                     'check_in_time': None,
                     'check_out_time': None,
                     'status': 'error',
-                    'error': '홈 페이지 접근 실패'
+                    'error': '세션 만료 - 로그인 페이지로 이동됨'
+                    if getattr(self.auth, 'session_expired', False) else '홈 페이지 접근 실패'
                 }
 
+            # 페이지 안에서 오늘 날짜 시간만 추출
+            if self.in_page_extract:
+                status = self.parse_times(self.auth.extract_active_day_times())
+                if status:
+                    return status
+                self.soup_fallbacks += 1
+                logger.warning("페이지 내 추출 실패 (선택자 구조 변경?) - HTML 전체 파싱")
+
             # HTML 가져오기
             html = self.auth.get_page_source()
             if not html:
@@ -45,64 +80,23 @@ class PamtekParserPlaywright:
                     'error': 'HTML 소스 없음'
                 }
 
-            # BeautifulSoup으로 파싱
-            soup = BeautifulSoup(html, 'html.parser')
-
-            check_in_time = None
-            check_out_time = None
-
-            # active 클래스를 가진 오늘 날짜 찾기
-            active_day = soup.find('div', class_='item-day active')
-
-            if active_day:
-                # time-wrap 안의 실적 시간 찾기
-                time_wrap = active_day.find('div', class_='time-wrap')
-                if time_wrap:
-                    times = time_wrap.find_all('div', class_='time')
-
-                    for time_div in times:
-                        tit = time_div.find('span', class_='tit')
-                        txt = time_div.find('span', class_='txt')
-
-                        if tit and txt and '실적' in tit.text:
-                            time_text = txt.text.strip()
-
-                            # ~ 기준으로 분리
-                            if '~' in time_text:
-                                times_split = time_text.split('~')
-                                if len(times_split) == 2:
-                                    check_in_time = times_split[0].strip()
-                                    check_out_time = times_split[1].strip()
-                                    break
+            with span('parse'):
+                times = extract_actual_times(html)
 
-            # 출근/퇴근 여부 판단
-            is_checked_in = False
-            is_checked_out = False
-
-            if check_in_time and check_in_time != '00:00' and check_in_time != '-':
-                is_checked_in = True
-
-            if check_out_time and check_out_time != '00:00' and check_out_time != '-':
-                is_checked_out = True
-
-            # 상태 결정
-            if not is_checked_in:
-                status = 'not_checked_in'
-            elif not is_checked_out:
-                status = 'not_checked_out'
-            else:
-                status = 'completed'
-
-            logger.info(f"출근 상태 파싱 완료 - 출근: {check_in_time}, 퇴근: {check_out_time}")
+            # 출근 시간 요소를 기다리다 상한에 걸렸고 오늘 날짜도 없으면 덜 채워진 페이지
+            # (미출근으로 캐시되지 않도록 오류로 반환)
+            if times == (None, None) and getattr(self.auth, 'ready_timed_out', False):
+                logger.warning("출근 시간 요소 대기 시간 초과 - 오늘 날짜를 찾지 못함")
+                return {
+                    'is_checked_in': False,
+                    'is_checked_out': False,
+                    'check_in_time': None,
+                    'check_out_time': None,
+                    'status': 'error',
+                    'error': '출근 시간 로딩 시간 초과'
+                }
 
-            return {
-                'is_checked_in': is_checked_in,
-                'is_checked_out': is_checked_out,
-                'check_in_time': check_in_time if is_checked_in else None,
-                'check_out_time': check_out_time if is_checked_out else None,
-                'status': status,
-                'error': None
-            }
+            return self.build_status(*times)
 
         except Exception as e:
             logger.error(f"파싱 중 오류: {e}")
@@ -115,11 +109,53 @@ class PamtekParserPlaywright:
                 'error': str(e)
             }
 
+    @staticmethod
+    def parse_html(html: str) -> Dict[str, any]:
+        """
+        홈 페이지 HTML에서 오늘의 출근/퇴근 상태 추출
+
+        Args:
+            html: 홈 페이지 HTML
+
+        Returns:
+            dict: 출근 상태 정보
+        """
+        return parse_attendance_html(html)
+
+    @staticmethod
+    def parse_times(times: Optional[Dict[str, str]]) -> Optional[Dict[str, any]]:
+        """
+        페이지 안에서 추출한 {제목: 시간}으로 출근 상태 생성
+
+        Args:
+            times: extract_active_day_times() 결과
+
+        Returns:
+            dict: 출근 상태 정보, 실적 시간을 찾지 못하면 None
+        """
+        if not times:
+            return None
+
+        for tit, time_text in times.items():
+            result = _split_actual(tit, time_text)
+            if result:
+                return PamtekParserPlaywright.build_status(*result)
+
+        return None
+
+    @staticmethod
+    def build_status(check_in_time: Optional[str], check_out_time: Optional[str]) -> Dict[str, any]:
+        """실적 출근/퇴근 시간으로 출근 상태 생성"""
+        return build_attendance_status(check_in_time, check_out_time)
+
     def get_today_attendance_summary(self) -> str:
         """오늘의 출근 현황 요약 텍스트"""
-        status = self.get_attendance_status()
+        return self.summarize(self.get_attendance_status())
 
-        if status['error']:
+    @staticmethod
+    def summarize(status: Dict[str, any]) -> str:
+        """출근 상태 dict를 요약 텍스트로 변환"""
+        if status.get('error'):
             return f"오류: {status['error']}"
 
         if status['is_checked_in'] and status['is_checked_out']:
@@ -0,0 +1,72 @@
+"""
+Playwright async API 기반 Pamtek HR 파싱 모듈
+"""
+import asyncio
+from typing import Dict, Optional
+from playwright.async_api import Page
+import logging
+
+from .attendance_html import parse_attendance_html
+from .parser_playwright import PamtekParserPlaywright
+
+logger = logging.getLogger(__name__)
+
+
+class PamtekParserPlaywrightAsync:
+    """Playwright async API 기반 Pamtek HR 데이터 파싱 클래스"""
+
+    def __init__(self, auth_playwright_async):
+        self.auth = auth_playwright_async
+
+    async def get_attendance_status(self, page: Optional[Page] = None) -> Dict[str, any]:
+        """
+        오늘의 출근/퇴근 상태 확인
+
+        Args:
+            page: 대상 페이지 (기본값: 로그인한 페이지, 동시 조회 시 auth.open_page()로 연 페이지)
+
+        Returns:
+            dict: 출근 상태 정보
+        """
+        try:
+            # 홈 페이지로 이동
+            if not await self.auth.navigate_to_home(page=page):
+                return {
+                    'is_checked_in': False,
+                    'is_checked_out': False,
+                    'check_in_time': None,
+                    'check_out_time': None,
+                    'status': 'error',
+                    'error': '홈 페이지 접근 실패'
+                }
+
+            # HTML 가져오기
+            html = await self.auth.get_page_source(page=page)
+            if not html:
+                return {
+                    'is_checked_in': False,
+                    'is_checked_out': False,
+                    'check_in_time': None,
+                    'check_out_time': None,
+                    'status': 'error',
+                    'error': 'HTML 소스 없음'
+                }
+
+            # HTML 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, parse_attendance_html, html)
+
+        except Exception as e:
+            logger.error(f"파싱 중 오류: {e}")
+            return {
+                'is_checked_in': False,
+                'is_checked_out': False,
+                'check_in_time': None,
+                'check_out_time': None,
+                'status': 'error',
+                'error': str(e)
+            }
+
+    async def get_today_attendance_summary(self, page: Optional[Page] = None) -> str:
+        """오늘의 출근 현황 요약 텍스트"""
+        return PamtekParserPlaywright.summarize(await self.get_attendance_status(page=page))
@@ -0,0 +1,108 @@
+"""
+출근 상태 백그라운드 폴러
+주기적으로 브라우저에서 출근 상태를 가져와 캐시 스냅샷을 최신으로 유지
+"""
+import random
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from .schedule import PollingPlanner
+from .status_cache import StatusCache
+
+logger = logging.getLogger(__name__)
+
+
+class AttendancePoller(threading.Thread):
+    """
+    출근 상태 폴링 스레드
+
+    loader를 interval(± jitter)초마다 실행하고 결과 스냅샷을 캐시에 공개.
+    API 요청은 캐시의 스냅샷을 메모리에서 바로 읽음.
+    planner가 있으면 근무 일정에 따라 주기를 정하고, 야간/주말에는 폴링하지 않음.
+    """
+
+    def __init__(self, cache: StatusCache, loader: Callable[[], Dict[str, any]],
+                 interval: float = 60.0, jitter: float = 5.0,
+                 planner: Optional[PollingPlanner] = None):
+        super().__init__(name='AttendancePoller', daemon=True)
+        self.cache = cache
+        self.loader = loader
+        self.interval = interval
+        self.jitter = jitter
+        self.planner = planner
+        self.last_success_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.poll_count = 0
+        self._stop_event = threading.Event()
+
+    def next_delay(self) -> float:
+        """다음 폴링까지 대기 시간 (초)"""
+        base = self.planner.next_delay() if self.planner else self.interval
+        return max(1.0, base + random.uniform(-self.jitter, self.jitter))
+
+    def should_poll_now(self) -> bool:
+        """지금 폴링할 시간대인지 (planner 없으면 항상 True)"""
+        return self.planner is None or self.planner.mode(datetime.now()) != 'idle'
+
+    def poll_once(self, expires_in: Optional[float] = None) -> bool:
+        """
+        출근 상태 1회 새로고침
+
+        Args:
+            expires_in: 스냅샷 유효 시간 (초, 다음 폴링까지, None이면 캐시 TTL 기준)
+
+        Returns:
+            bool: 성공 여부
+        """
+        self.poll_count += 1
+        try:
+            snapshot = self.cache.refresh(self.loader, expires_in=expires_in)
+        except Exception as e:
+            logger.error(f"폴링 중 오류: {e}")
+            self.last_error = str(e)
+            return False
+
+        if snapshot.error:
+            logger.warning(f"폴링 실패: {snapshot.error}")
+            self.last_error = snapshot.error
+            return False
+
+        self.last_success_at = snapshot.fetched_at
+        self.last_error = None
+        return True
+
+    def run(self):
+        logger.info(f"출근 상태 폴러 시작 (주기 {self.interval}초 ± {self.jitter}초)")
+        delay = 0.0
+        while not self._stop_event.wait(delay):
+            delay = self.next_delay()
+            if self.should_poll_now():
+                # 다음 폴링(+ jitter)까지만 스냅샷 유지 (야간/주말에는 폴링하지 않으므로 캐시 TTL 기준)
+                self.poll_once(expires_in=delay + self.jitter)
+        logger.info("출근 상태 폴러 종료")
+
+    def stop(self):
+        """폴링 중지"""
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, any]:
+        """폴러 상태 (헬스 체크용)"""
+        last_success = None
+        if self.last_success_at is not None:
+            last_success = datetime.fromtimestamp(self.last_success_at).isoformat(timespec='seconds')
+
+        return {
+            'running': self.is_alive(),
+            'mode': self.planner.mode(datetime.now()) if self.planner else 'fixed',
+            'interval': self.interval,
+            'jitter': self.jitter,
+            'poll_count': self.poll_count,
+            'last_success_at': last_success,
+            'last_success_age_seconds': (
+                round(time.time() - self.last_success_at, 1) if self.last_success_at is not None else None
+            ),
+            'last_error': self.last_error
+        }
@@ -0,0 +1,334 @@
+"""
+요청 경로 프로파일러
+운영 중 간헐적으로 느려지는 새로고침을 잡기 위해 관리자가 켜면 다음 N번의 새로고침(또는 T초 동안)만
+브라우저 작업을 cProfile 또는 스택 샘플러로 기록해 profiles/에 저장
+
+꺼져 있을 때는 작업마다 불리언 확인 한 번만 하므로 부하가 거의 없음
+
+저장 파일 (작업 1건마다):
+- <이름>.json: 단계별 시간(auth / navigation / parse / json), 상위 함수
+- <이름>.prof: cProfile 결과 (python -m pstats, snakeviz 등으로 열기)
+- <이름>.folded: 샘플러 결과 (flamegraph.pl, speedscope에서 열 수 있는 collapsed stack)
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+MODE_CPROFILE = 'cprofile'
+MODE_SAMPLING = 'sampling'
+MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+# 한 번에 켤 수 있는 최대 범위
+MAX_REQUESTS = 100
+MAX_SECONDS = 600.0
+
+# 단계 구분 - span 이름별 exclusive 시간(안쪽 span 제외, metrics.Timings 참고)을 합산하므로 겹치지 않음
+# (hybrid의 http는 안쪽 parse를 뺀 HTTP 요청 시간, login_check는 안쪽 relogin을 뺀 확인 시간)
+STAGE_SPANS = {
+    'auth': ('login_check', 'relogin'),
+    'navigation': ('navigation',),
+    'parse': ('extract', 'content', 'parse'),
+    'json': ('json', 'http'),
+}
+
+# 샘플러 단계 구분 - 스택에서 가장 바깥쪽에 있는 함수 기준
+STAGE_FUNCTIONS = {
+    'ensure_logged_in': 'auth',
+    'relogin': 'auth',
+    'login': 'auth',
+    'navigate_to_home': 'navigation',
+    '_load_page': 'navigation',
+    'extract_active_day_times': 'parse',
+    'get_page_source': 'parse',
+    'parse_attendance_html': 'parse',
+    'fetch_status': 'json',
+}
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _StackSampler(threading.Thread):
+    """대상 스레드의 호출 스택을 interval마다 기록"""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name='ProfileSampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def _stage_of(stack: tuple) -> str:
+    """샘플 스택의 단계 (프로젝트 코드 중 가장 바깥쪽 STAGE_FUNCTIONS 함수)"""
+    for filename, name in stack:
+        if name in STAGE_FUNCTIONS and filename.startswith(_PROJECT_ROOT):
+            return STAGE_FUNCTIONS[name]
+    return 'other'
+
+
+def _delta(after: Dict[str, float], before: Dict[str, float]) -> Dict[str, float]:
+    """블록 실행 중 늘어난 단계 시간"""
+    delta = {key: value - before.get(key, 0.0) for key, value in after.items()}
+    return {key: value for key, value in delta.items() if value > 0}
+
+
+def _frame_label(filename: str, name: str) -> str:
+    if filename.startswith(_PROJECT_ROOT):
+        filename = os.path.relpath(filename, _PROJECT_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{name} ({filename})"
+
+
+class HotPathProfiler:
+    """
+    필요할 때만 켜는 브라우저 작업 프로파일러
+
+    사용 예:
+        profiler = HotPathProfiler('profiles')
+        profiler.arm(requests=5, mode='sampling')   # 관리자 요청
+
+        def fetch_attendance_status():              # 브라우저 작업 스레드
+            with profiler.profile('refresh'):
+                ...
+    """
+
+    def __init__(self, output_dir: str = 'profiles', sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self.armed = False
+        self.mode = MODE_SAMPLING
+        self.remaining: Optional[int] = None
+        self.expires_at: Optional[float] = None
+        self.captured = 0
+        self.recent: List[Dict[str, any]] = []
+
+    def arm(self, requests: Optional[int] = None, seconds: Optional[float] = None,
+            mode: str = MODE_SAMPLING) -> Dict[str, any]:
+        """
+        프로파일링 시작
+
+        Args:
+            requests: 기록할 작업 수 (seconds도 없으면 10)
+            seconds: 기록할 시간 (초)
+            mode: 'sampling' (스택 샘플러, 부하 적음) 또는 'cprofile' (모든 호출 기록)
+
+        Returns:
+            dict: 현재 상태
+        """
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 프로파일링 방식: {mode} ({', '.join(MODES)})")
+        if requests is None and seconds is None:
+            requests = 10
+        if requests is not None and not 0 < requests <= MAX_REQUESTS:
+            raise ValueError(f"requests는 1~{MAX_REQUESTS} 사이여야 함")
+        if seconds is not None and not 0 < seconds <= MAX_SECONDS:
+            raise ValueError(f"seconds는 0~{MAX_SECONDS:.0f} 사이여야 함")
+
+        with self._lock:
+            self.mode = mode
+            self.remaining = requests
+            self.expires_at = time.monotonic() + seconds if seconds is not None else None
+            self.armed = True
+
+        logger.warning(
+            f"프로파일링 시작 ({mode}) - "
+            f"{f'{requests}건' if requests is not None else ''}"
+            f"{' / ' if requests is not None and seconds is not None else ''}"
+            f"{f'{seconds:.0f}초' if seconds is not None else ''}"
+        )
+        return self.get_status()
+
+    def disarm(self):
+        """프로파일링 중지"""
+        with self._lock:
+            if self.armed:
+                logger.warning(f"프로파일링 종료 - {self.captured}건 저장")
+            self.armed = False
+            self.remaining = None
+            self.expires_at = None
+
+    def _take_slot(self) -> Optional[str]:
+        """이번 작업을 기록할지 결정 (기록하면 방식 반환)"""
+        with self._lock:
+            if not self.armed:
+                return None
+            if self.expires_at is not None and time.monotonic() >= self.expires_at:
+                self.armed = False
+                return None
+            if self.remaining is not None:
+                self.remaining -= 1
+                if self.remaining <= 0:
+                    self.armed = False
+            return self.mode
+
+    @contextmanager
+    def profile(self, name: str):
+        """
+        블록(브라우저 작업 1건)을 프로파일링 (꺼져 있으면 그대로 실행)
+
+        단계별 시간은 블록 안에서 metrics.span()으로 측정한 값을 사용하므로
+        metrics Timings가 활성화된 스레드(브라우저 작업 스레드)에서 호출
+        """
+        if not self.armed:
+            yield
+            return
+
+        mode = self._take_slot()
+        if mode is None:
+            yield
+            return
+
+        timings = metrics.current()
+        spans_before = dict(timings.spans) if timings else {}
+        exclusive_before = dict(timings.exclusive) if timings else {}
+        started_at = datetime.now()
+        started = time.perf_counter()
+
+        profile = sampler = None
+        if mode == MODE_CPROFILE:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                # 다른 프로파일러가 이미 켜져 있음 - 단계별 시간만 기록
+                logger.warning(f"cProfile 시작 실패: {e}")
+                profile = None
+        else:
+            sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+            sampler.start()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if profile:
+                profile.disable()
+            if sampler:
+                sampler.stop()
+
+            spans = exclusive = {}
+            if timings:
+                spans = _delta(timings.spans, spans_before)
+                exclusive = _delta(timings.exclusive, exclusive_before)
+
+            try:
+                self._save(name, mode, started_at, elapsed, spans, exclusive, profile, sampler)
+            except Exception as e:
+                logger.warning(f"프로파일 저장 실패: {e}")
+
+    def _save(self, name: str, mode: str, started_at: datetime, elapsed: float,
+              spans: Dict[str, float], exclusive: Dict[str, float],
+              profile: Optional[cProfile.Profile], sampler: Optional[_StackSampler]):
+        """프로파일 파일 저장"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{started_at.strftime('%Y%m%d-%H%M%S-%f')}-{name}")
+
+        stages = {stage: sum(exclusive.get(span_name, 0.0) for span_name in span_names)
+                  for stage, span_names in STAGE_SPANS.items()}
+        stages['other'] = max(0.0, elapsed - sum(stages.values()))
+
+        summary = {
+            'name': name,
+            'mode': mode,
+            'started_at': started_at.isoformat(timespec='milliseconds'),
+            'duration_ms': round(elapsed * 1000, 1),
+            'stages_ms': {stage: round(value * 1000, 1) for stage, value in stages.items()},
+            'spans_ms': {span_name: round(value * 1000, 1) for span_name, value in spans.items()},
+        }
+
+        if profile:
+            profile.dump_stats(f'{base}.prof')
+            summary['profile'] = f'{base}.prof'
+            summary['top_functions'] = self._top_cprofile(profile)
+
+        if sampler:
+            total = sum(sampler.stacks.values())
+            stage_samples = Counter()
+            leaf_samples = Counter()
+            with open(f'{base}.folded', 'w', encoding='utf-8') as f:
+                for stack, count in sampler.stacks.most_common():
+                    stage_samples[_stage_of(stack)] += count
+                    leaf_samples[_frame_label(*stack[-1])] += count
+                    f.write(';'.join(_frame_label(*frame) for frame in stack) + f' {count}\n')
+            summary['profile'] = f'{base}.folded'
+            summary['samples'] = total
+            summary['sample_interval_ms'] = self.sample_interval * 1000
+            summary['stage_samples'] = dict(stage_samples)
+            summary['top_functions'] = [
+                {'function': label, 'samples': count, 'share': round(count / total, 3)}
+                for label, count in leaf_samples.most_common(25)
+            ]
+
+        with open(f'{base}.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+        with self._lock:
+            self.captured += 1
+            self.recent = (self.recent + [{
+                'file': f'{base}.json',
+                'duration_ms': summary['duration_ms'],
+                'stages_ms': summary['stages_ms']
+            }])[-10:]
+        logger.info(f"프로파일 저장 ({summary['duration_ms']:.0f}ms): {base}.json")
+
+    @staticmethod
+    def _top_cprofile(profile: cProfile.Profile, limit: int = 25) -> List[Dict[str, any]]:
+        """누적 시간 상위 함수"""
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        rows = []
+        for (filename, lineno, func), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': _frame_label(filename, func) if filename != '~' else func,
+                'calls': calls,
+                'total_ms': round(total * 1000, 2),
+                'cumulative_ms': round(cumulative * 1000, 2)
+            })
+        rows.sort(key=lambda row: row['cumulative_ms'], reverse=True)
+        return rows[:limit]
+
+    def get_status(self) -> Dict[str, any]:
+        """프로파일러 상태"""
+        with self._lock:
+            return {
+                'armed': self.armed,
+                'mode': self.mode,
+                'remaining': self.remaining if self.armed else None,
+                'expires_in_seconds': (
+                    round(max(0.0, self.expires_at - time.monotonic()), 1)
+                    if self.armed and self.expires_at is not None else None
+                ),
+                'captured': self.captured,
+                'output_dir': self.output_dir,
+                'recent': list(self.recent)
+            }
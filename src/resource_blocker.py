@@ -0,0 +1,150 @@
+"""
+Playwright 리소스 차단 모듈
+홈 페이지 새로고침 시 출근 시간과 무관한 이미지/폰트/스타일시트/외부 스크립트 요청 차단
+"""
+import fnmatch
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 기본 차단 리소스 타입 (문서/스크립트/XHR은 출근 시간 표시에 필요하므로 허용)
+DEFAULT_BLOCK_TYPES = ('image', 'media', 'font', 'stylesheet')
+
+
+def _split_list(value: Optional[str]) -> list:
+    """쉼표 구분 문자열을 목록으로 변환"""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class ResourceBlocker:
+    """
+    BrowserContext 요청 차단 정책
+
+    판단 순서:
+    1. allow_patterns에 맞는 URL은 항상 허용
+    2. deny_patterns에 맞는 URL은 차단
+    3. block_types에 속한 리소스 타입은 차단
+    4. block_third_party면 다른 도메인의 스크립트 차단
+       (컨텍스트 전체에 적용되어 로그인 페이지에도 걸리므로 로그인에 필요한 외부 스크립트가 없을 때만 사용)
+
+    차단한 요청은 내려받지 않으므로 크기를 알 수 없어 요청 수만 집계 (바이트는 허용한 응답만)
+
+    패턴은 fnmatch 형식 (예: '*/static/img/*', '*analytics*')
+
+    사용 예:
+        blocker = ResourceBlocker(first_party_url='https://hr.pamtek.com')
+        blocker.install(context)
+    """
+
+    def __init__(self, first_party_url: str, block_types: Iterable[str] = DEFAULT_BLOCK_TYPES,
+                 block_third_party: bool = False, allow_patterns: Iterable[str] = (),
+                 deny_patterns: Iterable[str] = ()):
+        self.block_types = frozenset(t.lower() for t in block_types)
+        self.block_third_party = block_third_party
+        self.allow_patterns = list(allow_patterns)
+        self.deny_patterns = list(deny_patterns)
+
+        # hr.pamtek.com → pamtek.com (같은 회사 하위 도메인은 자사 리소스로 취급)
+        # IP 주소나 localhost(로컬 목 서버)는 그대로 사용
+        host = urlparse(first_party_url).hostname or ''
+        if host.replace('.', '').isdigit() or '.' not in host:
+            self.first_party_domain = host
+        else:
+            self.first_party_domain = '.'.join(host.split('.')[-2:])
+
+        self.allowed = 0
+        self.allowed_bytes = 0
+        self.blocked = 0
+        self.blocked_by_type: Counter = Counter()
+
+    @classmethod
+    def from_env(cls, first_party_url: str, block_types: Optional[str] = None,
+                 block_third_party: bool = False, allow: Optional[str] = None,
+                 deny: Optional[str] = None) -> 'ResourceBlocker':
+        """
+        환경 변수 문자열(쉼표 구분)로 생성
+
+        Args:
+            first_party_url: 자사 도메인 판단 기준 URL
+            block_types: 차단할 리소스 타입 (None이면 기본값)
+            block_third_party: 외부 도메인 스크립트 차단 여부
+            allow: 항상 허용할 URL 패턴
+            deny: 항상 차단할 URL 패턴
+        """
+        return cls(
+            first_party_url,
+            block_types=DEFAULT_BLOCK_TYPES if block_types is None else _split_list(block_types),
+            block_third_party=block_third_party,
+            allow_patterns=_split_list(allow),
+            deny_patterns=_split_list(deny)
+        )
+
+    def _is_first_party(self, url: str) -> bool:
+        host = urlparse(url).hostname or ''
+        return host == self.first_party_domain or host.endswith('.' + self.first_party_domain)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        요청 차단 여부
+
+        Args:
+            resource_type: Playwright request.resource_type (document, script, image, ...)
+            url: 요청 URL
+
+        Returns:
+            bool: 차단하면 True
+        """
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.allow_patterns):
+            return False
+
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.deny_patterns):
+            return True
+
+        if resource_type in self.block_types:
+            return True
+
+        if self.block_third_party and resource_type == 'script' and not self._is_first_party(url):
+            return True
+
+        return False
+
+    def install(self, context):
+        """컨텍스트의 모든 요청에 차단 정책 적용"""
+        context.route('**/*', self._handle_route)
+        context.on('response', self._on_response)
+        logger.info(
+            f"리소스 차단 적용 - 타입: {', '.join(sorted(self.block_types)) or '없음'}, "
+            f"외부 스크립트: {'차단' if self.block_third_party else '허용'}"
+        )
+
+    def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            self.blocked_by_type[request.resource_type] += 1
+            route.abort('blockedbyclient')
+        else:
+            route.continue_()
+
+    def _on_response(self, response):
+        """허용된 요청의 응답 크기 집계 (Content-Length 헤더 기준, 없으면 제외)"""
+        self.allowed += 1
+        length = response.headers.get('content-length')
+        if length and length.isdigit():
+            self.allowed_bytes += int(length)
+
+    def get_stats(self) -> Dict[str, any]:
+        """차단 통계 (헬스 체크용)"""
+        return {
+            'block_types': sorted(self.block_types),
+            'block_third_party': self.block_third_party,
+            'blocked': self.blocked,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'allowed': self.allowed,
+            'allowed_bytes': self.allowed_bytes
+        }
@@ -0,0 +1,153 @@
+"""
+근무 일정 기반 폴링 계획 모듈
+config/settings.json의 work_schedule을 읽어 시간대별 폴링 주기 결정
+"""
+import json
+import os
+import logging
+from datetime import datetime, time as dtime, timedelta
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SETTINGS_PATH = os.path.join(PROJECT_ROOT, 'config', 'settings.json')
+EXAMPLE_SETTINGS_PATH = os.path.join(PROJECT_ROOT, 'config', 'settings.example.json')
+
+
+def load_settings(path: Optional[str] = None) -> Dict[str, any]:
+    """
+    설정 파일 로드
+
+    Args:
+        path: 설정 파일 경로 (없으면 config/settings.json, 그마저 없으면 settings.example.json)
+
+    Returns:
+        dict: 설정 내용
+    """
+    candidates = [path] if path else [DEFAULT_SETTINGS_PATH, EXAMPLE_SETTINGS_PATH]
+
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            with open(candidate, 'r', encoding='utf-8') as f:
+                logger.info(f"설정 파일 로드: {candidate}")
+                return json.load(f)
+
+    raise FileNotFoundError(f"설정 파일 없음: {', '.join(c for c in candidates if c)}")
+
+
+def is_weekend(now: Optional[datetime] = None) -> bool:
+    """
+    주말 여부 (5=토요일, 6=일요일)
+
+    Args:
+        now: 기준 시각 (기본값: 현재 시각)
+    """
+    return (now or datetime.now()).weekday() in (5, 6)
+
+
+def _parse_hhmm(value: str) -> dtime:
+    """'HH:MM' 문자열을 time으로 변환"""
+    hour, minute = value.strip().split(':')
+    return dtime(int(hour), int(minute))
+
+
+class PollingPlanner:
+    """
+    근무 일정 기반 폴링 주기 계산
+
+    - 출근/퇴근 확인 시각(check_times) 전후 window 동안: 촘촘하게 (dense_interval)
+    - 그 외 근무 시간: 드물게 (sparse_interval)
+    - 야간 및 주말: 폴링하지 않음 (다음 평일 아침 window 시작까지 대기)
+    """
+
+    def __init__(self, work_schedule: Dict[str, any], dense_interval: float = 60.0,
+                 sparse_interval: float = 900.0, window_minutes: float = 30.0):
+        check_times = work_schedule.get('check_times', {})
+
+        self.start_time = _parse_hhmm(work_schedule.get('start_time', '09:00'))
+        self.end_time = _parse_hhmm(work_schedule.get('end_time', '18:00'))
+        self.morning = _parse_hhmm(check_times.get('morning', '08:30'))
+        self.evening = _parse_hhmm(check_times.get('evening', '18:00'))
+        self.dense_interval = dense_interval
+        self.sparse_interval = sparse_interval
+        self.window = timedelta(minutes=window_minutes)
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, any], **kwargs) -> 'PollingPlanner':
+        """설정 dict(work_schedule 포함)로 생성"""
+        return cls(settings.get('work_schedule', {}), **kwargs)
+
+    @staticmethod
+    def is_workday(now: datetime) -> bool:
+        """평일 여부"""
+        return not is_weekend(now)
+
+    def _at(self, day: datetime, t: dtime) -> datetime:
+        return day.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
+
+    def _day_bounds(self, day: datetime):
+        """해당 날짜의 폴링 가능 구간 (시작, 끝)"""
+        first = self._at(day, min(self.morning, self.start_time)) - self.window
+        last = self._at(day, max(self.evening, self.end_time)) + self.window
+        return first, last
+
+    def _dense_windows(self, day: datetime):
+        """해당 날짜의 촘촘한 폴링 구간 목록"""
+        return [
+            (self._at(day, t) - self.window, self._at(day, t) + self.window)
+            for t in (self.morning, self.evening)
+        ]
+
+    def next_active_start(self, now: datetime) -> datetime:
+        """다음 폴링 구간 시작 시각"""
+        day = now
+        for _ in range(8):
+            if self.is_workday(day):
+                first, last = self._day_bounds(day)
+                if now < first:
+                    return first
+                if now <= last:
+                    return now
+            day = (day + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return now + timedelta(days=1)
+
+    def mode(self, now: datetime) -> str:
+        """현재 폴링 모드 ('dense', 'sparse', 'idle')"""
+        if not self.is_workday(now):
+            return 'idle'
+
+        first, last = self._day_bounds(now)
+        if not first <= now <= last:
+            return 'idle'
+
+        for start, end in self._dense_windows(now):
+            if start <= now <= end:
+                return 'dense'
+        return 'sparse'
+
+    def next_delay(self, now: Optional[datetime] = None) -> float:
+        """
+        다음 폴링까지 대기 시간 (초)
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        now = now or datetime.now()
+        mode = self.mode(now)
+
+        if mode == 'dense':
+            return self.dense_interval
+
+        if mode == 'sparse':
+            # 다음 촘촘한 구간이 시작되면 바로 폴링하도록 대기 시간 제한
+            delay = self.sparse_interval
+            for start, _ in self._dense_windows(now):
+                if now < start:
+                    delay = min(delay, (start - now).total_seconds())
+            return max(1.0, delay)
+
+        return max(1.0, (self.next_active_start(now) - now).total_seconds())
@@ -0,0 +1,148 @@
+"""
+로그인 세션 생존 확인 모듈
+page.content() 전체 직렬화 대신 쿠키 만료/최근 성공 시각/가벼운 HTTP 요청으로 확인
+"""
+import time
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SessionLiveness:
+    """
+    세션 생존 확인
+
+    1. 세션 쿠키가 만료되었으면 즉시 False
+    2. trust_seconds 이내에 성공한 조회가 있으면 요청 없이 True
+    3. 그 외에는 컨텍스트의 APIRequestContext로 home.do를 가볍게 요청 (리다이렉트 미추적)
+    """
+
+    def __init__(self, auth_playwright, trust_seconds: float = 60.0, probe_timeout: float = 5.0):
+        self.auth = auth_playwright
+        self.trust_seconds = trust_seconds
+        self.probe_timeout = probe_timeout
+        self.last_success_at: Optional[float] = None
+        self.cookie_expires_at: Optional[float] = None
+        self.probes = 0
+        self.probe_failures = 0
+        self.trusted_checks = 0
+
+    def mark_success(self):
+        """세션이 유효했던 작업(로그인, 조회) 완료 기록"""
+        self.last_success_at = time.time()
+
+    def mark_failure(self):
+        """세션이 만료된 것으로 확인됨"""
+        self.last_success_at = None
+
+    def cookie_expiry(self) -> Optional[float]:
+        """
+        도메인 쿠키 중 가장 이른 만료 시각 (epoch 초)
+
+        Returns:
+            float: 만료 시각, 만료 시각이 있는 쿠키가 없으면(브라우저 세션 쿠키만 있으면) None
+        """
+        if not self.auth.context:
+            return None
+
+        expiries = [
+            cookie['expires'] for cookie in self.auth.context.cookies(self.auth.base_url)
+            if cookie.get('expires', -1) > 0
+        ]
+        return min(expiries) if expiries else None
+
+    def probe(self) -> bool:
+        """
+        home.do를 HTTP로 요청해 로그인 페이지로 가지 않는지 확인
+
+        Returns:
+            bool: 세션 유효 여부 (확인하지 못했으면 False)
+        """
+        return self.probe_session() is True
+
+    def probe_session(self) -> Optional[bool]:
+        """
+        home.do를 HTTP로 요청해 세션 상태 확인 (만료 확정과 확인 실패 구분)
+
+        Returns:
+            bool: 유효하면 True, 로그인 페이지로 리다이렉트되거나 로그인 폼이 오면 False,
+                  네트워크 오류나 5xx 등으로 확인하지 못했으면 None
+        """
+        if not self.auth.context:
+            return False
+
+        self.probes += 1
+        try:
+            response = self.auth.context.request.get(
+                f"{self.auth.base_url}/module/HR/home.do",
+                max_redirects=0,
+                timeout=self.probe_timeout * 1000
+            )
+            try:
+                if response.status == 200:
+                    alive = b'loginForm' not in response.body()
+                elif 300 <= response.status < 400 or response.status in (401, 403):
+                    alive = False
+                else:
+                    logger.warning(f"세션 확인 요청 응답 이상: HTTP {response.status}")
+                    alive = None
+            finally:
+                response.dispose()
+        except Exception as e:
+            logger.warning(f"세션 확인 요청 실패: {e}")
+            alive = None
+
+        if alive:
+            self.mark_success()
+        elif alive is False:
+            self.probe_failures += 1
+            self.mark_failure()
+            logger.warning("세션 확인 요청 - 세션 만료")
+        else:
+            self.probe_failures += 1
+        return alive
+
+    def check(self, probe: bool = True) -> bool:
+        """
+        세션 생존 여부 (가능하면 요청 없이 판단)
+
+        Args:
+            probe: False면 확인 요청 없이 판단 (조회 요청이 로그인 페이지를 직접 감지하는 경우,
+                   쿠키가 만료되지 않았으면 True)
+
+        Returns:
+            bool: 세션 유효 여부
+        """
+        if not self.auth.context:
+            return False
+
+        now = time.time()
+        expiry = self.cookie_expiry()
+        self.cookie_expires_at = expiry
+        if expiry is not None and expiry <= now:
+            logger.info("세션 쿠키 만료")
+            self.mark_failure()
+            return False
+
+        if self.last_success_at is not None and now - self.last_success_at < self.trust_seconds:
+            self.trusted_checks += 1
+            return True
+
+        if not probe:
+            return True
+
+        return self.probe()
+
+    def get_stats(self) -> Dict[str, any]:
+        """세션 확인 통계 (헬스 체크용, 브라우저에 접근하지 않음)"""
+        expiry = self.cookie_expires_at
+        return {
+            'last_success_age_seconds': (
+                round(time.time() - self.last_success_at, 1) if self.last_success_at is not None else None
+            ),
+            'cookie_expires_in_seconds': round(expiry - time.time(), 1) if expiry is not None else None,
+            'trusted_checks': self.trusted_checks,
+            'probes': self.probes,
+            'probe_failures': self.probe_failures
+        }
@@ -0,0 +1,222 @@
+"""
+출근 상태 캐시 모듈
+TTL 캐시 + 동시 요청 병합(single-flight)으로 브라우저 새로고침 횟수 최소화
+"""
+import hashlib
+import json
+import threading
+import time
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+
+from . import metrics
+from .metrics import CACHE_REQUESTS, Timings
+
+logger = logging.getLogger(__name__)
+
+
+class StatusTimeoutError(Exception):
+    """기한 내에 새로고침이 끝나지 않았고 반환할 이전 스냅샷도 없음"""
+
+
+def content_hash(status: Mapping[str, any]) -> str:
+    """출근 상태 dict의 내용 해시 (ETag용)"""
+    payload = json.dumps(dict(status), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True)
+class AttendanceSnapshot:
+    """특정 시점의 출근 상태 (불변)"""
+
+    status: Mapping[str, any]
+    fetched_at: float
+    stale: bool = False
+    # 출근 상태 내용 해시 (조회 시각과 무관, 내용이 같으면 같은 값)
+    etag: str = ''
+    # 폴러가 정한 유효 기한 (다음 폴링 예정 시각, None이면 캐시 TTL 기준)
+    expires_at: Optional[float] = None
+
+    @classmethod
+    def from_status(cls, status: Dict[str, any], fetched_at: Optional[float] = None) -> 'AttendanceSnapshot':
+        """파서 결과 dict로 스냅샷 생성"""
+        return cls(
+            status=MappingProxyType(dict(status)),
+            fetched_at=fetched_at if fetched_at is not None else time.time(),
+            etag=content_hash(status)
+        )
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.status.get('error')
+
+    def age(self, now: Optional[float] = None) -> float:
+        """데이터 나이 (초)"""
+        now = now if now is not None else time.time()
+        return max(0.0, now - self.fetched_at)
+
+    def to_dict(self) -> Dict[str, any]:
+        """응답용 dict 복사본 (조회 시각/나이 포함)"""
+        data = dict(self.status)
+        data['fetched_at'] = datetime.fromtimestamp(self.fetched_at).isoformat(timespec='seconds')
+        data['age_seconds'] = round(self.age(), 1)
+        data['stale'] = self.stale
+        return data
+
+
+class _Flight:
+    """진행 중인 새로고침 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.snapshot: Optional[AttendanceSnapshot] = None
+        self.exception: Optional[BaseException] = None
+        # 새로고침 단계별 시간 (기다린 요청마다 합침)
+        self.timings = Timings()
+
+
+class StatusCache:
+    """
+    출근 상태 공유 캐시
+
+    - TTL 이내의 스냅샷은 브라우저 접근 없이 그대로 반환
+      (폴러가 유효 기한을 붙인 스냅샷은 그 기한까지, 단 TTL보다 짧아지지는 않음)
+    - TTL이 지난 상태에서 동시에 들어온 요청은 하나의 새로고침 결과를 공유
+    - 오류 결과는 캐시하지 않음 (대기 중이던 요청에는 그대로 전달)
+    - deadline이 주어지면 새로고침은 백그라운드에서 진행하고, 기한을 넘기면
+      마지막 스냅샷을 stale=True로 반환 (새로고침은 끝까지 진행되어 캐시 갱신)
+    - stale로 반환하는 스냅샷은 오늘 조회했고 max_stale초 이내인 것만 (그 외에는 StatusTimeoutError)
+    """
+
+    def __init__(self, ttl: float = 30.0, max_stale: float = 300.0):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self._snapshot: Optional[AttendanceSnapshot] = None
+        self._flight: Optional[_Flight] = None
+
+    @property
+    def snapshot(self) -> Optional[AttendanceSnapshot]:
+        """마지막으로 성공한 스냅샷"""
+        return self._snapshot
+
+    def is_fresh(self, snapshot: Optional[AttendanceSnapshot]) -> bool:
+        if snapshot is None:
+            return False
+        if snapshot.age() < self.ttl:
+            return True
+        return snapshot.expires_at is not None and time.time() < snapshot.expires_at
+
+    def get(self, loader: Callable[[], Dict[str, any]],
+            deadline: Optional[float] = None) -> AttendanceSnapshot:
+        """
+        캐시된 상태 반환, 만료 시 loader로 새로고침
+
+        Args:
+            loader: 출근 상태 dict를 반환하는 함수 (브라우저 접근)
+            deadline: 새로고침 대기 최대 시간 (초, None이면 끝날 때까지 대기)
+
+        Returns:
+            AttendanceSnapshot: 출근 상태 스냅샷
+
+        Raises:
+            StatusTimeoutError: 기한 초과 + 반환할 수 있는 이전 스냅샷 없음
+        """
+        return self._load(loader, force=False, deadline=deadline)
+
+    def refresh(self, loader: Callable[[], Dict[str, any]],
+                expires_in: Optional[float] = None) -> AttendanceSnapshot:
+        """
+        TTL과 무관하게 새로고침 (백그라운드 폴러용)
+
+        이미 진행 중인 새로고침이 있으면 그 결과를 공유
+
+        Args:
+            loader: 출근 상태 dict를 반환하는 함수 (브라우저 접근)
+            expires_in: 새 스냅샷의 유효 시간 (초, 다음 폴링까지, None이면 캐시 TTL 기준)
+        """
+        return self._load(loader, force=True, expires_in=expires_in)
+
+    def _load(self, loader: Callable[[], Dict[str, any]], force: bool,
+              deadline: Optional[float] = None,
+              expires_in: Optional[float] = None) -> AttendanceSnapshot:
+        with self._lock:
+            snapshot = self._snapshot
+            if not force and self.is_fresh(snapshot):
+                CACHE_REQUESTS.inc('hit')
+                return snapshot
+
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flight = flight
+            CACHE_REQUESTS.inc('miss' if leader else 'coalesced')
+
+        if leader and deadline is None:
+            self._run(flight, loader, expires_in)
+        else:
+            if leader:
+                threading.Thread(
+                    target=self._run, args=(flight, loader, expires_in),
+                    name='StatusRefresh', daemon=True
+                ).start()
+            else:
+                logger.info("진행 중인 새로고침 대기 (요청 병합)")
+
+            if not flight.done.wait(deadline):
+                CACHE_REQUESTS.inc('stale')
+                return self._stale_or_raise(deadline)
+
+        metrics.merge(flight.timings)
+        if flight.exception is not None:
+            raise flight.exception
+        return flight.snapshot
+
+    def _stale_or_raise(self, deadline: float) -> AttendanceSnapshot:
+        """
+        기한 초과 시 마지막 스냅샷을 stale로 반환
+
+        어제 조회한 스냅샷(예: 어제의 퇴근 완료)이나 max_stale보다 오래된 스냅샷은
+        오늘 출근 상태로 오인될 수 있으므로 반환하지 않음
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise StatusTimeoutError(f"출근 상태 조회 시간 초과 ({deadline:.1f}초)")
+
+        if (datetime.fromtimestamp(snapshot.fetched_at).date() != datetime.now().date()
+                or snapshot.age() > self.max_stale):
+            raise StatusTimeoutError(
+                f"출근 상태 조회 시간 초과 ({deadline:.1f}초) - "
+                f"이전 스냅샷이 너무 오래됨 ({snapshot.age():.0f}초 전)"
+            )
+
+        logger.warning(f"새로고침 {deadline:.1f}초 초과 - 이전 스냅샷 반환 ({snapshot.age():.0f}초 전)")
+        return replace(snapshot, stale=True)
+
+    def invalidate(self):
+        """캐시 무효화 - 다음 요청에서 새로고침"""
+        with self._lock:
+            self._snapshot = None
+
+    def _run(self, flight: _Flight, loader: Callable[[], Dict[str, any]],
+             expires_in: Optional[float] = None):
+        """loader 실행 후 결과 공개"""
+        try:
+            with flight.timings.activate():
+                snapshot = AttendanceSnapshot.from_status(loader())
+            if expires_in is not None:
+                snapshot = replace(snapshot, expires_at=snapshot.fetched_at + expires_in)
+            flight.snapshot = snapshot
+        except BaseException as e:
+            flight.exception = e
+            snapshot = None
+        finally:
+            with self._lock:
+                if snapshot is not None and not snapshot.error:
+                    self._snapshot = snapshot
+                self._flight = None
+            flight.done.set()